@@ -1,14 +1,17 @@
 """About endpoint."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from starlette.responses import Response
 
 from app.core.middleware import verify_api_key
+from app.core.response_cache import cached_json_response
 from app.models.schemas import AboutResponse
+from app.services.data_loader import get_seed_version
 from app.services.data_service import get_about
 
 router = APIRouter(prefix="/v1/about", tags=["About"], dependencies=[Depends(verify_api_key)])
 
 
 @router.get("", response_model=AboutResponse)
-async def read_about() -> AboutResponse:
-    return AboutResponse(**get_about())
+async def read_about(request: Request) -> Response:
+    return cached_json_response(request, "about", get_seed_version(), lambda: AboutResponse(**get_about()))
@@ -0,0 +1,18 @@
+"""Administrative endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.core.middleware import verify_admin_key, verify_api_key
+from app.models.schemas import ReloadResponse
+from app.services.reload_service import reload_async
+
+router = APIRouter(prefix="/v1/admin", tags=["Admin"], dependencies=[Depends(verify_api_key), Depends(verify_admin_key)])
+
+
+@router.post("/reload", response_model=ReloadResponse)
+async def reload_data(force: bool = Query(default=False, description="Reload even if files look unchanged")) -> ReloadResponse:
+    try:
+        result = await reload_async(force=force)
+    except ValueError as exc:
+        raise HTTPException(status_code=500, detail={"code": "ERR_INTERNAL", "message": f"Seed reload failed: {exc}"})
+    return ReloadResponse(**result)
@@ -1,15 +1,59 @@
 """Certifications endpoints."""
 
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.responses import Response
 
 from app.core.middleware import verify_api_key
-from app.models.schemas import CertificationsResponse
-from app.services.data_service import get_certifications
+from app.core.response_cache import cached_json_response
+from app.models.schemas import Certification, CertificationsResponse
+from app.services.data_loader import get_seed_version
+from app.services.data_service import get_certification, get_certifications
+from app.services.pagination_service import InvalidListQuery, render_page
 
 router = APIRouter(prefix="/v1/certifications", tags=["Certifications"], dependencies=[Depends(verify_api_key)])
 
 
 @router.get("", response_model=CertificationsResponse)
-async def list_certifications() -> CertificationsResponse:
-    data = get_certifications()
-    return CertificationsResponse(**data)
+async def list_certifications(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated item fields to return, e.g. id,name"),
+) -> Response:
+    """List certifications. With ``limit``, ``cursor`` or ``fields`` the items are paged with ``next_cursor``."""
+    if limit is None and cursor is None and fields is None:
+        return cached_json_response(
+            request, "certifications", get_seed_version(), lambda: CertificationsResponse(**get_certifications())
+        )
+
+    def render_certifications_page() -> CertificationsResponse:
+        data = get_certifications()
+        return render_page(
+            "certifications",
+            data["items"],
+            CertificationsResponse,
+            Certification,
+            cursor,
+            limit,
+            fields,
+            continuing_education=data["continuing_education"],
+        )
+
+    try:
+        return cached_json_response(
+            request, f"certifications:page:{limit}:{cursor}:{fields}", get_seed_version(), render_certifications_page
+        )
+    except InvalidListQuery as exc:
+        raise HTTPException(status_code=400, detail={"code": "ERR_BAD_REQUEST", "message": str(exc)})
+
+
+@router.get("/{certification_id}", response_model=Certification)
+async def get_certification_item(certification_id: str, request: Request) -> Response:
+    certification = get_certification(certification_id)
+    if not certification:
+        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Certification not found."})
+    return cached_json_response(
+        request, f"certifications:item:{certification_id}", get_seed_version(), lambda: Certification(**certification)
+    )
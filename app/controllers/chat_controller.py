@@ -1,15 +1,40 @@
 """Chat/FAQ endpoint."""
 
 from fastapi import APIRouter, Depends
+from starlette.responses import StreamingResponse
 
 from app.core.middleware import verify_api_key
-from app.models.schemas import ChatRequest, ChatResponse
-from app.services.chat_service import answer_question
+from app.core.sse import SSE_HEADERS, sse_stream
+from app.models.schemas import ChatBatchRequest, ChatBatchResponse, ChatRequest, ChatResponse
+from app.services.chat_service import answer_question_async, answer_questions_async, stream_answer
 
 router = APIRouter(prefix="/v1/chat", tags=["Chat"], dependencies=[Depends(verify_api_key)])
 
 
 @router.post("/ask", response_model=ChatResponse)
 async def ask_portfolio_bot(payload: ChatRequest) -> ChatResponse:
-    answer, sources, suggestions, events = answer_question(payload.question, payload.audience or "general")
+    answer, sources, suggestions, events = await answer_question_async(
+        payload.question, payload.audience or "general", payload.mode or "lexical"
+    )
     return ChatResponse(answer=answer, sources=sources, suggestions=suggestions, events=events)
+
+
+@router.post("/ask/batch", response_model=ChatBatchResponse)
+async def ask_portfolio_bot_batch(payload: ChatBatchRequest) -> ChatBatchResponse:
+    """Answer up to 50 questions in one round-trip, scored together in a single index pass."""
+    answers = await answer_questions_async(
+        payload.questions, payload.audience or "general", payload.mode or "lexical"
+    )
+    return ChatBatchResponse(
+        results=[
+            ChatResponse(answer=answer, sources=sources, suggestions=suggestions, events=events)
+            for answer, sources, suggestions, events in answers
+        ]
+    )
+
+
+@router.post("/ask/stream", response_class=StreamingResponse)
+async def ask_portfolio_bot_stream(payload: ChatRequest) -> StreamingResponse:
+    """Server-Sent Events: ``sources``, then ``answer`` deltas, then ``events``, ``suggestions`` and ``done``."""
+    events = stream_answer(payload.question, payload.audience or "general", payload.mode or "lexical")
+    return StreamingResponse(sse_stream(events), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -3,18 +3,23 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.responses import Response
 
 from app.core.middleware import verify_api_key
+from app.core.response_cache import cached_json_response
 from app.models.schemas import ContactResponse, ContactMessageRequest, ContactMessageResponse
 from app.services.contact_service import submit_contact_message
+from app.services.data_loader import get_seed_version
 from app.services.data_service import get_contact_channels
 
 router = APIRouter(prefix="/v1/contact", tags=["Contact"], dependencies=[Depends(verify_api_key)])
 
 
 @router.get("", response_model=ContactResponse)
-async def read_contact() -> ContactResponse:
-    return ContactResponse(channels=get_contact_channels())
+async def read_contact(request: Request) -> Response:
+    return cached_json_response(
+        request, "contact", get_seed_version(), lambda: ContactResponse(channels=get_contact_channels())
+    )
 
 
 @router.post("/message", response_model=ContactMessageResponse)
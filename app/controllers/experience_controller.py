@@ -1,27 +1,64 @@
 """Experience endpoints."""
 
-from fastapi import APIRouter, Depends
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.responses import Response
 
 from app.core.middleware import verify_api_key
+from app.core.response_cache import cached_json_response
 from app.models.schemas import ExperienceResponse, ExperienceItem, Period
-from app.services.data_service import get_experience
+from app.services.data_loader import get_seed_version
+from app.services.data_service import get_experience, get_experience_item
+from app.services.pagination_service import InvalidListQuery, render_page
 
 router = APIRouter(prefix="/v1/experience", tags=["Experience"], dependencies=[Depends(verify_api_key)])
 
 
+def _to_experience_item(exp: Dict[str, Any]) -> ExperienceItem:
+    period = Period(start=exp["period"]["start"], end=exp["period"]["end"])
+    return ExperienceItem(
+        id=exp["id"],
+        organization=exp["organization"],
+        role=exp["role"],
+        period=period,
+        location=exp["location"],
+        highlights=exp["highlights"],
+    )
+
+
+def _render_experience() -> ExperienceResponse:
+    return ExperienceResponse(items=[_to_experience_item(exp) for exp in get_experience()])
+
+
 @router.get("", response_model=ExperienceResponse)
-async def list_experience() -> ExperienceResponse:
-    items = []
-    for exp in get_experience():
-        period = Period(start=exp["period"]["start"], end=exp["period"]["end"])
-        items.append(
-            ExperienceItem(
-                id=exp["id"],
-                organization=exp["organization"],
-                role=exp["role"],
-                period=period,
-                location=exp["location"],
-                highlights=exp["highlights"],
-            )
+async def list_experience(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated item fields to return, e.g. id,organization,role"),
+) -> Response:
+    """Career timeline. With ``limit``, ``cursor`` or ``fields`` the response is a page with ``next_cursor``."""
+    if limit is None and cursor is None and fields is None:
+        return cached_json_response(request, "experience", get_seed_version(), _render_experience)
+    try:
+        return cached_json_response(
+            request,
+            f"experience:page:{limit}:{cursor}:{fields}",
+            get_seed_version(),
+            lambda: render_page(
+                "experience", get_experience(), ExperienceResponse, ExperienceItem, cursor, limit, fields
+            ),
         )
-    return ExperienceResponse(items=items)
+    except InvalidListQuery as exc:
+        raise HTTPException(status_code=400, detail={"code": "ERR_BAD_REQUEST", "message": str(exc)})
+
+
+@router.get("/{experience_id}", response_model=ExperienceItem)
+async def get_experience_entry(experience_id: str, request: Request) -> Response:
+    exp = get_experience_item(experience_id)
+    if not exp:
+        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Experience item not found."})
+    return cached_json_response(
+        request, f"experience:item:{experience_id}", get_seed_version(), lambda: _to_experience_item(exp)
+    )
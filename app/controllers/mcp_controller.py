@@ -1,71 +1,212 @@
 """MCP forwarding endpoints for n8n integrations."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from typing import Any, Dict
+import asyncio
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.responses import Response
+from typing import Any, AsyncIterator, Dict, List, Optional
 import json as _json
 
 from app.core.middleware import verify_api_key
 from app.core.config import get_settings
+from app.core.log_pipeline import get_log_pipeline
+from app.core.sse import SSE_HEADERS, format_sse, iter_sse
 from app.models.schemas import MCPRequest, MCPResponse
-from app.services.mcp_service import forward_mcp_request, forward_jsonrpc_to_n8n
+from app.services.mcp_service import forward_mcp_request, forward_jsonrpc_to_n8n, get_tool_manifest
+from app.services.mcp_session_service import (
+    McpSession,
+    get_session_manager,
+    negotiate_protocol_version,
+    progress_notification,
+    session_events,
+)
 
 router = APIRouter(prefix="/v1/mcp", tags=["MCP"], dependencies=[Depends(verify_api_key)])
 
+SESSION_HEADER = "Mcp-Session-Id"
 
-@router.post("/execute")
-async def execute_mcp(payload: Dict[str, Any], request: Request):
-    print("Received MCP execute request:", payload)
-    correlation_id = getattr(request.state, "correlation_id", None)
-    settings = get_settings()
 
-    # Detect JSON-RPC 2.0 envelope
-    is_jsonrpc = isinstance(payload, dict) and "jsonrpc" in payload and "method" in payload
+def _is_jsonrpc(message: Any) -> bool:
+    return isinstance(message, dict) and "jsonrpc" in message and "method" in message
+
+
+def _invalid_request(req_id: Any = None, message: str = "Invalid Request") -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": -32600, "message": message}}
 
-    if is_jsonrpc:
-        ok, forwarded, upstream_json, error = await forward_jsonrpc_to_n8n({**payload, "correlation_id": correlation_id})
-        if not ok:
+
+async def _handle_jsonrpc(payload: Dict[str, Any], correlation_id: Optional[str]) -> Dict[str, Any]:
+    """Run one JSON-RPC request (locally or via n8n) and normalise the response envelope."""
+    settings = get_settings()
+    ok, forwarded, upstream_json, error = await forward_jsonrpc_to_n8n({**payload, "correlation_id": correlation_id})
+    if not ok:
+        return {
+            "jsonrpc": "2.0",
+            "id": payload.get("id"),
+            "error": {
+                "code": -32000,
+                "message": error or "Upstream error.",
+                "data": {"correlation_id": correlation_id},
+            },
+        }
+    # Ensure metadata is included when we are in local fallback
+    if not forwarded and isinstance(upstream_json, dict) and upstream_json.get("result") is not None:
+        result = upstream_json.get("result")
+        if isinstance(result, dict):
+            result.setdefault("meta", {})
+            result["meta"].update({
+                "webhook_configured": bool(settings.n8n_mcp_webhook),
+                "correlation_id": correlation_id,
+            })
+    # If forwarded, normalize to MCP content when upstream isn't MCP-shaped
+    if forwarded and isinstance(upstream_json, dict):
+        if "jsonrpc" not in upstream_json:
+            # Wrap plain JSON into JSON-RPC content array
+            text_content = _json.dumps(upstream_json, ensure_ascii=False) if not isinstance(upstream_json, str) else upstream_json
             return {
                 "jsonrpc": "2.0",
                 "id": payload.get("id"),
-                "error": {
-                    "code": -32000,
-                    "message": error or "Upstream error.",
-                    "data": {"correlation_id": correlation_id},
+                "result": {
+                    "content": [{"type": "text", "text": text_content}],
+                    "isError": False,
                 },
             }
-        # Ensure metadata is included when we are in local fallback
-        if not forwarded and isinstance(upstream_json, dict) and upstream_json.get("result") is not None:
-            result = upstream_json.get("result")
-            if isinstance(result, dict):
-                result.setdefault("meta", {})
-                result["meta"].update({
-                    "webhook_configured": bool(settings.n8n_mcp_webhook),
-                    "correlation_id": correlation_id,
-                })
-        # If forwarded, normalize to MCP content when upstream isn't MCP-shaped
-        if forwarded and isinstance(upstream_json, dict):
-            if "jsonrpc" not in upstream_json:
-                # Wrap plain JSON into JSON-RPC content array
-                text_content = _json.dumps(upstream_json, ensure_ascii=False) if not isinstance(upstream_json, str) else upstream_json
-                return {
-                    "jsonrpc": "2.0",
-                    "id": payload.get("id"),
-                    "result": {
-                        "content": [{"type": "text", "text": text_content}],
-                        "isError": False,
-                    },
+        # Has jsonrpc but missing content array in result
+        if upstream_json.get("error") is None:
+            res = upstream_json.get("result")
+            if not isinstance(res, dict) or "content" not in res:
+                text_content = _json.dumps(res, ensure_ascii=False)
+                upstream_json["result"] = {
+                    "content": [{"type": "text", "text": text_content}],
+                    "isError": False,
                 }
-            # Has jsonrpc but missing content array in result
-            if upstream_json.get("error") is None:
-                res = upstream_json.get("result")
-                if not isinstance(res, dict) or "content" not in res:
-                    text_content = _json.dumps(res, ensure_ascii=False)
-                    upstream_json["result"] = {
-                        "content": [{"type": "text", "text": text_content}],
-                        "isError": False,
-                    }
-            return upstream_json
         return upstream_json
+    return upstream_json
+
+
+def _params(message: Dict[str, Any]) -> Dict[str, Any]:
+    params = message.get("params")
+    return params if isinstance(params, dict) else {}
+
+
+def _accepts_sse(request: Request) -> bool:
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+def _session_for(request: Request) -> Optional[McpSession]:
+    """Session named by the ``Mcp-Session-Id`` header; None without one, 404 when it is unknown or expired."""
+    session_id = request.headers.get(SESSION_HEADER)
+    if not session_id:
+        return None
+    session = get_session_manager().get(session_id)
+    if session is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "ERR_NOT_FOUND", "message": "Unknown or expired MCP session; send initialize again."},
+        )
+    return session
+
+
+def _track(session: Optional[McpSession], message: Dict[str, Any], response: Optional[Dict[str, Any]]) -> None:
+    if session is None:
+        return
+    # A finished call is activity too, so a slow one doesn't leave the session looking idle since it started
+    get_session_manager().get(session.id)
+    # Remember which tool list the client holds so it can be told when it goes stale
+    if message["method"] == "tools/list" and response and "result" in response:
+        session.tools_version = get_tool_manifest().current.version
+
+
+def _content_size(response: Dict[str, Any]) -> int:
+    result = response.get("result")
+    if not isinstance(result, dict) or not isinstance(result.get("content"), list):
+        return 0
+    return sum(len(item.get("text") or "") for item in result["content"] if isinstance(item, dict))
+
+
+def _event_stream(body: Any) -> StreamingResponse:
+    return StreamingResponse(body, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+async def _call_with_progress(
+    payload: Dict[str, Any], correlation_id: Optional[str], token: Any, session: Optional[McpSession]
+) -> AsyncIterator[bytes]:
+    yield format_sse("message", progress_notification(token, 0, 1, "started"))
+    response = await _handle_jsonrpc(payload, correlation_id)
+    _track(session, payload, response)
+    yield format_sse("message", progress_notification(token, 1, 1, "completed"))
+    for chunk in iter_sse("message", response):
+        yield chunk
+
+
+async def _handle_batch(messages: List[Any], correlation_id: Optional[str], session: Optional[McpSession] = None) -> Any:
+    """JSON-RPC batch: run entries concurrently (capped), drop notification replies, keep ids."""
+    settings = get_settings()
+    if not messages or len(messages) > settings.mcp_max_batch_size:
+        return _invalid_request()
+    semaphore = asyncio.Semaphore(settings.mcp_batch_concurrency)
+
+    async def run(message: Any) -> Optional[Dict[str, Any]]:
+        if not _is_jsonrpc(message):
+            return _invalid_request()
+        if message["method"] == "initialize":
+            # The session id travels in a response header, which a batch can't give each entry
+            return _invalid_request(message.get("id"), "initialize must not be sent in a batch")
+        async with semaphore:
+            try:
+                response = await _handle_jsonrpc(message, correlation_id)
+            except Exception as exc:  # one failing entry must not sink the batch
+                response = {"jsonrpc": "2.0", "id": message.get("id"), "error": {"code": -32603, "message": str(exc)}}
+        _track(session, message, response)
+        return response if "id" in message else None
+
+    responses = [response for response in await asyncio.gather(*(run(message) for message in messages)) if response]
+    # A batch of only notifications gets no body at all
+    return responses or Response(status_code=202)
+
+
+@router.post("/execute")
+async def execute_mcp(request: Request, payload: Any = Body(...)):
+    correlation_id = getattr(request.state, "correlation_id", None)
+    get_log_pipeline().log_payload("mcp_execute", payload, correlation_id=correlation_id)
+    settings = get_settings()
+    session = _session_for(request)
+
+    if isinstance(payload, list):
+        return await _handle_batch(payload, correlation_id, session)
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=422, detail={"code": "ERR_BAD_REQUEST", "message": "Invalid MCP payload."})
+
+    # Detect JSON-RPC 2.0 envelope
+    if _is_jsonrpc(payload):
+        method = payload["method"]
+        if method == "tools/list" and "id" in payload and not settings.n8n_mcp_webhook:
+            # Session-start hot path: the tool list is already serialised, only id and meta are encoded
+            meta = {"webhook_configured": False, "correlation_id": correlation_id}
+            manifest = get_tool_manifest().current
+            if session is not None:
+                session.tools_version = manifest.version
+            return Response(manifest.render_list(payload["id"], meta), media_type="application/json")
+        progress_token = (_params(payload).get("_meta") or {}).get("progressToken")
+        if method == "tools/call" and "id" in payload and progress_token is not None and _accepts_sse(request):
+            return _event_stream(_call_with_progress(payload, correlation_id, progress_token, session))
+
+        response = await _handle_jsonrpc(payload, correlation_id)
+        # Notifications (no id) are processed but never answered
+        if "id" not in payload:
+            return Response(status_code=202)
+        _track(session, payload, response)
+        if method == "initialize" and isinstance(response.get("result"), dict):
+            params = _params(payload)
+            session = get_session_manager().create(
+                response["result"].get("protocolVersion") or negotiate_protocol_version(None),
+                params.get("clientInfo") if isinstance(params.get("clientInfo"), dict) else {},
+                params.get("capabilities") if isinstance(params.get("capabilities"), dict) else {},
+            )
+            return JSONResponse(response, headers={SESSION_HEADER: session.id})
+        if method == "tools/call" and _accepts_sse(request) and _content_size(response) >= settings.mcp_stream_min_bytes:
+            # Large results go out as one SSE message written in chunks, encoded incrementally
+            return _event_stream(iter_sse("message", response))
+        return response
 
     # Fallback to the original simple schema (tool/params/context)
     try:
@@ -90,3 +231,32 @@ async def execute_mcp(payload: Dict[str, Any], request: Request):
         "correlation_id": correlation_id,
     }
     return MCPResponse(forwarded=forwarded, result=result or {}, meta=meta)
+
+
+@router.get("/execute")
+async def open_mcp_stream(request: Request):
+    """Server -> client SSE stream for a session (Streamable HTTP); carries tools/list_changed notifications."""
+    if not _accepts_sse(request):
+        raise HTTPException(
+            status_code=405,
+            detail={"code": "ERR_METHOD_NOT_ALLOWED", "message": "GET requires Accept: text/event-stream."},
+        )
+    session = _session_for(request)
+    if session is None:
+        raise HTTPException(
+            status_code=400, detail={"code": "ERR_BAD_REQUEST", "message": f"{SESSION_HEADER} header required."}
+        )
+
+    async def frames() -> AsyncIterator[bytes]:
+        async for message in session_events(get_session_manager(), session, get_tool_manifest()):
+            yield format_sse("message", message) if message is not None else b": keepalive\n\n"
+
+    return _event_stream(frames())
+
+
+@router.delete("/execute", status_code=204)
+async def close_mcp_session(request: Request) -> Response:
+    """End a session explicitly instead of waiting for idle expiry."""
+    if not get_session_manager().close(request.headers.get(SESSION_HEADER)):
+        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Unknown MCP session."})
+    return Response(status_code=204)
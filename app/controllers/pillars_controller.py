@@ -1,14 +1,27 @@
 """Pillars endpoints."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.responses import Response
 
 from app.core.middleware import verify_api_key
-from app.models.schemas import PillarsResponse
-from app.services.data_service import get_pillars
+from app.core.response_cache import cached_json_response
+from app.models.schemas import Pillar, PillarsResponse
+from app.services.data_loader import get_seed_version
+from app.services.data_service import get_pillar, get_pillars
 
 router = APIRouter(prefix="/v1/pillars", tags=["Pillars"], dependencies=[Depends(verify_api_key)])
 
 
 @router.get("", response_model=PillarsResponse)
-async def list_pillars() -> PillarsResponse:
-    return PillarsResponse(items=[pillar for pillar in get_pillars()])
+async def list_pillars(request: Request) -> Response:
+    return cached_json_response(
+        request, "pillars", get_seed_version(), lambda: PillarsResponse(items=[pillar for pillar in get_pillars()])
+    )
+
+
+@router.get("/{pillar_id}", response_model=Pillar)
+async def get_pillar_item(pillar_id: str, request: Request) -> Response:
+    pillar = get_pillar(pillar_id)
+    if not pillar:
+        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Pillar not found."})
+    return cached_json_response(request, f"pillars:item:{pillar_id}", get_seed_version(), lambda: Pillar(**pillar))
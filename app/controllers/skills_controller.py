@@ -1,15 +1,48 @@
 """Skills endpoints."""
 
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.responses import Response
 
 from app.core.middleware import verify_api_key
+from app.core.response_cache import cached_json_response
 from app.models.schemas import SkillsResponse, SkillGroup
-from app.services.data_service import get_skills
+from app.services.data_loader import get_seed_version
+from app.services.data_service import get_skill_group, get_skills
+from app.services.pagination_service import InvalidListQuery, render_page
 
 router = APIRouter(prefix="/v1/skills", tags=["Skills"], dependencies=[Depends(verify_api_key)])
 
 
 @router.get("", response_model=SkillsResponse)
-async def list_skills() -> SkillsResponse:
-    items = [SkillGroup(**group) for group in get_skills()]
-    return SkillsResponse(items=items)
+async def list_skills(
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated item fields to return, e.g. id,title"),
+) -> Response:
+    """List skill groups. With ``limit``, ``cursor`` or ``fields`` the response is a page with ``next_cursor``."""
+    def render() -> SkillsResponse:
+        items = [SkillGroup(**group) for group in get_skills()]
+        return SkillsResponse(items=items)
+
+    if limit is None and cursor is None and fields is None:
+        return cached_json_response(request, "skills", get_seed_version(), render)
+    try:
+        return cached_json_response(
+            request,
+            f"skills:page:{limit}:{cursor}:{fields}",
+            get_seed_version(),
+            lambda: render_page("skills", get_skills(), SkillsResponse, SkillGroup, cursor, limit, fields),
+        )
+    except InvalidListQuery as exc:
+        raise HTTPException(status_code=400, detail={"code": "ERR_BAD_REQUEST", "message": str(exc)})
+
+
+@router.get("/{group_id}", response_model=SkillGroup)
+async def get_skill(group_id: str, request: Request) -> Response:
+    group = get_skill_group(group_id)
+    if not group:
+        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Skill group not found."})
+    return cached_json_response(request, f"skills:item:{group_id}", get_seed_version(), lambda: SkillGroup(**group))
@@ -2,11 +2,21 @@
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
 
 from app.core.config import get_settings
+from app.core.log_pipeline import get_log_pipeline
+from app.core.metrics import get_metrics
 from app.core.middleware import verify_api_key
+from app.core.response_cache import get_response_cache
 from app.models.schemas import IndexResponse, IndexResource, MetaResponse
+from app.services.chat_service import get_answer_cache
+from app.services.content_service import get_content_store
+from app.services.data_loader import get_snapshot
+from app.services.mcp_service import get_tool_manifest
+from app.services.mcp_session_service import get_session_manager
+from app.services.rag_service import get_rag_client
 
 router = APIRouter()
 
@@ -16,10 +26,41 @@ async def healthz() -> dict:
     return {"status": "ok", "timestamp": datetime.now(tz=timezone.utc).isoformat()}
 
 
+@router.get("/metrics", tags=["System"], response_class=PlainTextResponse, dependencies=[Depends(verify_api_key)])
+async def metrics(request: Request) -> PlainTextResponse:
+    gauges = {}
+    limiter = getattr(request.app.state, "rate_limiter", None)
+    if limiter is not None:
+        for key, value in limiter.stats().items():
+            if isinstance(value, (int, float)):
+                gauges[f"rate_limit_{key}"] = (f"Rate limiter {key}.", value)
+    for key, value in get_log_pipeline().stats().items():
+        gauges[f"log_pipeline_{key}"] = (f"Log pipeline {key} lines.", value)
+    for key, value in get_response_cache().stats().items():
+        gauges[f"response_cache_{key}"] = (f"Response cache {key}.", value)
+    for key, value in get_content_store().stats().items():
+        gauges[f"content_store_{key}"] = (f"Content store {key}.", value)
+    for key, value in get_answer_cache().stats().items():
+        gauges[f"chat_answer_cache_{key}"] = (f"Chat answer cache {key}.", value)
+    for key, value in get_rag_client().stats().items():
+        gauges[f"rag_client_{key}"] = (f"RAG backend client {key}.", value)
+    for key, value in get_tool_manifest().stats().items():
+        gauges[f"mcp_manifest_{key}"] = (f"MCP tool manifest {key}.", value)
+    for key, value in get_session_manager().stats().items():
+        gauges[f"mcp_sessions_{key}"] = (f"MCP session store {key}.", value)
+    return PlainTextResponse(get_metrics().render(gauges), media_type="text/plain; version=0.0.4")
+
+
 @router.get("/v1/meta", response_model=MetaResponse, tags=["System"], dependencies=[Depends(verify_api_key)])
 async def meta() -> MetaResponse:
     settings = get_settings()
-    return MetaResponse(version=settings.app_version, environment=settings.environment)
+    snapshot = get_snapshot()
+    return MetaResponse(
+        version=settings.app_version,
+        environment=settings.environment,
+        data_version=snapshot.version,
+        data_digest=snapshot.digest,
+    )
 
 
 @router.get("/v1", response_model=IndexResponse, tags=["System"], dependencies=[Depends(verify_api_key)])
@@ -27,16 +68,25 @@ async def index() -> IndexResponse:
     resources = [
         IndexResource(name="about", method="GET", path="/v1/about", description="Profile and headline"),
         IndexResource(name="pillars", method="GET", path="/v1/pillars", description="Capability pillars"),
+        IndexResource(name="pillar", method="GET", path="/v1/pillars/{id}", description="Single capability pillar"),
         IndexResource(name="work", method="GET", path="/v1/work", description="Case studies"),
+        IndexResource(name="work_sections", method="GET", path="/v1/work/{slug}/content/sections", description="Case-study content by section"),
         IndexResource(name="experience", method="GET", path="/v1/experience", description="Career timeline"),
+        IndexResource(name="experience_item", method="GET", path="/v1/experience/{id}", description="Single role"),
         IndexResource(name="skills", method="GET", path="/v1/skills", description="Skill groups"),
+        IndexResource(name="skill_group", method="GET", path="/v1/skills/{id}", description="Single skill group"),
         IndexResource(name="certifications", method="GET", path="/v1/certifications", description="Credentials"),
+        IndexResource(name="certification", method="GET", path="/v1/certifications/{id}", description="Single credential"),
         IndexResource(name="contact", method="GET", path="/v1/contact", description="Contact channels"),
         IndexResource(name="contact_message", method="POST", path="/v1/contact/message", description="Submit contact message"),
         IndexResource(name="availability", method="GET", path="/v1/availability", description="Free/busy windows"),
         IndexResource(name="availability_hold", method="POST", path="/v1/availability/hold", description="Create temporary hold"),
         IndexResource(name="chat", method="POST", path="/v1/chat/ask", description="Ask portfolio assistant"),
+        IndexResource(name="chat_batch", method="POST", path="/v1/chat/ask/batch", description="Ask several questions in one request"),
+        IndexResource(name="chat_stream", method="POST", path="/v1/chat/ask/stream", description="Ask portfolio assistant, streamed over SSE"),
         IndexResource(name="time_now", method="GET", path="/v1/time/now", description="Current date/time in GMT+7 (Asia/Bangkok)"),
+        IndexResource(name="admin_reload", method="POST", path="/v1/admin/reload", description="Reload seed data and content"),
+        IndexResource(name="metrics", method="GET", path="/metrics", description="Prometheus metrics"),
         IndexResource(name="mcp_execute", method="POST", path="/v1/mcp/execute", description="Forward MCP request to n8n or echo"),
     ]
     return IndexResponse(resources=resources)
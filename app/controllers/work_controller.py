@@ -1,33 +1,109 @@
 """Work / case study endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+from email.utils import format_datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.responses import Response, StreamingResponse
 
 from app.core.middleware import verify_api_key
-from app.models.schemas import WorkListResponse, WorkItem, WorkContentResponse
+from app.core.response_cache import cached_json_response
+from app.models.schemas import WorkListResponse, WorkItem, WorkContentResponse, WorkContentSectionsResponse
+from app.services.data_loader import get_seed_version
 from app.services.data_service import get_work_item, get_work_items
-from app.services.content_service import get_work_content as _get_work_content
+from app.services.content_service import SectionNotFoundError, load_content_entry, section_table
+from app.services.pagination_service import InvalidListQuery, render_page
 
 router = APIRouter(prefix="/v1/work", tags=["Work"], dependencies=[Depends(verify_api_key)])
 
+STREAM_CHUNK_CHARS = 16 * 1024
+
+CONTENT_NOT_FOUND = {"code": "ERR_NOT_FOUND", "message": "Content not found."}
+
+
+async def _stream_content_json(slug: str, content_format: str, body: str) -> AsyncIterator[bytes]:
+    """Emit the WorkContentResponse JSON piecewise, escaping ``body`` one chunk at a time."""
+    yield f'{{"slug":{json.dumps(slug, ensure_ascii=False)},"format":"{content_format}","content":"'.encode("utf-8")
+    for start in range(0, len(body), STREAM_CHUNK_CHARS):
+        yield json.dumps(body[start:start + STREAM_CHUNK_CHARS], ensure_ascii=False)[1:-1].encode("utf-8")
+    yield b'"}'
+
 
 @router.get("", response_model=WorkListResponse)
-async def list_work(limit: int = Query(default=None, ge=1, le=20)) -> WorkListResponse:
-    items = [WorkItem(**item) for item in get_work_items(limit=limit)]
-    return WorkListResponse(items=items)
+async def list_work(
+    request: Request,
+    limit: int = Query(default=None, ge=1, le=20),
+    cursor: Optional[str] = Query(default=None, description="Opaque cursor from a previous page's next_cursor"),
+    fields: Optional[str] = Query(default=None, description="Comma-separated item fields to return, e.g. slug,title"),
+) -> Response:
+    """List case studies. With ``limit``, ``cursor`` or ``fields`` the response is a page with ``next_cursor``."""
+    if limit is None and cursor is None and fields is None:
+        return cached_json_response(
+            request,
+            "work:list",
+            get_seed_version(),
+            lambda: WorkListResponse(items=[WorkItem(**item) for item in get_work_items()]),
+        )
+    try:
+        return cached_json_response(
+            request,
+            f"work:page:{limit}:{cursor}:{fields}",
+            get_seed_version(),
+            lambda: render_page("work", get_work_items(), WorkListResponse, WorkItem, cursor, limit, fields),
+        )
+    except InvalidListQuery as exc:
+        raise HTTPException(status_code=400, detail={"code": "ERR_BAD_REQUEST", "message": str(exc)})
 
 
 @router.get("/{slug}", response_model=WorkItem)
-async def get_work(slug: str) -> WorkItem:
+async def get_work(slug: str, request: Request) -> Response:
     item = get_work_item(slug)
     if not item:
         raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Work item not found."})
-    return WorkItem(**item)
+    return cached_json_response(request, f"work:item:{slug}", get_seed_version(), lambda: WorkItem(**item))
 
 
 @router.get("/{slug}/content", response_model=WorkContentResponse)
-async def get_work_longform(slug: str) -> WorkContentResponse:
+async def get_work_longform(
+    request: Request,
+    slug: str,
+    format: str = Query(default="markdown", pattern="^(markdown|html)$", description="markdown (raw) or html (rendered)"),
+    section: Optional[str] = Query(default=None, description="Return only this section (ids from /content/sections)"),
+    stream: bool = Query(default=False, description="Stream the JSON body in chunks instead of buffering it"),
+) -> Response:
+    try:
+        entry, body = await load_content_entry(slug, format, section)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=CONTENT_NOT_FOUND)
+    except SectionNotFoundError:
+        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Section not found."})
+    if stream:
+        return StreamingResponse(
+            _stream_content_json(entry.slug, format, body),
+            media_type="application/json",
+            headers={"Last-Modified": format_datetime(entry.last_modified, usegmt=True)},
+        )
+    return cached_json_response(
+        request,
+        f"work:content:{format}:{slug}:{section or ''}",
+        entry.etag,
+        lambda: WorkContentResponse(slug=entry.slug, format=format, content=body),
+        last_modified=entry.last_modified,
+    )
+
+
+@router.get("/{slug}/content/sections", response_model=WorkContentSectionsResponse)
+async def get_work_content_sections(request: Request, slug: str) -> Response:
+    """Table of contents of a case study's long-form content."""
     try:
-        data = _get_work_content(slug)
+        entry, _ = await load_content_entry(slug)
     except FileNotFoundError:
-        raise HTTPException(status_code=404, detail={"code": "ERR_NOT_FOUND", "message": "Content not found."})
-    return WorkContentResponse(**data)
+        raise HTTPException(status_code=404, detail=CONTENT_NOT_FOUND)
+    return cached_json_response(
+        request,
+        f"work:sections:{slug}",
+        entry.etag,
+        lambda: WorkContentSectionsResponse(slug=entry.slug, sections=section_table(entry)),
+        last_modified=entry.last_modified,
+    )
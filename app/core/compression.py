@@ -0,0 +1,154 @@
+"""Response compression negotiated from ``Accept-Encoding``.
+
+Only standard-library codecs are offered (``gzip`` and ``deflate`` via ``zlib``).
+Static payloads are compressed once per snapshot by the response cache (see
+``app.core.response_cache``); ``CompressionMiddleware`` handles everything else,
+compressing single-message bodies in one go and streamed bodies chunk by chunk.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Encoding -> zlib wbits; listed in server preference order
+WBITS: Dict[str, int] = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "application/problem+json")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported coding from an ``Accept-Encoding`` header (None means identity)."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            weights[name] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in WBITS:
+        quality = weights.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int = 6) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, WBITS[encoding])
+    return compressor.compress(body) + compressor.flush()
+
+
+def variant_etag(etag: str, encoding: Optional[str]) -> str:
+    """Strong ETag for an encoded variant: each representation needs its own validator."""
+    if encoding is None or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def vary_on_encoding(headers: MutableHeaders) -> None:
+    """Merge ``Accept-Encoding`` into ``Vary`` unless it (or ``*``) is already listed."""
+    listed = {token.strip().lower() for token in headers.get("vary", "").split(",")}
+    if not listed & {"accept-encoding", "*"}:
+        headers.add_vary_header("Accept-Encoding")
+
+
+class CompressionMiddleware:
+    """Compress dynamic responses at or above ``minimum_size`` bytes.
+
+    Responses that already carry ``Content-Encoding`` (pre-compressed cache
+    variants) pass through untouched. Streamed bodies are compressed
+    incrementally with a sync flush per chunk, so event streams still arrive
+    promptly. Every compressible response gets ``Vary: Accept-Encoding``,
+    whichever coding was chosen, so shared caches keep the variants apart.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, level: int = 6) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+
+            async def send_identity(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(raw=message["headers"])
+                    if is_compressible(headers.get("content-type")):
+                        vary_on_encoding(headers)
+                await send(message)
+
+            await self.app(scope, receive, send_identity)
+            return
+
+        start: Optional[Message] = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if passthrough or message["type"] not in ("http.response.start", "http.response.body"):
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                chunk = compressor.compress(body)
+                chunk += compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            assert start is not None
+            headers = MutableHeaders(raw=start["headers"])
+            if is_compressible(headers.get("content-type")):
+                vary_on_encoding(headers)
+            if (
+                "content-encoding" in headers
+                or start["status"] < 200
+                or start["status"] in (204, 304)
+                or not is_compressible(headers.get("content-type"))
+                or (not more_body and len(body) < self.minimum_size)
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            headers["Content-Encoding"] = encoding
+            if not more_body:
+                compressed = compress(body, encoding, self.level)
+                headers["Content-Length"] = str(len(compressed))
+                await send(start)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+            del headers["Content-Length"]
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, WBITS[encoding])
+            chunk = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            await send(start)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+        await self.app(scope, receive, send_wrapper)
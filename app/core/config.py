@@ -17,6 +17,8 @@ class Settings(BaseSettings):
 
     # Provide a safe dev default; override via API_KEY env var in other environments
     api_key: str = Field(default="dev", alias="API_KEY")
+    # Separate key (x-admin-key header) for /v1/admin; admin endpoints are disabled while unset
+    admin_api_key: Optional[str] = Field(default=None, alias="ADMIN_API_KEY")
     allowed_origins: List[str] = Field(default_factory=lambda: ["https://watcharapon.dev"], alias="ALLOWED_ORIGINS")
 
     n8n_contact_webhook: Optional[str] = Field(default=None, alias="N8N_WEBHOOK_URL")
@@ -25,12 +27,65 @@ class Settings(BaseSettings):
     # Generic MCP forwarding webhook (optional)
     n8n_mcp_webhook: Optional[str] = Field(default=None, alias="N8N_MCP_WEBHOOK_URL")
     n8n_mcp_timeout_seconds: int = Field(default=15)
+    # JSON-RPC batches on /v1/mcp/execute: max entries per batch and how many run at once
+    mcp_max_batch_size: int = Field(default=50)
+    mcp_batch_concurrency: int = Field(default=8)
+    # Streamable HTTP sessions (Mcp-Session-Id): idle expiry, sweep cadence and count / estimated-memory ceilings
+    mcp_session_ttl_seconds: float = Field(default=1800.0)
+    mcp_session_sweep_interval_seconds: float = Field(default=60.0)
+    mcp_session_max_entries: int = Field(default=1000)
+    mcp_session_max_bytes: int = Field(default=4 * 1024 * 1024)
+    # tools/call results at least this large are streamed over SSE when the client accepts it
+    mcp_stream_min_bytes: int = Field(default=64 * 1024)
 
     calendar_source_url: Optional[str] = Field(default=None, alias="CALENDAR_SOURCE_URL")
 
     rag_endpoint: Optional[str] = Field(default=None, alias="RAG_ENDPOINT")
+    # Deadline per chat retrieval; slower upstream answers fall back to the local index
+    rag_timeout_seconds: float = Field(default=1.5)
+    # Deadline for a whole /v1/chat/ask/batch; questions still waiting on the upstream are answered locally
+    rag_batch_timeout_seconds: float = Field(default=3.0)
+    rag_max_concurrency: int = Field(default=16)
+    # Send a second (hedged) request when the first is still pending after this long; 0 disables
+    rag_hedge_after_seconds: float = Field(default=0.0)
 
     rate_limit_per_minute: int = Field(default=60)
+    # Ceiling on tracked client IPs; least recently seen clients are evicted first
+    rate_limit_max_clients: int = Field(default=10000)
+    rate_limit_sweep_interval_seconds: int = Field(default=30)
+    # memory: per worker process; shared: mmap table shared by all workers on the host; redis: across hosts
+    rate_limit_backend: str = Field(default="memory")
+    rate_limit_shared_path: Optional[str] = Field(default=None)
+    rate_limit_redis_url: Optional[str] = Field(default=None, alias="RATE_LIMIT_REDIS_URL")
+    # Connections the redis backend keeps per worker, so concurrent requests don't queue on one round-trip
+    rate_limit_redis_pool_size: int = Field(default=8)
+
+    # Poll data/seed.json and data/content/work/*.md for changes; 0 disables the watcher
+    seed_reload_interval_seconds: float = Field(default=5.0)
+
+    # Long-form markdown cache; entries are re-stat'ed at most this often (the reload watcher invalidates sooner)
+    content_cache_max_entries: int = Field(default=128)
+    content_revalidate_seconds: float = Field(default=30.0)
+
+    # Chat retrieval cache (normalised question + audience + mode), invalidated on corpus changes
+    chat_cache_max_entries: int = Field(default=512)
+    chat_cache_ttl_seconds: float = Field(default=300.0)
+
+    # Async JSON-lines log pipeline
+    log_queue_size: int = Field(default=10000)
+    log_batch_size: int = Field(default=256)
+    log_flush_interval_seconds: float = Field(default=0.5)
+    # Fraction of successful (<400) requests to log; errors are always logged
+    log_success_sample_rate: float = Field(default=1.0)
+    log_max_payload_chars: int = Field(default=2000)
+
+    # Responses smaller than this are sent uncompressed; set compression_enabled False to turn it off
+    compression_enabled: bool = Field(default=True)
+    compression_min_bytes: int = Field(default=1024)
+    compression_level: int = Field(default=6)
+
+    # Single pure-ASGI request pipeline; set False to fall back to the BaseHTTPMiddleware stack
+    fused_middleware: bool = Field(default=True)
 
     @field_validator("allowed_origins", mode="before")
     @classmethod
@@ -1,25 +1,38 @@
 """CORS configuration helpers."""
 
-from typing import Callable
+from typing import Callable, Optional
 
 from fastapi import Request
 from starlette.responses import JSONResponse
 
-ALLOWED_POST_PATHS = {"/v1/contact/message", "/v1/chat/ask", "/v1/mcp/execute"}
+ALLOWED_POST_PATHS = {
+    "/v1/contact/message",
+    "/v1/chat/ask",
+    "/v1/chat/ask/batch",
+    "/v1/chat/ask/stream",
+    "/v1/mcp/execute",
+}
+
+
+def is_blocked_cross_origin_post(method: str, path: str, origin: Optional[str]) -> bool:
+    """Return True when a cross-origin POST targets a path outside the whitelist."""
+    return method == "POST" and bool(origin) and path not in ALLOWED_POST_PATHS
+
+
+def cross_origin_post_response(correlation_id: Optional[str]) -> JSONResponse:
+    return JSONResponse(
+        status_code=405,
+        content={
+            "error": {
+                "code": "ERR_BAD_REQUEST",
+                "message": "Cross-origin POST not permitted for this endpoint.",
+                "correlation_id": correlation_id,
+            }
+        },
+    )
 
 
 async def enforce_post_cors(request: Request, call_next: Callable):
-    if request.method == "POST":
-        origin = request.headers.get("origin")
-        if origin and request.url.path not in ALLOWED_POST_PATHS:
-            return JSONResponse(
-                status_code=405,
-                content={
-                    "error": {
-                        "code": "ERR_BAD_REQUEST",
-                        "message": "Cross-origin POST not permitted for this endpoint.",
-                        "correlation_id": getattr(request.state, "correlation_id", None),
-                    }
-                },
-            )
+    if is_blocked_cross_origin_post(request.method, request.url.path, request.headers.get("origin")):
+        return cross_origin_post_response(getattr(request.state, "correlation_id", None))
     return await call_next(request)
@@ -9,6 +9,7 @@ ERROR_STATUS_MAP = {
     401: "ERR_AUTH",
     403: "ERR_AUTH",
     404: "ERR_NOT_FOUND",
+    405: "ERR_METHOD_NOT_ALLOWED",
     429: "ERR_RATE_LIMIT",
     500: "ERR_INTERNAL",
     502: "ERR_UPSTREAM",
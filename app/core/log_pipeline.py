@@ -0,0 +1,143 @@
+"""Non-blocking structured log pipeline.
+
+Request handlers only append records to a bounded in-memory queue. A background
+task drains it in batches and writes JSON lines from a worker thread, so a slow
+stdout pipe never stalls the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, TextIO
+
+from app.core.config import get_settings
+
+
+def truncate_payload(value: Any, max_chars: int) -> str:
+    """Render ``value`` as compact JSON, cut to ``max_chars`` with a marker."""
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, default=str)
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}...[truncated {len(text) - max_chars} chars]"
+
+
+class LogPipeline:
+    """Bounded queue of log records flushed in batches by a background writer."""
+
+    def __init__(
+        self,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval_seconds: float = 0.5,
+        success_sample_rate: float = 1.0,
+        max_payload_chars: int = 2_000,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_seconds
+        self.success_sample_rate = success_sample_rate
+        self.max_payload_chars = max_payload_chars
+        self.stream = stream
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self.emitted = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.written = 0
+        self.batches = 0
+
+    def emit(self, record: Dict[str, Any]) -> bool:
+        """Queue ``record`` without blocking; return False when it had to be dropped."""
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+            return False
+        record.setdefault("ts", time.time())
+        self._queue.append(record)
+        self.emitted += 1
+        if self._wakeup is not None and len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def log_request(self, method: str, path: str, status: int, duration_ms: float, correlation_id: Optional[str]) -> None:
+        """Queue an access-log record; successful requests are sampled."""
+        if status < 400 and self.success_sample_rate < 1.0 and random.random() >= self.success_sample_rate:
+            self.sampled_out += 1
+            return
+        self.emit(
+            {
+                "event": "request",
+                "method": method,
+                "path": path,
+                "status": status,
+                "duration_ms": round(duration_ms, 2),
+                "correlation_id": correlation_id,
+            }
+        )
+
+    def log_payload(self, event: str, payload: Any, **fields: Any) -> None:
+        """Queue a record carrying a (truncated) payload."""
+        self.emit({"event": event, **fields, "payload": truncate_payload(payload, self.max_payload_chars)})
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        queue = self._queue
+        return [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        stream = self.stream or sys.stdout
+        stream.write("".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in batch))
+        stream.flush()
+
+    async def run(self) -> None:
+        """Background writer: drain the queue in batches, serialising and writing off the loop."""
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                while self._queue:
+                    batch = self._take_batch()
+                    await asyncio.to_thread(self._write_batch, batch)
+                    self.written += len(batch)
+                    self.batches += 1
+        finally:
+            self._wakeup = None
+
+    def flush(self) -> None:
+        """Synchronously write everything still queued (used at shutdown)."""
+        while self._queue:
+            batch = self._take_batch()
+            self._write_batch(batch)
+            self.written += len(batch)
+            self.batches += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": len(self._queue),
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "written": self.written,
+            "batches": self.batches,
+        }
+
+
+@lru_cache()
+def get_log_pipeline() -> LogPipeline:
+    settings = get_settings()
+    return LogPipeline(
+        max_queue=settings.log_queue_size,
+        batch_size=settings.log_batch_size,
+        flush_interval_seconds=settings.log_flush_interval_seconds,
+        success_sample_rate=settings.log_success_sample_rate,
+        max_payload_chars=settings.log_max_payload_chars,
+    )
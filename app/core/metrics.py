@@ -0,0 +1,158 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Recording is a dict lookup plus an increment on the event loop thread, so it is
+cheap enough to stay on the request hot path without locks.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_INF_LABEL = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        values = self._values
+        values[label_values] = values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for label_values, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    def set(self, value: float, *label_values: str) -> None:
+        self._values[label_values] = value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} gauge"
+        for label_values, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+
+class Histogram:
+    """Fixed-bucket histogram; each series is ``[per-bucket counts..., +Inf count, sum]``."""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, series in self._series.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, series):
+                cumulative += bucket_count
+                labels = _format_labels(self.labels, label_values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {int(cumulative)}"
+            cumulative += series[len(self.buckets)]
+            yield f"{self.name}_bucket{_format_labels(self.labels, label_values, _INF_LABEL)} {int(cumulative)}"
+            yield f"{self.name}_count{_format_labels(self.labels, label_values)} {int(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.labels, label_values)} {_format_value(series[-1])}"
+
+
+class MetricsRegistry:
+    """Holds the API's metric families and renders them in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self.requests_total = Counter(
+            "http_requests_total", "HTTP requests by route template, method and status.", ("route", "method", "status")
+        )
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "HTTP request latency.", ("route", "method", "status")
+        )
+        self.rate_limit_rejections = Counter("rate_limit_rejections_total", "Requests rejected by the rate limiter.")
+        self.webhook_duration = Histogram(
+            "webhook_request_duration_seconds", "Outbound webhook and upstream (n8n, RAG) latency.", ("target", "outcome")
+        )
+        self.mcp_tool_calls = Counter("mcp_tool_calls_total", "MCP tool calls by tool and outcome.", ("tool", "outcome"))
+        self.mcp_tool_duration = Histogram("mcp_tool_call_duration_seconds", "MCP tool call latency.", ("tool",))
+        self.gauges: Dict[str, Gauge] = {}
+
+    def observe_request(self, route: str, method: str, status: int, duration_seconds: float) -> None:
+        status_label = str(status)
+        self.requests_total.inc(route, method, status_label)
+        self.request_duration.observe(duration_seconds, route, method, status_label)
+
+    def observe_webhook(self, target: str, outcome: str, duration_seconds: float) -> None:
+        self.webhook_duration.observe(duration_seconds, target, outcome)
+
+    def observe_tool_call(self, tool: str, outcome: str, duration_seconds: float) -> None:
+        self.mcp_tool_calls.inc(tool, outcome)
+        self.mcp_tool_duration.observe(duration_seconds, tool)
+
+    def set_gauge(self, name: str, help_text: str, value: float) -> None:
+        gauge = self.gauges.get(name)
+        if gauge is None:
+            gauge = self.gauges[name] = Gauge(name, help_text)
+        gauge.set(value)
+
+    def render(self, extra_gauges: Optional[Dict[str, Tuple[str, float]]] = None) -> str:
+        for name, (help_text, value) in (extra_gauges or {}).items():
+            self.set_gauge(name, help_text, value)
+        families = [
+            self.requests_total,
+            self.request_duration,
+            self.rate_limit_rejections,
+            self.webhook_duration,
+            self.mcp_tool_calls,
+            self.mcp_tool_duration,
+            *self.gauges.values(),
+        ]
+        lines: List[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache()
+def get_metrics() -> MetricsRegistry:
+    return MetricsRegistry()
@@ -1,15 +1,36 @@
 """Custom middleware and dependencies for the API."""
 
+import secrets
 import time
 import uuid
-from typing import Callable
+from typing import Callable, Optional
 
-from fastapi import Request
+from fastapi import Request, Security
+from fastapi.security import APIKeyHeader
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response, JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from fastapi import HTTPException
 
 from app.core.config import get_settings
+from app.core.log_pipeline import get_log_pipeline
+from app.core.metrics import get_metrics
+from app.core.cors import cross_origin_post_response, is_blocked_cross_origin_post
+from app.core.rate_limit import RateLimitBackend, build_rate_limiter
+
+
+def rate_limit_response(correlation_id: Optional[str], retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": {
+                "code": "ERR_RATE_LIMIT",
+                "message": "Rate limit exceeded. Try again shortly.",
+                "correlation_id": correlation_id,
+            }
+        },
+        headers={"Retry-After": f"{int(retry_after)}"},
+    )
 
 
 class CorrelationIdMiddleware(BaseHTTPMiddleware):
@@ -24,7 +45,7 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
-    """Simple structured logging for requests."""
+    """Structured request logging through the async log pipeline."""
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         start = time.time()
@@ -36,56 +57,102 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             duration = (time.time() - start) * 1000
             correlation_id = getattr(request.state, "correlation_id", "-")
             status = response.status_code if response else 500
-            log_message = (
-                f"method={request.method} path={request.url.path} status={status} "
-                f"duration_ms={duration:.2f} correlation_id={correlation_id}"
-            )
-            print(log_message)
+            get_log_pipeline().log_request(request.method, request.url.path, status, duration, correlation_id)
+            route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+            get_metrics().observe_request(route, request.method, status, duration / 1000)
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """In-memory rate limiting per client IP address."""
+    """Sliding-window rate limiting per client IP address."""
 
-    def __init__(self, app):
+    def __init__(self, app, limiter: Optional[RateLimitBackend] = None):
         super().__init__(app)
-        settings = get_settings()
-        self.limit = settings.rate_limit_per_minute
-        self._store: dict[str, tuple[int, float]] = {}
+        self.limiter = limiter or build_rate_limiter()
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         client_ip = request.client.host if request.client else "unknown"
-        now = time.time()
-        window = int(now // 60)
-        key = f"{client_ip}:{window}"
-        count, _ = self._store.get(key, (0, now))
-        count += 1
-        if count > self.limit:
-            retry_after = 60 - (now % 60)
+        retry_after = await self.limiter.acquire(client_ip)
+        if retry_after is not None:
+            get_metrics().rate_limit_rejections.inc()
             correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": {
-                        "code": "ERR_RATE_LIMIT",
-                        "message": "Rate limit exceeded. Try again shortly.",
-                        "correlation_id": correlation_id,
-                    }
-                },
-                headers={"Retry-After": f"{int(retry_after)}"},
-            )
-        self._store[key] = (count, now)
+            return rate_limit_response(correlation_id, retry_after)
         response = await call_next(request)
         return response
 
 
-async def verify_api_key(request: Request) -> None:
+class RequestPipelineMiddleware:
+    """Pure ASGI middleware doing correlation IDs, logging, rate limiting and the POST-origin check in one pass.
+
+    Replaces the ``BaseHTTPMiddleware`` stack above (and ``enforce_post_cors``) so each
+    request avoids the extra task hops and response wrappers those layers add.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: Optional[RateLimitBackend] = None) -> None:
+        self.app = app
+        self.limiter = limiter or build_rate_limiter()
+        self.log = get_log_pipeline()
+        self.metrics = get_metrics()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        correlation_id: Optional[str] = None
+        origin: Optional[str] = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                correlation_id = value.decode("latin-1")
+            elif name == b"origin":
+                origin = value.decode("latin-1")
+        if correlation_id is None:
+            correlation_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+
+        correlation_header = (b"x-correlation-id", correlation_id.encode("latin-1"))
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [*message.get("headers", ()), correlation_header]
+            await send(message)
+
+        method = scope["method"]
+        path = scope["path"]
+        try:
+            if is_blocked_cross_origin_post(method, path, origin):
+                await cross_origin_post_response(correlation_id)(scope, receive, send_wrapper)
+                return
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+            retry_after = await self.limiter.acquire(client_ip)
+            if retry_after is not None:
+                self.metrics.rate_limit_rejections.inc()
+                await rate_limit_response(correlation_id, retry_after)(scope, receive, send_wrapper)
+                return
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            self.log.log_request(method, path, status, duration * 1000, correlation_id)
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            self.metrics.observe_request(route, method, status, duration)
+
+
+# Declared as security schemes so the generated OpenAPI documents both headers
+api_key_header_scheme = APIKeyHeader(name="x-api-key", scheme_name="ApiKeyAuth", auto_error=False)
+admin_key_header_scheme = APIKeyHeader(name="x-admin-key", scheme_name="AdminKeyAuth", auto_error=False)
+
+
+async def verify_api_key(request: Request, api_key_header: Optional[str] = Security(api_key_header_scheme)) -> None:
     """Dependency to enforce x-api-key header."""
 
     if request.url.path.startswith("/healthz") or request.url.path.startswith("/docs") or request.url.path.startswith("/openapi"):
         return
     if request.method == "OPTIONS":
         return
-    api_key_header = request.headers.get("x-api-key")
     settings = get_settings()
     if not api_key_header or api_key_header != settings.api_key:
         correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
@@ -97,3 +164,19 @@ async def verify_api_key(request: Request) -> None:
                 "correlation_id": correlation_id,
             },
         )
+
+
+async def verify_admin_key(request: Request, admin_key: Optional[str] = Security(admin_key_header_scheme)) -> None:
+    """Dependency for /v1/admin: off unless ADMIN_API_KEY is set, then requires a matching x-admin-key."""
+    settings = get_settings()
+    correlation_id = getattr(request.state, "correlation_id", str(uuid.uuid4()))
+    if not settings.admin_api_key:
+        raise HTTPException(
+            status_code=404,
+            detail={"code": "ERR_NOT_FOUND", "message": "Admin endpoints are disabled.", "correlation_id": correlation_id},
+        )
+    if not secrets.compare_digest((admin_key or "").encode("utf-8"), settings.admin_api_key.encode("utf-8")):
+        raise HTTPException(
+            status_code=403,
+            detail={"code": "ERR_AUTH", "message": "Invalid or missing admin key.", "correlation_id": correlation_id},
+        )
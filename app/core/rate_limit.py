@@ -0,0 +1,418 @@
+"""Rate-limit backends: per-process memory, host-wide shared memory, and Redis."""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.core.config import get_settings
+
+
+class RateLimitBackend:
+    """Common interface for rate-limit backends used by the request middleware."""
+
+    async def acquire(self, key: str) -> Optional[float]:
+        """Count a request for ``key``; return seconds to wait when over the limit, else None."""
+        raise NotImplementedError
+
+    async def run_sweeper(self, interval_seconds: float) -> None:
+        """Background housekeeping; backends that expire state on their own return immediately."""
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+def _sliding_estimate(previous: float, current: float, elapsed: float, window: float) -> float:
+    return previous * (1 - elapsed / window) + current
+
+
+class SlidingWindowRateLimiter(RateLimitBackend):
+    """Per-client sliding-window counter with a hard ceiling on tracked clients.
+
+    Each client costs one small ``[window_start, previous, current]`` entry. The
+    request rate is estimated by weighting the previous window's count by how much
+    of it still overlaps the sliding window. Entries are kept in an ``OrderedDict``
+    in last-touched order, so the oldest clients are evicted first once
+    ``max_keys`` is reached and the sweeper can stop at the first live entry.
+    """
+
+    def __init__(self, limit: int, window_seconds: float = 60.0, max_keys: int = 10_000) -> None:
+        self.limit = limit
+        self.window = float(window_seconds)
+        self.max_keys = max_keys
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.evictions = 0
+        self.expired = 0
+        self.rejected = 0
+
+    def hit(self, key: str, now: Optional[float] = None) -> Optional[float]:
+        """Count a request for ``key``; return seconds to wait when over the limit, else None."""
+        if now is None:
+            now = time.time()
+        window = self.window
+        current_start = now - (now % window)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = [current_start, 0.0, 0.0]
+            self._entries[key] = entry
+            if len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._entries.move_to_end(key)
+            if entry[0] != current_start:
+                # Roll forward: the old current window becomes "previous" only if adjacent
+                entry[1] = entry[2] if current_start - entry[0] == window else 0.0
+                entry[2] = 0.0
+                entry[0] = current_start
+
+        elapsed = now - current_start
+        if _sliding_estimate(entry[1], entry[2], elapsed, window) + 1 > self.limit:
+            self.rejected += 1
+            return max(window - elapsed, 1.0)
+        entry[2] += 1
+        return None
+
+    async def acquire(self, key: str) -> Optional[float]:
+        return self.hit(key)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop clients idle for two full windows; return how many were removed."""
+        if now is None:
+            now = time.time()
+        cutoff = now - (now % self.window) - self.window
+        removed = 0
+        entries = self._entries
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if entry[0] >= cutoff:
+                break
+            del entries[key]
+            removed += 1
+        self.expired += removed
+        return removed
+
+    async def run_sweeper(self, interval_seconds: float) -> None:
+        """Background task sweeping expired clients every ``interval_seconds``."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.sweep()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "size": len(self._entries),
+            "max_keys": self.max_keys,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "rejected": self.rejected,
+        }
+
+
+class SharedMemoryRateLimiter(RateLimitBackend):
+    """Sliding-window counters in an mmap'd table shared by every worker on the host.
+
+    The table is a fixed array of ``groups`` x ``GROUP_SIZE`` slots, so memory is
+    bounded by construction. A client hashes (with a process-independent digest) to
+    one group; updates take a POSIX byte-range lock on just that group, which makes
+    the read-modify-write atomic across processes without serialising unrelated
+    clients. When a group is full the slot with the oldest window is reused.
+
+    ``hit`` runs on the event loop, so the lock is never waited on: it is tried
+    non-blocking up to ``LOCK_ATTEMPTS`` times (a holder only does a few slot
+    reads and writes, so one retry is normally enough) and the request fails open
+    if the group is still locked, e.g. because the holding process is stopped.
+    """
+
+    SLOT = struct.Struct("<QqII")  # key hash, window index, previous count, current count
+    GROUP_SIZE = 8
+    LOCK_ATTEMPTS = 32
+
+    def __init__(self, path: str, limit: int, window_seconds: float = 60.0, slots: int = 65_536) -> None:
+        import fcntl  # POSIX only; imported here so other backends work everywhere
+
+        self._fcntl = fcntl
+        self.path = path
+        self.limit = limit
+        self.window = float(window_seconds)
+        self.groups = max(1, slots // self.GROUP_SIZE)
+        self._group_bytes = self.GROUP_SIZE * self.SLOT.size
+        size = self.groups * self._group_bytes
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+        self.evictions = 0
+        self.rejected = 0
+        self.contended = 0
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        digest = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+        return digest or 1  # 0 marks an empty slot
+
+    def _try_lock(self, base: int) -> bool:
+        fcntl = self._fcntl
+        for attempt in range(self.LOCK_ATTEMPTS):
+            try:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, self._group_bytes, base, os.SEEK_SET)
+                return True
+            except OSError as exc:
+                if exc.errno not in (errno.EACCES, errno.EAGAIN):
+                    raise
+            if attempt:
+                time.sleep(0)  # give the holder a chance to run
+        return False
+
+    def hit(self, key: str, now: Optional[float] = None) -> Optional[float]:
+        if now is None:
+            now = time.time()
+        key_hash = self._hash(key)
+        window_index = int(now // self.window)
+        elapsed = now - window_index * self.window
+        base = (key_hash % self.groups) * self._group_bytes
+        slot = self.SLOT
+        buf = self._map
+
+        if not self._try_lock(base):
+            self.contended += 1
+            return None
+        try:
+            target = None
+            free_offset: Optional[int] = None
+            victim_offset, victim_window = base, None
+            for i in range(self.GROUP_SIZE):
+                offset = base + i * slot.size
+                h, w, previous, current = slot.unpack_from(buf, offset)
+                if h == key_hash:
+                    target = (offset, w, previous, current)
+                    break
+                if h == 0 or w < window_index - 1:
+                    if free_offset is None:
+                        free_offset = offset
+                elif victim_window is None or w < victim_window:
+                    victim_offset, victim_window = offset, w
+            if target is None:
+                if free_offset is None:
+                    self.evictions += 1
+                target = (victim_offset if free_offset is None else free_offset, window_index, 0, 0)
+
+            offset, w, previous, current = target
+            if w != window_index:
+                previous = current if w == window_index - 1 else 0
+                current = 0
+            if _sliding_estimate(previous, current, elapsed, self.window) + 1 > self.limit:
+                self.rejected += 1
+                slot.pack_into(buf, offset, key_hash, window_index, previous, current)
+                return max(self.window - elapsed, 1.0)
+            slot.pack_into(buf, offset, key_hash, window_index, previous, current + 1)
+            return None
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, self._group_bytes, base, os.SEEK_SET)
+
+    async def acquire(self, key: str) -> Optional[float]:
+        return self.hit(key)
+
+    async def aclose(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    def stats(self) -> Dict[str, Any]:
+        slot = self.SLOT
+        used = sum(
+            1 for offset in range(0, self.groups * self._group_bytes, slot.size) if slot.unpack_from(self._map, offset)[0]
+        )
+        return {
+            "backend": "shared",
+            "size": used,
+            "max_keys": self.groups * self.GROUP_SIZE,
+            "evictions": self.evictions,
+            "rejected": self.rejected,
+            "contended": self.contended,
+        }
+
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class RedisRateLimiter(RateLimitBackend):
+    """Sliding-window counters kept in Redis (or anything speaking RESP).
+
+    Uses one pipelined round-trip per request: ``INCR`` + ``EXPIRE`` on the current
+    window key and ``GET`` on the previous one. Rejected requests are rolled back with
+    ``DECR`` so only admitted requests count, matching the in-process backends. If
+    Redis is unreachable the limiter fails open and counts the error.
+
+    Round-trips run on a pool of up to ``pool_size`` connections, so concurrent
+    requests do not queue behind one another's replies; a connection that fails
+    or times out mid-reply is closed rather than returned to the pool.
+    """
+
+    def __init__(self, url: str, limit: int, window_seconds: float = 60.0, key_prefix: str = "ratelimit",
+                 timeout_seconds: float = 0.5, pool_size: int = 8) -> None:
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.limit = limit
+        self.window = float(window_seconds)
+        self.key_prefix = key_prefix
+        self.timeout = timeout_seconds
+        self.pool_size = max(1, pool_size)
+        self._idle: List[Connection] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.connects = 0
+        self.rejected = 0
+        self.errors = 0
+
+    @staticmethod
+    def _encode(*args: Any) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self, reader: asyncio.StreamReader) -> Any:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body.decode("utf-8")
+        if kind == b"-":
+            raise ConnectionError(body.decode("utf-8"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            return [await self._read_reply(reader) for _ in range(int(body))]
+        raise ConnectionError(f"Unexpected Redis reply: {line!r}")
+
+    async def _connect(self) -> Connection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        self.connects += 1
+        setup = []
+        if self.password:
+            setup.append(self._encode("AUTH", self.password))
+        if self.db:
+            setup.append(self._encode("SELECT", self.db))
+        try:
+            if setup:
+                writer.write(b"".join(setup))
+                await writer.drain()
+                for _ in setup:
+                    await self._read_reply(reader)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    async def _pipeline(self, *commands: tuple) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections and semaphores are bound to the loop that created them
+            self._loop, self._slots, self._idle = loop, asyncio.Semaphore(self.pool_size), []
+        assert self._slots is not None
+        async with self._slots:
+            reader, writer = self._idle.pop() if self._idle else await self._connect()
+            try:
+                writer.write(b"".join(self._encode(*command) for command in commands))
+                await writer.drain()
+                replies = [await self._read_reply(reader) for _ in commands]
+            except BaseException:
+                # Replies may still be in flight; the connection can't be reused
+                writer.close()
+                raise
+            self._idle.append((reader, writer))
+            return replies
+
+    async def acquire(self, key: str) -> Optional[float]:
+        now = time.time()
+        window_index = int(now // self.window)
+        elapsed = now - window_index * self.window
+        current_key = f"{self.key_prefix}:{key}:{window_index}"
+        previous_key = f"{self.key_prefix}:{key}:{window_index - 1}"
+        try:
+            current, _, previous = await asyncio.wait_for(
+                self._pipeline(
+                    ("INCR", current_key),
+                    ("EXPIRE", current_key, int(self.window * 2)),
+                    ("GET", previous_key),
+                ),
+                self.timeout,
+            )
+            if _sliding_estimate(int(previous or 0), current, elapsed, self.window) > self.limit:
+                self.rejected += 1
+                await asyncio.wait_for(self._pipeline(("DECR", current_key)), self.timeout)
+                return max(self.window - elapsed, 1.0)
+        except (OSError, ConnectionError, asyncio.TimeoutError, ValueError):
+            self.errors += 1
+        return None
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "redis",
+            "pool_size": self.pool_size,
+            "idle_connections": len(self._idle),
+            "connects": self.connects,
+            "rejected": self.rejected,
+            "errors": self.errors,
+        }
+
+
+def build_rate_limiter() -> RateLimitBackend:
+    """Create the rate-limit backend selected by ``RATE_LIMIT_BACKEND``."""
+    settings = get_settings()
+    backend = settings.rate_limit_backend.lower()
+    if backend == "shared":
+        path = settings.rate_limit_shared_path or os.path.join(
+            "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "kane-portfolio-ratelimit"
+        )
+        return SharedMemoryRateLimiter(
+            path,
+            limit=settings.rate_limit_per_minute,
+            window_seconds=60,
+            slots=settings.rate_limit_max_clients,
+        )
+    if backend == "redis":
+        if not settings.rate_limit_redis_url:
+            raise ValueError("RATE_LIMIT_REDIS_URL is required when RATE_LIMIT_BACKEND=redis")
+        return RedisRateLimiter(
+            settings.rate_limit_redis_url,
+            limit=settings.rate_limit_per_minute,
+            window_seconds=60,
+            pool_size=settings.rate_limit_redis_pool_size,
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {settings.rate_limit_backend}")
+    return SlidingWindowRateLimiter(
+        limit=settings.rate_limit_per_minute,
+        window_seconds=60,
+        max_keys=settings.rate_limit_max_clients,
+    )
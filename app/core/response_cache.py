@@ -0,0 +1,149 @@
+"""Pre-rendered, ETag-addressed cache for static JSON responses.
+
+Payloads are rendered to bytes once per data snapshot version and then served
+as-is; ``If-None-Match`` revalidation short-circuits to ``304 Not Modified``.
+Compressed variants are produced lazily, once per entry and encoding, so a hot
+payload is never compressed twice within a snapshot.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi import Request
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from app.core.compression import compress, negotiate_encoding, variant_etag
+from app.core.config import get_settings
+
+
+class CachedBody(NamedTuple):
+    version: str
+    body: bytes
+    etag: str
+    # Encoding -> compressed body, filled on first request for that encoding
+    variants: Dict[str, bytes]
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """LRU of rendered bodies; bounded because paged/projected list keys are open-ended."""
+
+    def __init__(
+        self, max_entries: int = 1024, compression_min_bytes: Optional[int] = 1024, compression_level: int = 6
+    ) -> None:
+        self.max_entries = max_entries
+        self.compression_min_bytes = compression_min_bytes
+        self.compression_level = compression_level
+        self._entries: "OrderedDict[str, CachedBody]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.compressions = 0
+
+    def get(self, key: str, version: str, render: Callable[[], BaseModel]) -> CachedBody:
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            self.misses += 1
+            body = render().model_dump_json().encode("utf-8")
+            entry = CachedBody(version, body, f'"{hashlib.sha256(body).hexdigest()[:32]}"', {})
+            self._entries[key] = entry
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def encoded(self, entry: CachedBody, accept_encoding: Optional[str]) -> Tuple[Optional[str], bytes]:
+        """Negotiate an encoding for ``entry``; returns ``(encoding or None, body)``."""
+        if self.compression_min_bytes is None or len(entry.body) < self.compression_min_bytes:
+            return None, entry.body
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            return None, entry.body
+        body = entry.variants.get(encoding)
+        if body is None:
+            body = entry.variants[encoding] = compress(entry.body, encoding, self.compression_level)
+            self.compressions += 1
+        return encoding, body
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "compressions": self.compressions,
+        }
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        compression_min_bytes=settings.compression_min_bytes if settings.compression_enabled else None,
+        compression_level=settings.compression_level,
+    )
+
+
+def _not_modified_since(if_modified_since: Optional[str], last_modified: datetime) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return since.tzinfo is not None and last_modified <= since
+
+
+def cached_json_response(
+    request: Request,
+    key: str,
+    version: str,
+    render: Callable[[], BaseModel],
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """Serve the cached rendering of ``render()`` for ``key``, honouring ``If-None-Match``.
+
+    When ``last_modified`` is given, ``Last-Modified`` is sent and ``If-Modified-Since``
+    is honoured (only in the absence of ``If-None-Match``, per RFC 9110).
+    """
+    cache = get_response_cache()
+    entry = cache.get(key, version, render)
+    encoding, body = cache.encoded(entry, request.headers.get("accept-encoding"))
+    etag = variant_etag(entry.etag, encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag) or _etag_matches(if_none_match, entry.etag)
+    else:
+        not_modified = last_modified is not None and _not_modified_since(
+            request.headers.get("if-modified-since"), last_modified
+        )
+    if not_modified:
+        cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
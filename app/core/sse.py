@@ -0,0 +1,38 @@
+"""Server-Sent Events framing shared by streaming endpoints."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator, Iterator, Optional, Tuple
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_sse(event: str, data: Any, event_id: Optional[str] = None) -> bytes:
+    """Encode one SSE message; ``data`` is sent as a single line of compact JSON."""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+    return f"{head}event: {event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+def iter_sse(event: str, data: Any, chunk_size: int = 16 * 1024) -> Iterator[bytes]:
+    """Encode one SSE message in pieces of about ``chunk_size`` characters.
+
+    Compact JSON escapes newlines inside strings, so any split still forms a single ``data:`` line.
+    """
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+    pending = f"event: {event}\ndata: "
+    for piece in encoder.iterencode(data):
+        pending += piece
+        if len(pending) >= chunk_size:
+            cut = len(pending) - len(pending) % chunk_size
+            for start in range(0, cut, chunk_size):
+                yield pending[start:start + chunk_size].encode("utf-8")
+            pending = pending[cut:]
+    yield (pending + "\n\n").encode("utf-8")
+
+
+async def sse_stream(events: AsyncIterator[Tuple[str, Any]]) -> AsyncIterator[bytes]:
+    """Frame ``(event, data)`` pairs. Starlette cancels the iteration when the client disconnects."""
+    async for event, data in events:
+        yield format_sse(event, data)
@@ -0,0 +1,242 @@
+"""Name-indexed registry of MCP tool handlers with argument validators compiled from the manifest.
+
+Handlers register with ``@registry.tool(name)``. ``bind`` compiles each
+manifest ``input_schema`` into a plain validation closure once and refuses
+manifests that do not line up with the registered handlers, so a dispatch is
+one dict lookup plus the precompiled checks.
+
+Only the JSON Schema keywords the manifest uses are supported: ``type``,
+``enum``, ``properties``, ``required``, ``additionalProperties``, ``items``,
+``minItems``/``maxItems``, ``minLength``/``maxLength``, ``minimum``/``maximum``
+and ``oneOf``. ``format``, ``default`` and ``description`` are annotations. Any
+other keyword fails compilation, so a schema is never half-enforced.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+# Returns one message per violation; an empty list means the value is valid
+Validator = Callable[[Any, str], List[str]]
+
+ANNOTATIONS = frozenset({"format", "default", "description", "title", "examples"})
+KEYWORDS = frozenset(
+    {
+        "type", "enum", "properties", "required", "additionalProperties", "items",
+        "minItems", "maxItems", "minLength", "maxLength", "minimum", "maximum", "oneOf",
+    }
+) | ANNOTATIONS
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+_SIMPLE_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class ToolError(Exception):
+    """Raised by handlers; ``code`` is one of the API error codes (``ERR_BAD_REQUEST``, ``ERR_NOT_FOUND``...)."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class ToolRegistryError(RuntimeError):
+    """Raised when the manifest cannot be compiled or does not match the registered handlers."""
+
+
+class Tool(NamedTuple):
+    name: str
+    handler: Handler
+    validate: Validator
+
+
+def _child(path: str, key: str) -> str:
+    if _SIMPLE_KEY.match(key):
+        return f"{path}.{key}" if path else key
+    return f"{path}[{key!r}]"
+
+
+def compile_schema(schema: Mapping[str, Any], path: str = "") -> Validator:
+    """Compile ``schema`` into a validator; raises ``ToolRegistryError`` for unsupported keywords."""
+    unknown = sorted(set(schema) - KEYWORDS)
+    if unknown:
+        raise ToolRegistryError(f"Unsupported schema keyword(s) at '{path or '$'}': {', '.join(unknown)}")
+    checks: List[Validator] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        try:
+            tests = [_TYPES[name] for name in names]
+        except KeyError as exc:
+            raise ToolRegistryError(f"Unknown type {exc.args[0]!r} at '{path or '$'}'") from None
+        expected = " or ".join(names)
+
+        def check_type(value: Any, where: str) -> List[str]:
+            if any(test(value) for test in tests):
+                return []
+            return [f"'{where or 'arguments'}' must be of type {expected}"]
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        listed = ", ".join(map(str, allowed))
+
+        def check_enum(value: Any, where: str) -> List[str]:
+            return [] if value in allowed else [f"'{where}' must be one of: {listed}"]
+
+        checks.append(check_enum)
+
+    if "properties" in schema or "required" in schema or "additionalProperties" in schema:
+        properties = {
+            key: compile_schema(sub, _child(path, key)) for key, sub in (schema.get("properties") or {}).items()
+        }
+        required = tuple(schema.get("required") or ())
+        extra = schema.get("additionalProperties", True)
+        extra_validator = compile_schema(extra, path) if isinstance(extra, dict) else None
+
+        def check_object(value: Any, where: str) -> List[str]:
+            if not isinstance(value, dict):
+                return []
+            errors = [f"Missing '{_child(where, key)}'" for key in required if key not in value]
+            for key, item in value.items():
+                validator = properties.get(key)
+                if validator is not None:
+                    errors.extend(validator(item, _child(where, key)))
+                elif extra is False:
+                    errors.append(f"Unexpected argument '{_child(where, key)}'")
+                elif extra_validator is not None:
+                    errors.extend(extra_validator(item, _child(where, key)))
+            return errors
+
+        checks.append(check_object)
+
+    if "items" in schema or "minItems" in schema or "maxItems" in schema:
+        item_validator = compile_schema(schema["items"], f"{path}[]") if "items" in schema else None
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+
+        def check_array(value: Any, where: str) -> List[str]:
+            if not isinstance(value, list):
+                return []
+            errors = []
+            if min_items is not None and len(value) < min_items:
+                errors.append(f"'{where}' must have at least {min_items} item(s)")
+            if max_items is not None and len(value) > max_items:
+                errors.append(f"'{where}' must have at most {max_items} item(s)")
+            if item_validator is not None:
+                for position, item in enumerate(value):
+                    errors.extend(item_validator(item, f"{where}[{position}]"))
+            return errors
+
+        checks.append(check_array)
+
+    if "minLength" in schema or "maxLength" in schema:
+        min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+
+        def check_length(value: Any, where: str) -> List[str]:
+            if not isinstance(value, str):
+                return []
+            if min_length is not None and len(value) < min_length:
+                return [f"'{where}' must be at least {min_length} character(s)"]
+            if max_length is not None and len(value) > max_length:
+                return [f"'{where}' must be at most {max_length} character(s)"]
+            return []
+
+        checks.append(check_length)
+
+    if "minimum" in schema or "maximum" in schema:
+        minimum, maximum = schema.get("minimum"), schema.get("maximum")
+
+        def check_range(value: Any, where: str) -> List[str]:
+            if not _TYPES["number"](value):
+                return []
+            if minimum is not None and value < minimum:
+                return [f"'{where}' must be >= {minimum}"]
+            if maximum is not None and value > maximum:
+                return [f"'{where}' must be <= {maximum}"]
+            return []
+
+        checks.append(check_range)
+
+    if "oneOf" in schema:
+        options = [compile_schema(option, path) for option in schema["oneOf"]]
+
+        def check_one_of(value: Any, where: str) -> List[str]:
+            matches = sum(1 for option in options if not option(value, where))
+            return [] if matches == 1 else [f"'{where}' must match exactly one allowed form"]
+
+        checks.append(check_one_of)
+
+    if not checks:
+        return lambda value, where: []
+    if len(checks) == 1:
+        return checks[0]
+    first, rest = checks[0], checks[1:]
+
+    def validate(value: Any, where: str) -> List[str]:
+        errors = first(value, where)
+        if errors and "type" in schema:
+            # Wrong type: the remaining keywords would only add noise
+            return errors
+        for check in rest:
+            errors = errors + check(value, where)
+        return errors
+
+    return validate
+
+
+class ToolRegistry:
+    def __init__(self) -> None:
+        self._handlers: Dict[str, Handler] = {}
+        self._tools: Dict[str, Tool] = {}
+
+    def register(self, name: str, handler: Handler) -> Handler:
+        if name in self._handlers:
+            raise ToolRegistryError(f"Tool '{name}' is already registered")
+        self._handlers[name] = handler
+        return handler
+
+    def tool(self, name: str) -> Callable[[Handler], Handler]:
+        """Decorator form of ``register``."""
+        return lambda handler: self.register(name, handler)
+
+    def bind(self, manifest: Sequence[Mapping[str, Any]]) -> None:
+        """Compile the manifest's input schemas; every manifest tool needs a handler and vice versa."""
+        declared = [entry.get("name") for entry in manifest]
+        missing = sorted(name for name in declared if name not in self._handlers)
+        undeclared = sorted(set(self._handlers) - set(declared))
+        duplicates = sorted({name for name in declared if declared.count(name) > 1})
+        problems = []
+        if missing:
+            problems.append(f"no handler for: {', '.join(map(str, missing))}")
+        if undeclared:
+            problems.append(f"not in manifest: {', '.join(undeclared)}")
+        if duplicates:
+            problems.append(f"declared twice: {', '.join(duplicates)}")
+        if problems:
+            raise ToolRegistryError("MCP tool manifest does not match the registered handlers; " + "; ".join(problems))
+        # Build the new table completely before swapping it in
+        self._tools = {
+            entry["name"]: Tool(
+                entry["name"], self._handlers[entry["name"]], compile_schema(entry.get("input_schema") or {})
+            )
+            for entry in manifest
+        }
+
+    def get(self, name: Any) -> Optional[Tool]:
+        return self._tools.get(name) if isinstance(name, str) else None
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._tools)
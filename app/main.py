@@ -1,5 +1,8 @@
 """Application entry point for Kane's portfolio API."""
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -13,37 +16,98 @@ from app.controllers.contact_controller import router as contact_router
 from app.controllers.availability_controller import router as availability_router
 from app.controllers.chat_controller import router as chat_router
 from app.controllers.system_controller import router as system_router
-from app.controllers.mcp_controller import router as mcp_router
+from app.controllers.mcp_controller import SESSION_HEADER, router as mcp_router
 from app.controllers.time_controller import router as time_router
+from app.controllers.admin_controller import router as admin_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
 from app.core.errors import setup_exception_handlers
-from app.core.middleware import CorrelationIdMiddleware, LoggingMiddleware, RateLimitMiddleware
+from app.core.middleware import (
+    CorrelationIdMiddleware,
+    LoggingMiddleware,
+    RateLimitMiddleware,
+    RequestPipelineMiddleware,
+)
+from app.core.log_pipeline import get_log_pipeline
+from app.core.rate_limit import build_rate_limiter
+from app.core.response_cache import get_response_cache
+from app.services.content_service import get_content_store
+from app.services.mcp_service import get_tool_registry
+from app.services.mcp_session_service import get_session_manager
+from app.services.rag_service import get_rag_client
+from app.services.reload_service import on_seed_reload, run_watcher
 from app.core.cors import enforce_post_cors
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
+    rate_limiter = build_rate_limiter()
+
+    log_pipeline = get_log_pipeline()
+    rag_client = get_rag_client()
+    # Fails fast when mcp.tools.json and the registered tool handlers disagree
+    get_tool_registry()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI):
+        await rag_client.start()
+        background = [
+            asyncio.create_task(rate_limiter.run_sweeper(settings.rate_limit_sweep_interval_seconds)),
+            asyncio.create_task(log_pipeline.run()),
+            asyncio.create_task(get_session_manager().run_sweeper(settings.mcp_session_sweep_interval_seconds)),
+        ]
+        # Preload case-study markdown off the loop so the first page views are warm
+        background.append(asyncio.create_task(asyncio.to_thread(get_content_store().warm)))
+        if settings.seed_reload_interval_seconds > 0:
+            background.append(asyncio.create_task(run_watcher(settings.seed_reload_interval_seconds)))
+        try:
+            yield
+        finally:
+            for task in background:
+                task.cancel()
+            for task in background:
+                with suppress(asyncio.CancelledError):
+                    await task
+            await rate_limiter.aclose()
+            await rag_client.aclose()
+            log_pipeline.flush()
+
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
         openapi_url="/openapi.json",
         docs_url="/docs",
         redoc_url=None,
+        lifespan=lifespan,
     )
+    app.state.rate_limiter = rate_limiter
+    # Cached bodies are keyed by seed digest; clearing on reload just frees the old generation
+    on_seed_reload("response_cache", lambda _: get_response_cache().clear())
 
-    app.add_middleware(CorrelationIdMiddleware)
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(RateLimitMiddleware)
+    if settings.compression_enabled:
+        # Innermost, so logging and metrics still see the status of every response
+        app.add_middleware(
+            CompressionMiddleware, minimum_size=settings.compression_min_bytes, level=settings.compression_level
+        )
+    if settings.fused_middleware:
+        app.add_middleware(RequestPipelineMiddleware, limiter=rate_limiter)
+    else:
+        app.add_middleware(CorrelationIdMiddleware)
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
 
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=False,
-        allow_methods=["GET", "POST", "OPTIONS"],
-        allow_headers=["*"]
+        allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+        # Browser MCP clients must read the session id to resend it and to DELETE the session
+        expose_headers=[SESSION_HEADER],
     )
 
-    app.middleware("http")(enforce_post_cors)
+    if not settings.fused_middleware:
+        app.middleware("http")(enforce_post_cors)
 
     setup_exception_handlers(app)
 
@@ -59,6 +123,7 @@ def create_app() -> FastAPI:
     app.include_router(chat_router)
     app.include_router(mcp_router)
     app.include_router(time_router)
+    app.include_router(admin_router)
 
     return app
 
@@ -1,7 +1,7 @@
 """Pydantic schemas for API responses."""
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Optional, Dict, Any
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -106,8 +106,8 @@ class Certification(BaseModel):
     name: str
     issuer: str
     issued_at: datetime
-    notes: Optional[str]
-    credential_url: Optional[HttpUrl]
+    notes: Optional[str] = None
+    credential_url: Optional[HttpUrl] = None
 
 
 class ContinuingEducationItem(BaseModel):
@@ -169,6 +169,9 @@ class AvailabilityHoldResponse(BaseModel):
 class ChatRequest(BaseModel):
     question: str
     audience: Optional[str] = Field(default="general", pattern="^(recruiter|engineer|general)$")
+    mode: Optional[str] = Field(
+        default="lexical", pattern="^(lexical|dense)$", description="lexical (BM25) or dense (TF-IDF cosine) retrieval"
+    )
 
 
 class ChatResponse(BaseModel):
@@ -178,6 +181,16 @@ class ChatResponse(BaseModel):
     events: List[dict]
 
 
+class ChatBatchRequest(BaseModel):
+    questions: List[Annotated[str, Field(min_length=1)]] = Field(min_length=1, max_length=50)
+    audience: Optional[str] = Field(default="general", pattern="^(recruiter|engineer|general)$")
+    mode: Optional[str] = Field(default="lexical", pattern="^(lexical|dense)$")
+
+
+class ChatBatchResponse(BaseModel):
+    results: List[ChatResponse] = Field(description="One answer per question, in request order")
+
+
 class ErrorResponse(BaseModel):
     error: dict
 
@@ -185,6 +198,18 @@ class ErrorResponse(BaseModel):
 class MetaResponse(BaseModel):
     version: str
     environment: str
+    data_version: Optional[int] = None
+    data_digest: Optional[str] = None
+
+
+class ReloadResponse(BaseModel):
+    version: int
+    digest: str
+    loaded_at: datetime
+    seed_reloaded: bool
+    content_changed: List[str]
+    files_changed: List[str] = Field(default_factory=list)
+    failed_hooks: List[str]
 
 
 class IndexResource(BaseModel):
@@ -218,6 +243,18 @@ class WorkContentResponse(BaseModel):
     content: str
 
 
+class WorkContentSection(BaseModel):
+    id: str = Field(description="Section id for ?section=")
+    title: str
+    level: int = Field(ge=1, le=6, description="Heading level")
+    length: int = Field(description="Section size in characters, including subsections")
+
+
+class WorkContentSectionsResponse(BaseModel):
+    slug: str
+    sections: List[WorkContentSection]
+
+
 # New: current time (GMT+7) response schema
 class CurrentTimeResponse(BaseModel):
     time_zone: str = Field(description="IANA time zone, e.g., Asia/Bangkok")
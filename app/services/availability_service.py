@@ -43,11 +43,7 @@ def filter_availability(range_param: Optional[str]) -> dict:
             zone_name = data.get("time_zone", "UTC")
             range_start = _parse_range_component(start_str, zone_name, is_end=False)
             range_end = _parse_range_component(end_str, zone_name, is_end=True)
-            free_slots = [
-                slot
-                for slot in free_slots
-                if parser.isoparse(slot["end"]) > range_start and parser.isoparse(slot["start"]) < range_end
-            ]
+            free_slots = [slot for slot in free_slots if slot["end"] > range_start and slot["start"] < range_end]
         except ValueError:
             # Bad range input; ignore filter
             pass
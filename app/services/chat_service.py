@@ -1,9 +1,39 @@
-"""Simple chat/FAQ service."""
+"""Simple chat/FAQ service.
+
+Questions are answered from a BM25 index over the corpus, or from a dense
+TF-IDF matrix in ``dense`` mode (see ``app.services.search_service``).
+
+The corpus is the seed summaries plus overlapping passages chunked from the
+case-study markdown. Term counts are cached per seed generation and per content
+file, so a seed reload re-tokenises only the summaries and a markdown edit
+re-chunks only that file; the indexes are then rebuilt from cached counts and
+published together. Reload hooks run on the event loop, so there the reads,
+chunking and index builds happen in worker threads and only the reference swap
+runs on the loop.
+
+Retrieval results are memoised in ``AnswerCache``, keyed by the question's
+token sequence (retrieval depends on nothing else), audience and mode, and
+tied to the corpus version. When ``RAG_ENDPOINT`` is configured, the remote
+backend is asked first (see ``app.services.rag_service``) and the local indexes
+are the fallback.
+"""
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import time
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
+from app.core.config import get_settings
+from app.core.log_pipeline import get_log_pipeline
+
+from app.services.data_loader import SeedSnapshot
+from app.services.content_service import chunk_passages, get_content_store
+from app.services.rag_service import get_rag_client
+from app.services.reload_service import on_content_change, on_seed_reload
+from app.services.search_service import BM25Index, TfidfIndex, count_terms, tokenize
 from app.services.data_service import (
     get_about,
     get_faq_entries,
@@ -28,19 +58,216 @@ def _collect_corpus() -> List[tuple[str, str]]:
     return corpus
 
 
-CORPUS = _collect_corpus()
+RETRIEVAL_MODES = ("lexical", "dense")
+
+Documents = List[Tuple[str, str]]
+
+_summaries: Tuple[Documents, List[Counter]] = ([], [])
+# slug -> (passages, term counts)
+_passages: Dict[str, Tuple[Documents, List[Counter]]] = {}
+
+
+Indexes = Tuple[BM25Index, TfidfIndex, Documents]
+
+# Background rebuilds started by reload hooks; the lock makes them publish in the order they were scheduled
+_reindex_lock = asyncio.Lock()
+_reindex_tasks: Set["asyncio.Task[None]"] = set()
+
+
+def _chunk_files(slugs: List[str]) -> Dict[str, Optional[Tuple[Documents, List[Counter]]]]:
+    """Blocking: read and chunk each case study straight from disk; None marks a deleted file."""
+    chunks: Dict[str, Optional[Tuple[Documents, List[Counter]]]] = {}
+    for slug in slugs:
+        try:
+            passages = chunk_passages(get_content_store().read(slug))
+        except FileNotFoundError:
+            chunks[slug] = None
+            continue
+        chunks[slug] = (passages, count_terms(passages))
+    return chunks
+
+
+def _store_chunks(chunks: Dict[str, Optional[Tuple[Documents, List[Counter]]]]) -> None:
+    for slug, chunk in chunks.items():
+        if chunk is None:
+            _passages.pop(slug, None)
+        else:
+            _passages[slug] = chunk
+
+
+def _build_indexes(documents: Documents, counts: List[Counter]) -> Indexes:
+    """Blocking: build both indexes from cached term counts."""
+    return BM25Index(documents, term_counts=counts), TfidfIndex(documents, term_counts=counts), documents
+
+
+def _corpus_inputs() -> Tuple[Documents, List[Counter]]:
+    documents, counts = list(_summaries[0]), list(_summaries[1])
+    for slug in sorted(_passages):
+        documents += _passages[slug][0]
+        counts += _passages[slug][1]
+    return documents, counts
+
+
+def _swap_indexes(indexes: Indexes) -> None:
+    global CORPUS, INDEX, DENSE_INDEX, CORPUS_VERSION
+    INDEX, DENSE_INDEX, CORPUS = indexes
+    CORPUS_VERSION += 1
+    get_answer_cache().clear()
+
+
+def _publish() -> None:
+    """Blocking: rebuild both indexes from cached term counts and swap them in."""
+    _swap_indexes(_build_indexes(*_corpus_inputs()))
+
+
+async def _republish(slugs: List[str]) -> None:
+    """Re-chunk ``slugs`` and rebuild the indexes in worker threads; the swaps happen on the loop."""
+    async with _reindex_lock:
+        _store_chunks(await asyncio.to_thread(_chunk_files, slugs))
+        _swap_indexes(await asyncio.to_thread(_build_indexes, *_corpus_inputs()))
+
+
+def _reindex_done(task: "asyncio.Task[None]") -> None:
+    _reindex_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        get_log_pipeline().emit({"event": "chat_reindex_failed", "error": str(task.exception())})
+
+
+def _reindex(slugs: List[str]) -> None:
+    """Re-chunk ``slugs`` and republish: in the background on a running loop, inline otherwise."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _store_chunks(_chunk_files(slugs))
+        _publish()
+        return
+    task = loop.create_task(_republish(slugs))
+    _reindex_tasks.add(task)
+    task.add_done_callback(_reindex_done)
+
+
+def _rebuild_corpus(_: SeedSnapshot) -> None:
+    global _summaries
+    summaries = _collect_corpus()
+    _summaries = (summaries, count_terms(summaries))
+    _reindex([])
+
+
+def _reindex_content(slugs: List[str]) -> None:
+    _reindex(slugs)
+
+
+class AnswerCache:
+    """LRU of retrieval results with a TTL; entries from an older corpus version never match."""
 
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[int, float, Documents]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
 
-def answer_question(question: str, audience: str) -> tuple[str, List[str], List[str], List[dict]]:
-    question_lower = question.lower()
-    matches = [entry for entry in CORPUS if any(word in entry[1].lower() for word in question_lower.split())]
+    @staticmethod
+    def key(question: str, audience: str, mode: str) -> Tuple[str, str, str]:
+        return " ".join(tokenize(question)), audience, mode
+
+    def get(self, key: Tuple[str, str, str], version: int) -> Optional[Documents]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version or time.monotonic() >= entry[1]:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, key: Tuple[str, str, str], version: int, matches: Documents) -> None:
+        self._entries[key] = (version, time.monotonic() + self.ttl_seconds, matches)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+@lru_cache()
+def get_answer_cache() -> AnswerCache:
+    settings = get_settings()
+    return AnswerCache(max_entries=settings.chat_cache_max_entries, ttl_seconds=settings.chat_cache_ttl_seconds)
+
+
+CORPUS: Documents = []
+CORPUS_VERSION = 0
+_store_chunks(_chunk_files(sorted(path.stem for path in get_content_store().directory.glob("*.md"))))
+_rebuild_corpus(None)
+
+on_seed_reload("chat_corpus", _rebuild_corpus)
+on_content_change("chat_passages", _reindex_content)
+
+
+SUGGESTIONS = ("See availability", "View case studies", "Contact Kane")
+
+
+def _retrieve(question: str, audience: str, mode: str) -> Documents:
+    # One index (and so one corpus version) for the whole answer, even if a reload swaps it meanwhile
+    version, index = CORPUS_VERSION, DENSE_INDEX if mode == "dense" else INDEX
+    cache = get_answer_cache()
+    key = cache.key(question, audience, mode)
+    matches = cache.get(key, version)
+    if matches is not None:
+        return matches
+    matches = [index.documents[doc_id] for _, doc_id in index.search(question, k=3)]
     if not matches:
-        matches = CORPUS[:3]
-    answer_parts = [entry[1] for entry in matches[:3]]
-    answer = "\n\n".join(answer_parts)
-    suggestions = ["See availability", "View case studies", "Contact Kane"]
-    sources = [entry[0] for entry in matches[:3]]
-    events = [
+        matches = list(index.documents[:3])
+    cache.put(key, version, matches)
+    return matches
+
+
+def _retrieve_many(questions: List[str], audience: str, mode: str) -> List[Documents]:
+    """Retrieve for a batch: dedupe by cache key, serve cache hits, score the rest in one index pass."""
+    version, index = CORPUS_VERSION, DENSE_INDEX if mode == "dense" else INDEX
+    cache = get_answer_cache()
+    keys = [cache.key(question, audience, mode) for question in questions]
+    results: Dict[Tuple[str, str, str], Documents] = {}
+    pending: Dict[Tuple[str, str, str], str] = {}
+    for key, question in zip(keys, questions):
+        if key in results or key in pending:
+            continue
+        cached = cache.get(key, version)
+        if cached is not None:
+            results[key] = cached
+        else:
+            pending[key] = question
+    if pending:
+        ranked_batch = index.search_many(list(pending.values()), k=3)
+        for key, ranked in zip(pending, ranked_batch):
+            matches = [index.documents[doc_id] for _, doc_id in ranked] or list(index.documents[:3])
+            cache.put(key, version, matches)
+            results[key] = matches
+    return [results[key] for key in keys]
+
+
+async def _retrieve_async(question: str, audience: str, mode: str, shed: bool = True) -> Documents:
+    """Remote retrieval when configured and healthy, else the local index for ``mode``."""
+    rag = get_rag_client()
+    if rag.enabled:
+        cache = get_answer_cache()
+        key = cache.key(question, audience, "rag")
+        matches = cache.get(key, CORPUS_VERSION)
+        if matches is None:
+            matches = await rag.retrieve(question, audience, top_k=3, shed=shed)
+            if matches:
+                cache.put(key, CORPUS_VERSION, matches)
+        if matches:
+            return matches
+    return _retrieve(question, audience, mode)
+
+
+def _chat_events(audience: str, sources: List[str]) -> List[dict]:
+    return [
         {
             "type": "chat",
             "audience": audience,
@@ -48,4 +275,69 @@ def answer_question(question: str, audience: str) -> tuple[str, List[str], List[
             "sources": sources,
         }
     ]
-    return answer, sources, suggestions, events
+
+
+def answer_question(
+    question: str, audience: str, mode: str = "lexical"
+) -> tuple[str, List[str], List[str], List[dict]]:
+    matches = _retrieve(question, audience, mode)
+    return _compose(matches, audience)
+
+
+async def answer_question_async(
+    question: str, audience: str, mode: str = "lexical"
+) -> tuple[str, List[str], List[str], List[dict]]:
+    """``answer_question`` with the remote retrieval backend in front of the local index."""
+    return _compose(await _retrieve_async(question, audience, mode), audience)
+
+
+async def answer_questions_async(
+    questions: List[str], audience: str, mode: str = "lexical"
+) -> List[tuple[str, List[str], List[str], List[dict]]]:
+    """Answer a batch; results line up with ``questions`` (duplicates share one retrieval).
+
+    With a remote backend the whole batch is bounded by ``rag_batch_timeout_seconds``;
+    questions still queued or in flight by then are answered from the local index.
+    """
+    if get_rag_client().enabled and questions:
+        # Questions that normalise to the same cache key share one backend call
+        keys = [AnswerCache.key(question, audience, mode) for question in questions]
+        unique = dict(zip(keys, questions))
+        # Queue on the client's concurrency cap rather than shedding the tail of the batch to the local index
+        tasks = {
+            key: asyncio.ensure_future(_retrieve_async(question, audience, mode, shed=False))
+            for key, question in unique.items()
+        }
+        _, pending = await asyncio.wait(tasks.values(), timeout=get_settings().rag_batch_timeout_seconds)
+        for task in pending:
+            task.cancel()
+        late = [key for key, task in tasks.items() if task in pending]
+        by_key = {key: task.result() for key, task in tasks.items() if task not in pending}
+        by_key.update(zip(late, _retrieve_many([unique[key] for key in late], audience, mode)))
+        matches_list = [by_key[key] for key in keys]
+    else:
+        matches_list = _retrieve_many(questions, audience, mode)
+    return [_compose(matches, audience) for matches in matches_list]
+
+
+def _compose(matches: Documents, audience: str) -> tuple[str, List[str], List[str], List[dict]]:
+    answer = "\n\n".join(entry[1] for entry in matches)
+    sources = [entry[0] for entry in matches]
+    return answer, sources, list(SUGGESTIONS), _chat_events(audience, sources)
+
+
+async def stream_answer(question: str, audience: str, mode: str = "lexical") -> AsyncIterator[Tuple[str, dict]]:
+    """Yield ``(event, data)``: sources first, then answer fragments, then events, suggestions and done.
+
+    The ``delta`` fragments concatenate to exactly the ``answer`` of ``answer_question``.
+    """
+    matches = await _retrieve_async(question, audience, mode)
+    sources = [entry[0] for entry in matches]
+    yield "sources", {"sources": sources}
+    for position, (_, text) in enumerate(matches):
+        # Yield to the loop between fragments so a disconnect can cancel the rest
+        await asyncio.sleep(0)
+        yield "answer", {"delta": text if position == 0 else f"\n\n{text}"}
+    yield "events", {"events": _chat_events(audience, sources)}
+    yield "suggestions", {"suggestions": list(SUGGESTIONS)}
+    yield "done", {}
@@ -1,11 +1,13 @@
 """Service for processing contact messages."""
 
+import time
 from datetime import datetime, timezone
 from typing import Dict
 
 import httpx
 
 from app.core.config import get_settings
+from app.core.metrics import get_metrics
 
 
 async def submit_contact_message(payload: Dict) -> str:
@@ -16,7 +18,13 @@ async def submit_contact_message(payload: Dict) -> str:
 
     webhook = settings.n8n_contact_webhook
     if webhook:
-        async with httpx.AsyncClient(timeout=settings.n8n_contact_timeout_seconds) as client:
-            await client.post(str(webhook), json={**payload, "ticket_id": ticket_id})
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            async with httpx.AsyncClient(timeout=settings.n8n_contact_timeout_seconds) as client:
+                response = await client.post(str(webhook), json={**payload, "ticket_id": ticket_id})
+                outcome = str(response.status_code)
+        finally:
+            get_metrics().observe_webhook("contact", outcome, time.perf_counter() - start)
 
     return ticket_id
@@ -1,21 +1,350 @@
 """Content service for long-form project writeups (no database).
 
-Reads Markdown files from data/content/work/{slug}.md and returns them.
+Markdown files under data/content/work/{slug}.md are held in a bounded LRU
+``ContentStore``. Warm hits do no I/O at all: entries are invalidated by the
+reload watcher's content hook and otherwise revalidated with a cheap ``stat``
+at most every ``revalidate_seconds``. Cold reads and revalidation run in a
+worker thread so the event loop never blocks on disk.
+
+HTML renderings are cached next to the markdown, keyed by the content hash, so
+each version of a page is rendered once on the server. Each file also gets a
+heading index at load time so single sections can be served without scanning
+or shipping the whole document.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+import markdown
 
-def get_work_content(slug: str) -> Dict[str, str]:
-    if not slug or "/" in slug or ".." in slug:
+from app.core.config import get_settings
+from app.services.data_loader import BASE_DIR
+from app.services.reload_service import on_content_change
+
+CONTENT_DIR = BASE_DIR / "data" / "content" / "work"
+
+CONTENT_FORMATS = ("markdown", "html")
+MARKDOWN_EXTENSIONS = ("fenced_code", "tables", "sane_lists")
+
+_HEADING = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+_FENCE = re.compile(r"^[ \t]*(```|~~~)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SectionNotFoundError(LookupError):
+    """Raised when a document has no heading with the requested section id."""
+
+
+class Section(NamedTuple):
+    """A heading and the character range it spans, up to the next heading of the same or higher level."""
+
+    id: str
+    title: str
+    level: int
+    start: int
+    end: int
+
+
+def _section_id(title: str) -> str:
+    text = re.sub(r"[^\w\s-]", "", title.lower()).strip()
+    return re.sub(r"[\s_-]+", "-", text).strip("-") or "section"
+
+
+def build_section_index(text: str) -> Tuple[Section, ...]:
+    """Index ATX headings outside fenced code blocks; duplicate ids get ``-2``, ``-3``... suffixes."""
+    headings: List[Tuple[int, str, int]] = []
+    fence: Optional[str] = None
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        fence_match = _FENCE.match(line)
+        if fence_match:
+            if fence is None:
+                fence = fence_match.group(1)
+            elif fence_match.group(1) == fence:
+                fence = None
+        elif fence is None:
+            heading = _HEADING.match(line.rstrip("\r\n"))
+            if heading:
+                headings.append((len(heading.group(1)), heading.group(2), offset))
+        offset += len(line)
+
+    sections = []
+    seen: Dict[str, int] = {}
+    for position, (level, title, start) in enumerate(headings):
+        end = next((other for lvl, _, other in headings[position + 1:] if lvl <= level), len(text))
+        base = _section_id(title)
+        seen[base] = seen.get(base, 0) + 1
+        section_id = base if seen[base] == 1 else f"{base}-{seen[base]}"
+        sections.append(Section(section_id, title, level, start, end))
+    return tuple(sections)
+
+
+class ContentEntry(NamedTuple):
+    slug: str
+    content: str
+    etag: str
+    last_modified: datetime
+    mtime_ns: int
+    size: int
+    checked_at: float
+    sections: Tuple[Section, ...]
+
+    def section(self, section_id: str) -> str:
+        for section in self.sections:
+            if section.id == section_id:
+                return self.content[section.start:section.end]
+        raise SectionNotFoundError(f"Section not found: {section_id}")
+
+
+def _validate_slug(slug: str) -> None:
+    if not slug or "/" in slug or "\\" in slug or ".." in slug:
         raise FileNotFoundError("Invalid slug")
-    # Resolve repository root and content path
-    root = Path(__file__).resolve().parents[2]
-    md_path = root / "data" / "content" / "work" / f"{slug}.md"
-    if not md_path.exists():
-        raise FileNotFoundError(f"Content not found for slug: {slug}")
-    content = md_path.read_text(encoding="utf-8")
-    return {"slug": slug, "format": "markdown", "content": content}
 
+
+def render_markdown(text: str) -> str:
+    # markdown.markdown builds a fresh parser per call, so it is safe in worker threads
+    return markdown.markdown(text, extensions=list(MARKDOWN_EXTENSIONS), output_format="html")
+
+
+class ContentStore:
+    def __init__(self, directory: Path = CONTENT_DIR, max_entries: int = 128, revalidate_seconds: float = 30.0) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.revalidate_seconds = revalidate_seconds
+        self._entries: "OrderedDict[str, ContentEntry]" = OrderedDict()
+        # (slug, section id or None) -> (content etag, rendered html)
+        self._html: Dict[Tuple[str, Optional[str]], Tuple[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reads = 0
+        self.renders = 0
+
+    def _path(self, slug: str) -> Path:
+        _validate_slug(slug)
+        return self.directory / f"{slug}.md"
+
+    def _load(self, slug: str, cached: Optional[ContentEntry]) -> ContentEntry:
+        """Blocking: stat the file and re-read it only when mtime or size changed."""
+        path = self._path(slug)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Content not found for slug: {slug}") from None
+        now = time.monotonic()
+        if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+            return cached._replace(checked_at=now)
+        raw = path.read_bytes()
+        self.reads += 1
+        content = raw.decode("utf-8")
+        return ContentEntry(
+            slug=slug,
+            content=content,
+            etag=f'"{hashlib.sha256(raw).hexdigest()[:32]}"',
+            last_modified=datetime.fromtimestamp(stat.st_mtime_ns // 1_000_000_000, tz=timezone.utc),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            checked_at=now,
+            sections=build_section_index(content),
+        )
+
+    def _fresh(self, slug: str) -> Optional[ContentEntry]:
+        entry = self._entries.get(slug)
+        if entry is not None and time.monotonic() - entry.checked_at < self.revalidate_seconds:
+            self._entries.move_to_end(slug)
+            self.hits += 1
+            return entry
+        return None
+
+    def _store(self, entry: ContentEntry) -> ContentEntry:
+        self._entries[entry.slug] = entry
+        self._entries.move_to_end(entry.slug)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._drop_html(evicted)
+        return entry
+
+    def get(self, slug: str) -> ContentEntry:
+        """Synchronous lookup for non-async callers; cold reads block."""
+        _validate_slug(slug)
+        entry = self._fresh(slug)
+        if entry is not None:
+            return entry
+        self.misses += 1
+        try:
+            return self._store(self._load(slug, self._entries.get(slug)))
+        except FileNotFoundError:
+            self._entries.pop(slug, None)
+            raise
+
+    def read(self, slug: str) -> ContentEntry:
+        """Blocking, uncached read that leaves the store untouched, so worker threads can call it."""
+        _validate_slug(slug)
+        return self._load(slug, None)
+
+    async def aget(self, slug: str) -> ContentEntry:
+        """Lookup that never touches the disk on the event loop."""
+        _validate_slug(slug)
+        entry = self._fresh(slug)
+        if entry is not None:
+            return entry
+        self.misses += 1
+        try:
+            loaded = await asyncio.to_thread(self._load, slug, self._entries.get(slug))
+        except FileNotFoundError:
+            self._entries.pop(slug, None)
+            raise
+        return self._store(loaded)
+
+    def _drop_html(self, slug: str) -> None:
+        for key in [key for key in self._html if key[0] == slug]:
+            del self._html[key]
+
+    async def ahtml(self, slug: str, section: Optional[str] = None) -> Tuple[ContentEntry, str]:
+        """Current entry plus the HTML of the document (or one section), rendered once per content version."""
+        entry = await self.aget(slug)
+        source = entry.section(section) if section else entry.content
+        cached = self._html.get((slug, section))
+        if cached is not None and cached[0] == entry.etag:
+            return entry, cached[1]
+        html = await asyncio.to_thread(render_markdown, source)
+        self.renders += 1
+        if slug in self._entries:
+            self._html[(slug, section)] = (entry.etag, html)
+        return entry, html
+
+    def warm(self) -> None:
+        """Blocking preload of up to ``max_entries`` files; run in a thread at startup."""
+        for path in sorted(self.directory.glob("*.md"))[: self.max_entries]:
+            try:
+                self._store(self._load(path.stem, None))
+            except (FileNotFoundError, UnicodeDecodeError):
+                continue
+
+    def invalidate(self, slugs: Optional[Iterable[str]] = None) -> None:
+        if slugs is None:
+            self._entries.clear()
+            self._html.clear()
+            return
+        for slug in slugs:
+            self._entries.pop(slug, None)
+            self._drop_html(slug)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reads": self.reads,
+            "renders": self.renders,
+        }
+
+
+@lru_cache()
+def get_content_store() -> ContentStore:
+    settings = get_settings()
+    return ContentStore(
+        max_entries=settings.content_cache_max_entries,
+        revalidate_seconds=settings.content_revalidate_seconds,
+    )
+
+
+on_content_change("content_store", lambda slugs: get_content_store().invalidate(slugs))
+
+
+def get_work_content(slug: str) -> Dict[str, str]:
+    entry = get_content_store().get(slug)
+    return {"slug": entry.slug, "format": "markdown", "content": entry.content}
+
+
+async def load_content_entry(
+    slug: str, content_format: str = "markdown", section: Optional[str] = None
+) -> Tuple[ContentEntry, str]:
+    """``(entry, body)`` where body is the markdown (or one section of it) or its cached HTML rendering.
+
+    Raises ``ValueError`` for an unknown format, ``FileNotFoundError`` for an unknown
+    slug and ``SectionNotFoundError`` for an unknown section.
+    """
+    if content_format not in CONTENT_FORMATS:
+        raise ValueError(f"Unsupported format '{content_format}'; expected one of: {', '.join(CONTENT_FORMATS)}.")
+    store = get_content_store()
+    if content_format == "html":
+        return await store.ahtml(slug, section)
+    entry = await store.aget(slug)
+    return entry, entry.section(section) if section else entry.content
+
+
+async def load_work_content(slug: str, content_format: str = "markdown", section: Optional[str] = None) -> Dict[str, str]:
+    entry, body = await load_content_entry(slug, content_format, section)
+    return {"slug": entry.slug, "format": content_format, "content": body}
+
+
+def _windows(text: str, size: int, overlap: int) -> List[str]:
+    """Split ``text`` into pieces of at most ``size`` chars overlapping by about ``overlap``, cutting at whitespace."""
+    if len(text) <= size:
+        return [text]
+    pieces = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            cut = max(text.rfind(" ", start + size // 2, end), text.rfind("\n", start + size // 2, end))
+            if cut > start:
+                end = cut
+        pieces.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+        boundary = _WHITESPACE.search(text, start, end)
+        if boundary:
+            start = boundary.end()
+    return [piece for piece in pieces if piece]
+
+
+def chunk_passages(entry: ContentEntry, max_chars: int = 800, overlap: int = 200) -> List[Tuple[str, str]]:
+    """Split a document into overlapping ``(source, text)`` passages for the chat index.
+
+    Passages never cross a heading. Sources read ``{slug}#{section id}:{n}`` so a
+    client can fetch the surrounding section via ``?section=``. Each passage is
+    prefixed with the document title and section title for context.
+    """
+    text = entry.content
+    sections = entry.sections
+    title = sections[0].title if sections and sections[0].level == 1 else entry.slug
+    regions: List[Tuple[str, str, int, int]] = []
+    first_heading = sections[0].start if sections else len(text)
+    if first_heading > 0:
+        regions.append(("intro", "", 0, first_heading))
+    for position, section in enumerate(sections):
+        end = sections[position + 1].start if position + 1 < len(sections) else len(text)
+        regions.append((section.id, section.title, section.start, end))
+
+    passages = []
+    for section_id, section_title, start, end in regions:
+        body = text[start:end].strip()
+        if not body:
+            continue
+        label = f"{title} › {section_title}" if section_title and section_title != title else title
+        for number, piece in enumerate(_windows(body, max_chars, overlap)):
+            passages.append((f"{entry.slug}#{section_id}:{number}", f"{label}\n{piece}"))
+    return passages
+
+
+def section_table(entry: ContentEntry) -> List[Dict[str, object]]:
+    """Table of contents for a document: one record per heading, in document order."""
+    return [
+        {"id": section.id, "title": section.title, "level": section.level, "length": section.end - section.start}
+        for section in entry.sections
+    ]
+
+
+async def load_content_sections(slug: str) -> Dict[str, object]:
+    entry = await get_content_store().aget(slug)
+    return {"slug": entry.slug, "sections": section_table(entry)}
@@ -1,16 +1,179 @@
-"""Utility to load seed data for the API."""
+"""Utility to load seed data for the API.
 
+The seed is parsed, normalised and validated once at load time into a frozen
+snapshot: nested dicts become read-only ``FrozenDict`` records, lists become
+tuples, and timestamps become real ``datetime`` objects. Request handlers only
+ever read views of this snapshot. Reloads build a complete new snapshot and
+publish it with a single reference swap (see ``app.services.reload_service``).
+"""
+
+import hashlib
 import json
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, Optional
+
+from dateutil import parser, tz
+
+from app.models.schemas import (
+    AboutResponse,
+    AvailabilityResponse,
+    CertificationsResponse,
+    ContactChannels,
+    ExperienceItem,
+    Pillar,
+    SkillGroup,
+    WorkItem,
+)
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 DATA_PATH = BASE_DIR / "data" / "seed.json"
 
 
-def load_seed_data() -> dict[str, Any]:
-    with DATA_PATH.open("r", encoding="utf-8") as f:
-        return json.load(f)
+class FrozenDict(dict):
+    """A ``dict`` that rejects mutation.
+
+    Subclassing ``dict`` (rather than using ``MappingProxyType``) keeps snapshot
+    records directly usable by ``json.dumps`` and Pydantic without copying.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Seed snapshot is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to ``FrozenDict`` and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _parse_datetime(raw: Optional[str], zone_name: Optional[str] = None) -> Optional[datetime]:
+    if not raw:
+        return None
+    value = parser.isoparse(raw)
+    if zone_name and value.tzinfo is None:
+        value = value.replace(tzinfo=tz.gettz(zone_name))
+    return value
+
+
+def normalize_seed(raw: dict[str, Any]) -> FrozenDict:
+    """Parse timestamps, validate every section against the API schemas and freeze the result."""
+    data = json.loads(json.dumps(raw))  # private deep copy; the caller's dict is never touched
+    for item in data.get("experience", []):
+        item["period"]["start"] = _parse_datetime(item["period"]["start"])
+        item["period"]["end"] = _parse_datetime(item["period"].get("end"))
+    for cert in data.get("certifications", []):
+        cert["issued_at"] = _parse_datetime(cert["issued_at"])
+    availability = data.get("availability")
+    if availability:
+        zone_name = availability.get("time_zone", "UTC")
+        availability["generated_at"] = _parse_datetime(availability["generated_at"], zone_name)
+        availability["free"] = [
+            {"start": _parse_datetime(slot["start"], zone_name), "end": _parse_datetime(slot["end"], zone_name)}
+            for slot in availability["free"]
+        ]
+
+    AboutResponse.model_validate(data["about"])
+    for pillar in data["pillars"]:
+        Pillar.model_validate(pillar)
+    for work in data["work"]:
+        WorkItem.model_validate(work)
+    for item in data["experience"]:
+        ExperienceItem.model_validate(item)
+    for group in data["skills"]:
+        SkillGroup.model_validate(group)
+    CertificationsResponse.model_validate(
+        {"items": data["certifications"], "continuing_education": data.get("continuing_education", [])}
+    )
+    ContactChannels.model_validate(data["contact"]["channels"])
+    if availability:
+        AvailabilityResponse.model_validate(availability)
+    return freeze(data)
+
+
+# Collection name -> key field used to address single records
+INDEX_KEYS = {
+    "work": "slug",
+    "pillars": "id",
+    "skills": "id",
+    "experience": "id",
+    "certifications": "id",
+}
+
+
+def build_indexes(data: FrozenDict) -> FrozenDict:
+    """Build ``{collection: {key: record}}`` lookup tables, rejecting duplicate keys."""
+    indexes = {}
+    for collection, key_field in INDEX_KEYS.items():
+        index = {}
+        for record in data.get(collection, ()):
+            key = record[key_field]
+            if key in index:
+                raise ValueError(f"Duplicate {key_field} '{key}' in seed {collection}")
+            index[key] = record
+        indexes[collection] = FrozenDict(index)
+    return FrozenDict(indexes)
+
+
+class SeedSnapshot(NamedTuple):
+    """One immutable generation of seed data; replaced wholesale on reload."""
+
+    data: FrozenDict
+    indexes: FrozenDict
+    digest: str
+    version: int
+    loaded_at: datetime
+
+
+def build_snapshot(version: int = 1, path: Optional[Path] = None) -> SeedSnapshot:
+    """Read, normalise, validate and index the seed file into a new snapshot."""
+    raw = (path or DATA_PATH).read_bytes()
+    data = normalize_seed(json.loads(raw))
+    return SeedSnapshot(
+        data=data,
+        indexes=build_indexes(data),
+        digest=hashlib.sha256(raw).hexdigest()[:16],
+        version=version,
+        loaded_at=datetime.now(tz=timezone.utc),
+    )
+
+
+def load_seed_data() -> FrozenDict:
+    return build_snapshot().data
+
+
+_snapshot = build_snapshot()
+
+
+def get_snapshot() -> SeedSnapshot:
+    """Current snapshot. Callers should grab it once per operation for a consistent view."""
+    return _snapshot
+
+
+def swap_snapshot(snapshot: SeedSnapshot) -> SeedSnapshot:
+    """Atomically publish ``snapshot``; returns the one it replaced."""
+    global _snapshot
+    previous, _snapshot = _snapshot, snapshot
+    return previous
+
+
+def get_seed_version() -> str:
+    """Content hash of the loaded seed; changes whenever the data snapshot does."""
+    return _snapshot.digest
 
 
-SEED_DATA = load_seed_data()
+def __getattr__(name: str) -> Any:
+    # Backwards-compatible module attributes that always reflect the live snapshot
+    if name == "SEED_DATA":
+        return _snapshot.data
+    if name == "SEED_INDEXES":
+        return _snapshot.indexes
+    raise AttributeError(name)
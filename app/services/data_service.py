@@ -1,76 +1,74 @@
-"""Service functions backed by seed data."""
+"""Service functions backed by seed data.
 
-from __future__ import annotations
+Every getter returns a read-only view of the pre-normalised seed snapshot, so
+calls are O(1) and never re-parse or mutate shared state.
+"""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
 
-from dateutil import parser
+from typing import Any, Dict, Optional, Sequence
 
-from app.services.data_loader import SEED_DATA
+from app.services.data_loader import get_snapshot
 
 
 def get_about() -> Dict[str, Any]:
-    return SEED_DATA["about"]
+    return get_snapshot().data["about"]
+
 
+def get_pillars() -> Sequence[Dict[str, Any]]:
+    return get_snapshot().data["pillars"]
 
-def get_pillars() -> List[Dict[str, Any]]:
-    return SEED_DATA["pillars"]
 
+def get_pillar(pillar_id: str) -> Optional[Dict[str, Any]]:
+    return get_snapshot().indexes["pillars"].get(pillar_id)
 
-def get_work_items(limit: Optional[int] = None) -> List[Dict[str, Any]]:
-    items = SEED_DATA["work"]
+
+def get_work_items(limit: Optional[int] = None) -> Sequence[Dict[str, Any]]:
+    items = get_snapshot().data["work"]
     if limit:
         return items[:limit]
     return items
 
 
 def get_work_item(slug: str) -> Optional[Dict[str, Any]]:
-    return next((item for item in SEED_DATA["work"] if item["slug"] == slug), None)
+    return get_snapshot().indexes["work"].get(slug)
+
 
+def get_experience() -> Sequence[Dict[str, Any]]:
+    return get_snapshot().data["experience"]
 
-def get_experience() -> List[Dict[str, Any]]:
-    experience = SEED_DATA["experience"]
-    for item in experience:
-        item["period"]["start"] = parser.isoparse(item["period"]["start"]).isoformat()
-        if item["period"].get("end"):
-            item["period"]["end"] = parser.isoparse(item["period"]["end"]).isoformat()
-        else:
-            item["period"]["end"] = None
-    return experience
 
+def get_experience_item(experience_id: str) -> Optional[Dict[str, Any]]:
+    return get_snapshot().indexes["experience"].get(experience_id)
 
-def get_skills() -> List[Dict[str, Any]]:
-    return SEED_DATA["skills"]
+
+def get_skills() -> Sequence[Dict[str, Any]]:
+    return get_snapshot().data["skills"]
+
+
+def get_skill_group(group_id: str) -> Optional[Dict[str, Any]]:
+    return get_snapshot().indexes["skills"].get(group_id)
 
 
 def get_certifications() -> Dict[str, Any]:
-    certs = [
-        {
-            **cert,
-            "issued_at": parser.isoparse(cert["issued_at"]).isoformat(),
-        }
-        for cert in SEED_DATA["certifications"]
-    ]
+    data = get_snapshot().data
     return {
-        "items": certs,
-        "continuing_education": SEED_DATA.get("continuing_education", []),
+        "items": data["certifications"],
+        "continuing_education": data.get("continuing_education", ()),
     }
 
 
+def get_certification(certification_id: str) -> Optional[Dict[str, Any]]:
+    return get_snapshot().indexes["certifications"].get(certification_id)
+
+
 def get_contact_channels() -> Dict[str, Any]:
-    return SEED_DATA["contact"]["channels"]
+    return get_snapshot().data["contact"]["channels"]
 
 
 def get_availability() -> Dict[str, Any]:
-    data = SEED_DATA["availability"].copy()
-    data["generated_at"] = parser.isoparse(data["generated_at"]).isoformat()
-    data["free"] = [
-        {"start": parser.isoparse(slot["start"]).isoformat(), "end": parser.isoparse(slot["end"]).isoformat()}
-        for slot in data["free"]
-    ]
-    return data
+    return get_snapshot().data["availability"]
 
 
-def get_faq_entries() -> List[Dict[str, Any]]:
-    return SEED_DATA.get("faq", [])
+def get_faq_entries() -> Sequence[Dict[str, Any]]:
+    return get_snapshot().data.get("faq", ())
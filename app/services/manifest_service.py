@@ -0,0 +1,126 @@
+"""Parsed, versioned MCP tool manifest (``mcp.tools.json``).
+
+The file is read and parsed once; ``tools/list`` is answered from the normalised
+tool list and its pre-serialised JSON. The version is a hash of that JSON, so it
+only moves when the tool set clients see changes. The reload watcher re-reads the
+file when its fingerprint changes: a broken edit is reported and the previous
+manifest keeps serving, while a broken manifest at startup raises ``ManifestError``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from app.core.log_pipeline import get_log_pipeline
+from app.services.data_loader import BASE_DIR
+
+MANIFEST_PATH = BASE_DIR / "mcp.tools.json"
+
+
+def _dumps(value: Any) -> bytes:
+    # Same encoding as the JSON responses FastAPI renders
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class ManifestError(RuntimeError):
+    """Raised when the manifest cannot be read or is not a list of named tools."""
+
+
+class ToolManifest(NamedTuple):
+    version: str
+    entries: Tuple[Dict[str, Any], ...]
+    tools: Tuple[Dict[str, Any], ...]
+    tools_json: bytes
+    loaded_at: datetime
+
+    def render_list(self, req_id: Any, meta: Dict[str, Any]) -> bytes:
+        """Complete JSON-RPC ``tools/list`` response body, splicing in the pre-serialised tools."""
+        return b"".join(
+            (
+                b'{"jsonrpc":"2.0","id":',
+                _dumps(req_id),
+                b',"result":{"tools":',
+                self.tools_json,
+                b',"_meta":',
+                _dumps({"toolsVersion": self.version}),
+                b',"meta":',
+                _dumps(meta),
+                b"}}",
+            )
+        )
+
+
+def parse_manifest(raw: bytes) -> ToolManifest:
+    try:
+        entries = json.loads(raw)
+    except ValueError as exc:
+        raise ManifestError(f"mcp.tools.json is not valid JSON: {exc}") from None
+    if not isinstance(entries, list) or not all(
+        isinstance(entry, dict) and isinstance(entry.get("name"), str) and entry["name"] for entry in entries
+    ):
+        raise ManifestError("mcp.tools.json must be a list of tool objects with a 'name'.")
+    tools = tuple(
+        {"name": entry["name"], "description": entry.get("description"), "inputSchema": entry.get("input_schema", {})}
+        for entry in entries
+    )
+    tools_json = _dumps(list(tools))
+    return ToolManifest(
+        version=hashlib.sha256(tools_json).hexdigest()[:16],
+        entries=tuple(entries),
+        tools=tools,
+        tools_json=tools_json,
+        loaded_at=datetime.now(timezone.utc),
+    )
+
+
+class ManifestCache:
+    """Holds the current ``ToolManifest``; ``on_load`` may veto a new one by raising."""
+
+    def __init__(self, path: Path = MANIFEST_PATH, on_load: Optional[Callable[[ToolManifest], None]] = None) -> None:
+        self.path = path
+        self.on_load = on_load
+        self._current: Optional[ToolManifest] = None
+        self._listeners: Dict[str, Callable[[ToolManifest], None]] = {}
+        self.loads = 0
+        self.changes = 0
+
+    @property
+    def current(self) -> ToolManifest:
+        if self._current is None:
+            self.refresh()
+        assert self._current is not None
+        return self._current
+
+    def refresh(self) -> bool:
+        """Blocking: re-read the file; True when the tool set changed. Raises ``ManifestError`` on a bad file."""
+        try:
+            raw = self.path.read_bytes()
+        except OSError as exc:
+            raise ManifestError(f"Cannot read MCP tool manifest {self.path}: {exc}") from None
+        manifest = parse_manifest(raw)
+        self.loads += 1
+        previous = self._current
+        if previous is not None and previous.version == manifest.version:
+            return False
+        if self.on_load is not None:
+            self.on_load(manifest)
+        self._current = manifest
+        if previous is not None:
+            self.changes += 1
+            for name, listener in list(self._listeners.items()):
+                try:
+                    listener(manifest)
+                except Exception as exc:  # one subscriber must not block the others
+                    get_log_pipeline().emit({"event": "manifest_listener_failed", "listener": name, "error": str(exc)})
+        return True
+
+    def on_change(self, name: str, listener: Callable[[ToolManifest], None]) -> None:
+        """Register ``listener`` (keyed by ``name``) to run after a new tool set is published."""
+        self._listeners[name] = listener
+
+    def stats(self) -> Dict[str, int]:
+        return {"loads": self.loads, "changes": self.changes, "tools": len(self.current.tools)}
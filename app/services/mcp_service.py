@@ -1,48 +1,48 @@
 """Service for forwarding MCP-style requests to n8n or providing a local fallback."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, List
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import httpx
-from pathlib import Path
 import json
+import time
 
 from app.core.config import get_settings
+from app.core.log_pipeline import get_log_pipeline
+from app.core.metrics import get_metrics
+from app.core.tool_registry import ToolError, ToolRegistry
+from app.models.schemas import Certification, ExperienceItem, SkillGroup, WorkItem
 from app.services.data_service import (
     get_about,
     get_pillars,
+    get_pillar,
     get_work_items,
     get_work_item,
     get_experience,
+    get_experience_item,
     get_skills,
+    get_skill_group,
     get_certifications,
+    get_certification,
 )
 from app.services.availability_service import filter_availability
-from app.services.chat_service import answer_question
+from app.services.chat_service import answer_question_async, answer_questions_async
 from app.services.contact_service import submit_contact_message
-from app.services.content_service import get_work_content  # added
+from app.services.content_service import SectionNotFoundError, load_content_sections, load_work_content
 from app.services.time_service import get_current_time_gmt7  # new
+from app.services.manifest_service import MANIFEST_PATH, ManifestCache
+from app.services.mcp_session_service import get_session_manager, negotiate_protocol_version
+from app.services.pagination_service import InvalidListQuery, list_page
+from app.services.reload_service import on_file_change
 
 
-def _load_mcp_tools() -> List[Dict[str, Any]]:
-    # Load tool definitions from mcp.tools.json at repo root
-    try:
-        root = Path(__file__).resolve().parents[2]
-        manifest = root / "mcp.tools.json"
-        tools = json.loads(manifest.read_text(encoding="utf-8"))
-        # Normalize keys if needed (ensure inputSchema key)
-        normalized: List[Dict[str, Any]] = []
-        for t in tools:
-            normalized.append(
-                {
-                    "name": t.get("name"),
-                    "description": t.get("description"),
-                    "inputSchema": t.get("input_schema", {}),
-                }
-            )
-        return normalized
-    except Exception:
-        return []
+def _json_default(value: Any) -> str:
+    # Snapshot timestamps are datetime objects; keep the ISO format clients already see
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
 
 
 async def forward_mcp_request(payload: Dict[str, Any]) -> Tuple[bool, bool, Optional[Dict[str, Any]], Optional[str]]:
@@ -58,9 +58,12 @@ async def forward_mcp_request(payload: Dict[str, Any]) -> Tuple[bool, bool, Opti
         # Local echo fallback in dev/test
         return True, False, {"echo": payload}, None
 
+    start = time.perf_counter()
+    outcome = "error"
     try:
         async with httpx.AsyncClient(timeout=settings.n8n_mcp_timeout_seconds) as client:
             resp = await client.post(str(webhook), json=payload)
+            outcome = str(resp.status_code)
             resp.raise_for_status()
             # Try parse JSON; if not JSON, wrap text
             try:
@@ -70,77 +73,202 @@ async def forward_mcp_request(payload: Dict[str, Any]) -> Tuple[bool, bool, Opti
             return True, True, result, None
     except httpx.HTTPError as e:
         return False, True, None, str(e)
+    finally:
+        get_metrics().observe_webhook("mcp", outcome, time.perf_counter() - start)
+
+
+tools = ToolRegistry()
+
+
+@lru_cache()
+def get_tool_manifest() -> ManifestCache:
+    """Manifest loaded (and bound to the registry) once; raises if the file is broken or disagrees with the handlers."""
+    manifest = ManifestCache(MANIFEST_PATH, on_load=lambda loaded: tools.bind(loaded.entries))
+    manifest.refresh()
+    manifest.on_change(
+        "log", lambda loaded: get_log_pipeline().emit({"event": "mcp_tools_changed", "version": loaded.version})
+    )
+    manifest.on_change("mcp_sessions", lambda _: get_session_manager().wake_all())
+    return manifest
+
+
+def get_tool_registry() -> ToolRegistry:
+    get_tool_manifest()
+    return tools
+
+
+on_file_change("mcp_manifest", MANIFEST_PATH, lambda _: get_tool_manifest().refresh())
+
+
+@tools.tool("get_about")
+async def _get_about(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return {"about": get_about()}
+
+
+@tools.tool("list_pillars")
+async def _list_pillars(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return {"items": get_pillars()}
+
+
+def _item_tool(lookup: Callable[[str], Optional[Dict[str, Any]]], label: str):
+    async def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+        item = lookup(arguments["id"])
+        if not item:
+            raise ToolError("ERR_NOT_FOUND", f"{label} not found")
+        return {"item": item}
+
+    return handler
+
+
+# Single-record tools backed by the seed indexes
+tools.register("get_pillar", _item_tool(get_pillar, "Pillar"))
+tools.register("get_experience_item", _item_tool(get_experience_item, "Experience item"))
+tools.register("get_skill_group", _item_tool(get_skill_group, "Skill group"))
+tools.register("get_certification", _item_tool(get_certification, "Certification"))
+
+# List tools that accept ``cursor``/``limit``/``fields``: (cursor collection, items getter, item model)
+_LIST_TOOLS = {
+    "list_work": ("work", get_work_items, WorkItem),
+    "list_experience": ("experience", get_experience, ExperienceItem),
+    "list_skills": ("skills", get_skills, SkillGroup),
+    "list_certifications": ("certifications", lambda: get_certifications()["items"], Certification),
+}
+
+
+def _list_tool(name: str, full: Callable[[], Dict[str, Any]], extra: Optional[Callable[[], Dict[str, Any]]] = None):
+    collection, items, item_model = _LIST_TOOLS[name]
+
+    async def handler(arguments: Dict[str, Any]) -> Dict[str, Any]:
+        # Without paging arguments the tool keeps returning the whole collection
+        if all(arguments.get(key) is None for key in ("cursor", "limit", "fields")):
+            return full()
+        try:
+            page = list_page(collection, items(), item_model, arguments)
+        except InvalidListQuery as exc:
+            raise ToolError("ERR_BAD_REQUEST", str(exc)) from None
+        if extra is not None:
+            page.update(extra())
+        return page
+
+    return handler
+
+
+tools.register("list_work", _list_tool("list_work", lambda: {"items": get_work_items()}))
+tools.register("list_experience", _list_tool("list_experience", lambda: {"items": get_experience()}))
+tools.register("list_skills", _list_tool("list_skills", lambda: {"items": get_skills()}))
+tools.register(
+    "list_certifications",
+    _list_tool(
+        "list_certifications",
+        get_certifications,
+        lambda: {"continuing_education": get_certifications()["continuing_education"]},
+    ),
+)
+
+
+@tools.tool("get_work")
+async def _get_work(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    item = get_work_item(arguments["slug"])
+    if not item:
+        raise ToolError("ERR_NOT_FOUND", "Work item not found")
+    return {"item": item}
+
+
+@tools.tool("get_work_content")
+async def _get_work_content(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        content = await load_work_content(arguments["slug"], arguments.get("format") or "markdown", arguments.get("section"))
+    except ValueError as exc:
+        raise ToolError("ERR_BAD_REQUEST", str(exc)) from None
+    except SectionNotFoundError:
+        raise ToolError("ERR_NOT_FOUND", "Section not found") from None
+    except FileNotFoundError:
+        raise ToolError("ERR_NOT_FOUND", "Content not found") from None
+    return {"content": content}
+
+
+@tools.tool("get_work_content_sections")
+async def _get_work_content_sections(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return await load_content_sections(arguments["slug"])
+    except FileNotFoundError:
+        raise ToolError("ERR_NOT_FOUND", "Content not found") from None
+
+
+@tools.tool("get_availability")
+async def _get_availability(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return filter_availability(arguments.get("range"))
+
+
+@tools.tool("get_current_time_gmt7")
+async def _get_current_time_gmt7(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    return {"now": get_current_time_gmt7()}
 
 
-async def _execute_local_tool(name: str, arguments: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+@tools.tool("send_contact_message")
+async def _send_contact_message(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    if any(not arguments[key] for key in ("name", "email", "message")):
+        raise ToolError("ERR_BAD_REQUEST", "name, email, message required")
+    ticket_id = await submit_contact_message(
+        {
+            "name": arguments["name"],
+            "email": arguments["email"],
+            "message": arguments["message"],
+            "ip": None,
+        }
+    )
+    return {"ticket_id": ticket_id}
+
+
+@tools.tool("ask_portfolio_bot")
+async def _ask_portfolio_bot(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    if not arguments["question"]:
+        raise ToolError("ERR_BAD_REQUEST", "Missing 'question'")
+    answer, sources, suggestions, events = await answer_question_async(
+        arguments["question"], arguments.get("audience") or "general", arguments.get("mode") or "lexical"
+    )
+    return {"answer": answer, "sources": sources, "suggestions": suggestions, "events": events}
+
+
+@tools.tool("ask_portfolio_bot_batch")
+async def _ask_portfolio_bot_batch(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    answers = await answer_questions_async(
+        arguments["questions"], arguments.get("audience") or "general", arguments.get("mode") or "lexical"
+    )
+    return {
+        "results": [
+            {"answer": answer, "sources": sources, "suggestions": suggestions, "events": events}
+            for answer, sources, suggestions, events in answers
+        ]
+    }
+
+
+@tools.tool("mcp_execute")
+async def _mcp_execute(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    # Same generic forwarding as the simple (non JSON-RPC) form of POST /v1/mcp/execute
+    ok, forwarded, result, error = await forward_mcp_request(
+        {"tool": arguments["tool"], "params": arguments.get("params") or {}, "context": arguments.get("context") or {}}
+    )
+    if not ok:
+        raise ToolError("ERR_UPSTREAM", error or "Upstream error.")
+    return {"forwarded": forwarded, "result": result or {}}
+
+
+async def _execute_local_tool(name: str, arguments: Any) -> Tuple[bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
-    Execute known tools locally using internal services.
+    Validate the arguments against the tool's manifest schema and run its handler.
     Returns (ok, result, error)
     """
-    try:
-        if name == "get_about":
-            return True, {"about": get_about()}, None
-        if name == "list_pillars":
-            return True, {"items": get_pillars()}, None
-        if name == "list_work":
-            limit = arguments.get("limit")
-            return True, {"items": get_work_items(limit=limit)}, None
-        if name == "get_work":
-            slug = arguments.get("slug")
-            if not slug:
-                return False, None, {"code": "ERR_BAD_REQUEST", "message": "Missing 'slug'"}
-            item = get_work_item(slug)
-            if not item:
-                return False, None, {"code": "ERR_NOT_FOUND", "message": "Work item not found"}
-            return True, {"item": item}, None
-        if name == "get_work_content":
-            slug = arguments.get("slug")
-            if not slug:
-                return False, None, {"code": "ERR_BAD_REQUEST", "message": "Missing 'slug'"}
-            try:
-                content = get_work_content(slug)
-            except FileNotFoundError:
-                return False, None, {"code": "ERR_NOT_FOUND", "message": "Content not found"}
-            return True, {"content": content}, None
-        if name == "list_experience":
-            return True, {"items": get_experience()}, None
-        if name == "list_skills":
-            return True, {"items": get_skills()}, None
-        if name == "list_certifications":
-            return True, get_certifications(), None
-        if name == "get_availability":
-            range_param = arguments.get("range")
-            return True, filter_availability(range_param), None
-        if name == "get_current_time_gmt7":
-            # No arguments required
-            return True, {"now": get_current_time_gmt7()}, None
-        if name == "send_contact_message":
-            required = ["name", "email", "message"]
-            if any(not arguments.get(k) for k in required):
-                return False, None, {"code": "ERR_BAD_REQUEST", "message": "name, email, message required"}
-            ticket_id = await submit_contact_message(
-                {
-                    "name": arguments.get("name"),
-                    "email": arguments.get("email"),
-                    "message": arguments.get("message"),
-                    "ip": None,
-                }
-            )
-            return True, {"ticket_id": ticket_id}, None
-        if name == "ask_portfolio_bot":
-            question = arguments.get("question")
-            if not question:
-                return False, None, {"code": "ERR_BAD_REQUEST", "message": "Missing 'question'"}
-            audience = arguments.get("audience") or "general"
-            answer, sources, suggestions, events = answer_question(question, audience)
-            return True, {
-                "answer": answer,
-                "sources": sources,
-                "suggestions": suggestions,
-                "events": events,
-            }, None
-        # Unknown tool
+    tool = get_tool_registry().get(name)
+    if tool is None:
         return False, None, {"code": "ERR_NOT_FOUND", "message": f"Tool '{name}' not found"}
+    errors = tool.validate(arguments, "")
+    if errors:
+        return False, None, {"code": "ERR_BAD_REQUEST", "message": "; ".join(errors)}
+    try:
+        return True, await tool.handler(arguments), None
+    except ToolError as e:
+        return False, None, {"code": e.code, "message": e.message}
     except Exception as e:
         return False, None, {"code": "ERR_INTERNAL", "message": str(e)}
 
@@ -166,23 +294,30 @@ async def forward_jsonrpc_to_n8n(payload: Dict[str, Any]) -> Tuple[bool, bool, O
                 "jsonrpc": "2.0",
                 "id": req_id,
                 "result": {
-                    "protocolVersion": params.get("protocolVersion", "2025-03-26"),
-                    "capabilities": {"tools": {}},
+                    "protocolVersion": negotiate_protocol_version(params.get("protocolVersion")),
+                    # Sessions with a GET event stream are told when the tool list changes
+                    "capabilities": {"tools": {"listChanged": True}},
                     "serverInfo": {"name": "Kane Portfolio MCP", "version": settings.app_version},
+                    # Clients holding a tool list with this version can skip tools/list
+                    "_meta": {"toolsVersion": get_tool_manifest().current.version},
                 },
             }, None
         if method == "tools/list":
-            tools = _load_mcp_tools()
+            manifest = get_tool_manifest().current
             return True, False, {
                 "jsonrpc": "2.0",
                 "id": req_id,
-                "result": {"tools": tools},
+                "result": {"tools": manifest.tools, "_meta": {"toolsVersion": manifest.version}},
             }, None
         if method == "tools/call":
             params = payload.get("params") or {}
             name = params.get("name")
             arguments = params.get("arguments") or {}
+            start = time.perf_counter()
             ok, result, err = await _execute_local_tool(name, arguments)
+            # Client-supplied names would each add a permanent series; only registered tools get their own label
+            label = name if get_tool_registry().get(name) is not None else "unknown"
+            get_metrics().observe_tool_call(label, "ok" if ok else (err or {}).get("code", "error"), time.perf_counter() - start)
             if not ok:
                 # Map to JSON-RPC error codes
                 code = -32602 if err and err.get("code") == "ERR_BAD_REQUEST" else -32601 if err and err.get("code") == "ERR_NOT_FOUND" else -32000
@@ -193,8 +328,7 @@ async def forward_jsonrpc_to_n8n(payload: Dict[str, Any]) -> Tuple[bool, bool, O
                 }, None
             # Format as MCP content array (text)
             try:
-                import json as _json
-                text_content = _json.dumps(result, ensure_ascii=False, default=str)
+                text_content = json.dumps(result, ensure_ascii=False, default=_json_default)
             except Exception:
                 text_content = str(result)
             return True, False, {
@@ -217,9 +351,12 @@ async def forward_jsonrpc_to_n8n(payload: Dict[str, Any]) -> Tuple[bool, bool, O
         }, None
 
     # Webhook configured: pass-through
+    start = time.perf_counter()
+    outcome = "error"
     try:
         async with httpx.AsyncClient(timeout=settings.n8n_mcp_timeout_seconds) as client:
             resp = await client.post(str(webhook), json=payload)
+            outcome = str(resp.status_code)
             resp.raise_for_status()
             # Return upstream JSON as-is if possible
             try:
@@ -230,3 +367,5 @@ async def forward_jsonrpc_to_n8n(payload: Dict[str, Any]) -> Tuple[bool, bool, O
             return True, True, result, None
     except httpx.HTTPError as e:
         return False, True, None, str(e)
+    finally:
+        get_metrics().observe_webhook("mcp_jsonrpc", outcome, time.perf_counter() - start)
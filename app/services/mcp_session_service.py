@@ -0,0 +1,224 @@
+"""Sessions for the MCP Streamable HTTP transport (protocol 2025-03-26).
+
+``initialize`` opens a session and the server returns its id in the
+``Mcp-Session-Id`` header. The session records the negotiated protocol version,
+the client's capabilities and the version of the tool list the client last
+received. Clients that resend the header can keep one session for a whole agent
+run instead of re-initialising and re-listing tools.
+
+Sessions live in a bounded LRU. Idle sessions expire after ``ttl_seconds``, and
+the oldest are evicted when either the session count or the estimated memory
+(``max_bytes``) goes over its limit. A session can hold one ``GET`` event
+stream, which delivers ``notifications/tools/list_changed`` when the manifest
+changes under it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+from app.core.config import get_settings
+from app.services.manifest_service import ManifestCache
+
+SUPPORTED_PROTOCOL_VERSIONS = ("2025-03-26", "2024-11-05")
+
+# Server -> client message telling MCP clients to call tools/list again
+TOOLS_LIST_CHANGED: Dict[str, Any] = {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+
+# Rough fixed cost of one session object and its dict slot, on top of the client-supplied strings
+SESSION_OVERHEAD_BYTES = 1024
+_MAX_FIELD_CHARS = 256
+
+
+def negotiate_protocol_version(requested: Any) -> str:
+    """Echo a supported requested version, otherwise offer the latest one we speak."""
+    return requested if requested in SUPPORTED_PROTOCOL_VERSIONS else SUPPORTED_PROTOCOL_VERSIONS[0]
+
+
+def progress_notification(token: Any, progress: int, total: int, message: str) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "method": "notifications/progress",
+        "params": {"progressToken": token, "progress": progress, "total": total, "message": message},
+    }
+
+
+class McpSession:
+    def __init__(
+        self,
+        session_id: str,
+        protocol_version: str,
+        client_info: Mapping[str, Any],
+        client_capabilities: Mapping[str, Any],
+    ) -> None:
+        self.id = session_id
+        self.protocol_version = protocol_version
+        # Only bounded strings are kept, so a client cannot inflate its own session
+        self.client_name = str(client_info.get("name") or "")[:_MAX_FIELD_CHARS]
+        self.client_version = str(client_info.get("version") or "")[:_MAX_FIELD_CHARS]
+        self.client_capabilities: Tuple[str, ...] = tuple(
+            sorted(str(key)[:_MAX_FIELD_CHARS] for key in client_capabilities)
+        )[:32]
+        self.tools_version: Optional[str] = None
+        self.created_at = self.last_seen = time.monotonic()
+        self._stream: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+
+    @property
+    def size(self) -> int:
+        return (
+            SESSION_OVERHEAD_BYTES
+            + len(self.id)
+            + len(self.client_name)
+            + len(self.client_version)
+            + sum(len(key) for key in self.client_capabilities)
+        )
+
+    def attach_stream(self) -> asyncio.Event:
+        """Bind the session's server -> client stream to the calling loop; a newer stream replaces an older one."""
+        event = asyncio.Event()
+        self._stream = (asyncio.get_running_loop(), event)
+        return event
+
+    def detach_stream(self, event: asyncio.Event) -> None:
+        if self._stream is not None and self._stream[1] is event:
+            self._stream = None
+
+    def has_stream(self, event: asyncio.Event) -> bool:
+        return self._stream is not None and self._stream[1] is event
+
+    def wake(self) -> None:
+        """Wake the attached stream; safe to call from any thread."""
+        if self._stream is None:
+            return
+        loop, event = self._stream
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:  # the loop is gone; the stream died with it
+            self._stream = None
+
+    def pending(self, manifest: ManifestCache) -> List[Dict[str, Any]]:
+        """Notifications owed to this client; marks them delivered."""
+        current = manifest.current.version
+        if self.tools_version is not None and self.tools_version != current:
+            self.tools_version = current
+            return [TOOLS_LIST_CHANGED]
+        return []
+
+
+class SessionManager:
+    def __init__(self, ttl_seconds: float = 1800.0, max_entries: int = 1000, max_bytes: int = 4 * 1024 * 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sessions: "OrderedDict[str, McpSession]" = OrderedDict()
+        self._bytes = 0
+        self.created = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def create(
+        self, protocol_version: str, client_info: Mapping[str, Any], client_capabilities: Mapping[str, Any]
+    ) -> McpSession:
+        session = McpSession(secrets.token_urlsafe(24), protocol_version, client_info or {}, client_capabilities or {})
+        self._sessions[session.id] = session
+        self._bytes += session.size
+        self.created += 1
+        self.sweep()
+        while len(self._sessions) > 1 and (len(self._sessions) > self.max_entries or self._bytes > self.max_bytes):
+            self._remove(next(iter(self._sessions.values())))
+            self.evictions += 1
+        return session
+
+    def get(self, session_id: Optional[str]) -> Optional[McpSession]:
+        """Live session for ``session_id`` (refreshing its idle timer), or None when unknown or expired."""
+        session = self._sessions.get(session_id) if session_id else None
+        if session is None:
+            return None
+        now = time.monotonic()
+        if now - session.last_seen > self.ttl_seconds:
+            self._remove(session)
+            self.expired += 1
+            return None
+        session.last_seen = now
+        self._sessions.move_to_end(session.id)
+        return session
+
+    def close(self, session_id: Optional[str]) -> bool:
+        session = self._sessions.get(session_id) if session_id else None
+        if session is None:
+            return False
+        self._remove(session)
+        return True
+
+    def _remove(self, session: McpSession) -> None:
+        if self._sessions.pop(session.id, None) is not None:
+            self._bytes -= session.size
+            session.wake()
+
+    def sweep(self) -> None:
+        """Drop idle sessions; the LRU order means expired ones are at the front."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_seen >= cutoff:
+                break
+            self._remove(session)
+            self.expired += 1
+
+    def wake_all(self) -> None:
+        for session in list(self._sessions.values()):
+            session.wake()
+
+    async def run_sweeper(self, interval_seconds: float) -> None:
+        """Background task expiring idle sessions every ``interval_seconds``."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.sweep()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._sessions),
+            "bytes": self._bytes,
+            "created": self.created,
+            "expired": self.expired,
+            "evictions": self.evictions,
+        }
+
+
+async def session_events(
+    manager: SessionManager, session: McpSession, manifest: ManifestCache, keepalive_seconds: float = 15.0
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """Messages for a session's ``GET`` stream; ``None`` means "send a keepalive".
+
+    Ends when the session is closed or expires, or when a newer stream replaces this one.
+    """
+    event = session.attach_stream()
+    try:
+        while True:
+            for message in session.pending(manifest):
+                yield message
+            try:
+                await asyncio.wait_for(event.wait(), keepalive_seconds)
+                event.clear()
+            except asyncio.TimeoutError:
+                yield None
+            # An open stream counts as activity, so this also keeps the session alive
+            if not session.has_stream(event) or manager.get(session.id) is None:
+                return
+    finally:
+        session.detach_stream(event)
+
+
+@lru_cache()
+def get_session_manager() -> SessionManager:
+    settings = get_settings()
+    return SessionManager(
+        ttl_seconds=settings.mcp_session_ttl_seconds,
+        max_entries=settings.mcp_session_max_entries,
+        max_bytes=settings.mcp_session_max_bytes,
+    )
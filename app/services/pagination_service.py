@@ -0,0 +1,123 @@
+"""Cursor pagination and sparse fieldsets for list endpoints and MCP list tools.
+
+Cursors are opaque, URL-safe tokens that encode the collection and the offset of
+the next page. Field projection happens on the raw snapshot records before any
+model is built, so omitted fields are never validated or encoded.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel, create_model
+
+
+class InvalidListQuery(ValueError):
+    """Raised for malformed cursors or unknown field names."""
+
+
+def encode_cursor(collection: str, offset: int) -> str:
+    raw = json.dumps({"c": collection, "o": offset}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(collection: str, cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        offset = payload["o"]
+        if payload["c"] != collection or not isinstance(offset, int) or offset < 0:
+            raise ValueError
+    except (ValueError, KeyError, TypeError):
+        raise InvalidListQuery("Invalid cursor.") from None
+    return offset
+
+
+def parse_fields(raw: Union[None, str, Iterable[str]], allowed: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """Normalise ``fields`` (comma-separated string or list) to a sorted tuple of known names."""
+    if raw is None:
+        return None
+    names = raw.split(",") if isinstance(raw, str) else list(raw)
+    fields = tuple(sorted({name.strip() for name in names if name and name.strip()}))
+    if not fields:
+        return None
+    unknown = [name for name in fields if name not in set(allowed)]
+    if unknown:
+        raise InvalidListQuery(f"Unknown field(s): {', '.join(unknown)}.")
+    return fields
+
+
+def paginate(
+    collection: str, items: Sequence[Any], cursor: Optional[str], limit: Optional[int]
+) -> Tuple[Sequence[Any], Optional[str]]:
+    """Slice ``items`` starting at ``cursor``; return the page and the cursor for the next one."""
+    start = decode_cursor(collection, cursor) if cursor else 0
+    if start > len(items):
+        raise InvalidListQuery("Cursor is past the end of the collection.")
+    end = len(items) if not limit else min(start + limit, len(items))
+    next_cursor = encode_cursor(collection, end) if end < len(items) else None
+    return items[start:end], next_cursor
+
+
+def project(items: Iterable[Mapping[str, Any]], fields: Optional[Tuple[str, ...]]) -> List[Mapping[str, Any]]:
+    """Keep only ``fields`` of each record (all of them when ``fields`` is None)."""
+    if not fields:
+        return list(items)
+    return [{name: item[name] for name in fields if name in item} for item in items]
+
+
+@lru_cache(maxsize=128)
+def partial_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """A model with only ``fields`` of ``model``, reusing their types and serialisers."""
+    definitions: Dict[str, Any] = {
+        name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields
+    }
+    return create_model(f"{model.__name__}Fields", **definitions)
+
+
+@lru_cache(maxsize=128)
+def page_model(
+    list_model: Type[BaseModel], item_model: Type[BaseModel], fields: Optional[Tuple[str, ...]]
+) -> Type[BaseModel]:
+    """``list_model`` with its ``items`` narrowed to ``fields`` and a ``next_cursor`` added."""
+    item = partial_model(item_model, fields) if fields else item_model
+    return create_model(
+        f"{list_model.__name__}Page",
+        __base__=list_model,
+        items=(List[item], ...),  # type: ignore[valid-type]
+        next_cursor=(Optional[str], None),
+    )
+
+
+def render_page(
+    collection: str,
+    items: Sequence[Mapping[str, Any]],
+    list_model: Type[BaseModel],
+    item_model: Type[BaseModel],
+    cursor: Optional[str],
+    limit: Optional[int],
+    fields: Union[None, str, Iterable[str]],
+    **extra: Any,
+) -> BaseModel:
+    """Build a paginated, projected list response for REST endpoints."""
+    selected = parse_fields(fields, item_model.model_fields)
+    page, next_cursor = paginate(collection, items, cursor, limit)
+    return page_model(list_model, item_model, selected)(items=project(page, selected), next_cursor=next_cursor, **extra)
+
+
+def list_page(
+    collection: str,
+    items: Sequence[Mapping[str, Any]],
+    item_model: Type[BaseModel],
+    arguments: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """Paginated, projected raw records for MCP tools (``cursor``, ``limit``, ``fields`` arguments)."""
+    limit = arguments.get("limit")
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+        raise InvalidListQuery("'limit' must be a positive integer.")
+    selected = parse_fields(arguments.get("fields"), item_model.model_fields)
+    page, next_cursor = paginate(collection, items, arguments.get("cursor"), limit)
+    return {"items": project(page, selected), "next_cursor": next_cursor}
@@ -0,0 +1,164 @@
+"""Client for an external retrieval (RAG) backend configured via ``RAG_ENDPOINT``.
+
+The upstream receives ``POST {"question", "audience", "top_k"}`` and answers
+``{"passages": [{"source": str, "text": str}, ...]}``. Every call is bounded by
+a deadline and a concurrency cap, may be hedged with a second request when the
+first is slow, and returns ``None`` on any failure so the chat falls back to the
+local index instead of waiting on one remote hop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.metrics import get_metrics
+
+Passages = List[Tuple[str, str]]
+
+
+class RagClient:
+    def __init__(
+        self,
+        endpoint: Optional[str],
+        timeout_seconds: float = 1.5,
+        max_concurrency: int = 16,
+        hedge_after_seconds: float = 0.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.timeout_seconds = timeout_seconds
+        self.max_concurrency = max_concurrency
+        self.hedge_after_seconds = hedge_after_seconds
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.requests = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.hedges = 0
+        self.shed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.endpoint)
+
+    async def start(self) -> None:
+        """Open the pooled client and its concurrency cap; called from the app lifespan."""
+        if self.enabled and self._client is None:
+            self._loop = asyncio.get_running_loop()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+                transport=self.transport,
+            )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _rebind(self) -> None:
+        """Replace a pool opened on another loop (scripts, tests) with one bound to the running loop."""
+        stale, stale_loop = self._client, self._loop
+        self._client = None
+        if stale is not None:
+            if stale_loop is not None and stale_loop.is_running():
+                # Its connections belong to that loop, so close them there
+                asyncio.run_coroutine_threadsafe(stale.aclose(), stale_loop)
+            else:
+                with suppress(Exception):  # the loop is gone; release whatever can still be released
+                    await stale.aclose()
+        await self.start()
+
+    async def _request(self, payload: Dict[str, Any]) -> Passages:
+        assert self._client is not None
+        response = await self._client.post(str(self.endpoint), json=payload)
+        response.raise_for_status()
+        passages = response.json()["passages"]
+        return [(str(item["source"]), str(item["text"])) for item in passages]
+
+    async def _hedged(self, payload: Dict[str, Any]) -> Passages:
+        """Send the request; if it is still pending after ``hedge_after_seconds``, race a second one."""
+        if not self.hedge_after_seconds:
+            return await self._request(payload)
+        tasks = [asyncio.ensure_future(self._request(payload))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_after_seconds)
+            if not done:
+                self.hedges += 1
+                tasks.append(asyncio.ensure_future(self._request(payload)))
+            error: Optional[BaseException] = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def retrieve(self, question: str, audience: str, top_k: int = 3, shed: bool = True) -> Optional[Passages]:
+        """Passages from the upstream, or ``None`` when disabled, saturated, slow or failing.
+
+        Batch callers pass ``shed=False`` to wait for a free slot instead of falling back when saturated.
+        """
+        if not self.enabled:
+            return None
+        if self._client is None or self._loop is not asyncio.get_running_loop():
+            # Used outside the lifespan (scripts, tests): open a pool bound to the current loop
+            await self._rebind()
+        if shed and self._semaphore.locked():
+            # Queueing behind a saturated upstream only adds latency; answer locally instead
+            self.shed += 1
+            return None
+        payload = {"question": question, "audience": audience, "top_k": top_k}
+        self.requests += 1
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            async with self._semaphore:
+                passages = await asyncio.wait_for(self._hedged(payload), self.timeout_seconds)
+            outcome = "ok"
+            return passages or None
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            outcome = "timeout"
+            return None
+        except (httpx.HTTPError, ValueError, KeyError, TypeError):
+            self.failures += 1
+            return None
+        finally:
+            get_metrics().observe_webhook("rag", outcome, time.perf_counter() - start)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "hedges": self.hedges,
+            "shed": self.shed,
+        }
+
+
+@lru_cache()
+def get_rag_client() -> RagClient:
+    settings = get_settings()
+    return RagClient(
+        endpoint=settings.rag_endpoint,
+        timeout_seconds=settings.rag_timeout_seconds,
+        max_concurrency=settings.rag_max_concurrency,
+        hedge_after_seconds=settings.rag_hedge_after_seconds,
+    )
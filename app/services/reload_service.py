@@ -0,0 +1,183 @@
+"""Hot reload of seed data and long-form content without restarting workers.
+
+A cheap polling watcher (or the admin endpoint) compares file fingerprints. When
+``seed.json`` changes, a new snapshot is parsed and validated in a worker thread,
+then published on the event-loop thread with an atomic reference swap; dependents
+rebuild their derived structures through registered hooks on that same thread,
+because they clear caches the request path reads without locks. Content (markdown) changes only fire
+the content hooks with the slugs that changed. Other files (such as the MCP tool
+manifest) can be watched individually with ``on_file_change``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.log_pipeline import get_log_pipeline
+from app.services import data_loader
+from app.services.data_loader import SeedSnapshot
+
+CONTENT_DIR = data_loader.BASE_DIR / "data" / "content" / "work"
+
+Fingerprint = Tuple[int, int]
+
+_seed_hooks: Dict[str, Callable[[SeedSnapshot], None]] = {}
+_content_hooks: Dict[str, Callable[[List[str]], None]] = {}
+_file_hooks: Dict[str, Tuple[Path, Callable[[Path], None]]] = {}
+_lock = threading.Lock()
+# Serialises reloads started by the watcher and the admin endpoint
+_reload_lock = asyncio.Lock()
+
+
+def on_seed_reload(name: str, hook: Callable[[SeedSnapshot], None]) -> None:
+    """Register ``hook`` (keyed by ``name`` so re-registration replaces it) to run after each snapshot swap."""
+    _seed_hooks[name] = hook
+
+
+def on_content_change(name: str, hook: Callable[[List[str]], None]) -> None:
+    """Register ``hook`` to run with the slugs whose markdown changed."""
+    _content_hooks[name] = hook
+
+
+def on_file_change(name: str, path: Path, hook: Callable[[Path], None]) -> None:
+    """Register ``hook`` to run with ``path`` whenever that file's fingerprint changes."""
+    _file_hooks[name] = (path, hook)
+    _file_prints[name] = _fingerprint(path)
+
+
+def _fingerprint(path: Path) -> Optional[Fingerprint]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _content_fingerprints() -> Dict[str, Fingerprint]:
+    prints: Dict[str, Fingerprint] = {}
+    for path in CONTENT_DIR.glob("*.md"):
+        fingerprint = _fingerprint(path)
+        if fingerprint is not None:
+            prints[path.stem] = fingerprint
+    return prints
+
+
+_seed_print: Optional[Fingerprint] = _fingerprint(data_loader.DATA_PATH)
+_content_prints: Dict[str, Fingerprint] = _content_fingerprints()
+_file_prints: Dict[str, Optional[Fingerprint]] = {}
+
+
+def _run_hooks(hooks: Dict[str, Callable[[Any], None]], argument: Any) -> List[str]:
+    failed = []
+    for name, hook in list(hooks.items()):
+        try:
+            hook(argument)
+        except Exception as exc:  # a broken dependent must not block the swap
+            failed.append(name)
+            get_log_pipeline().emit({"event": "reload_hook_failed", "hook": name, "error": str(exc)})
+    return failed
+
+
+class _Plan(NamedTuple):
+    snapshot: Optional[SeedSnapshot]
+    content_changed: List[str]
+    files_changed: List[Tuple[str, Path, Callable[[Path], None]]]
+
+
+def _prepare(force: bool) -> _Plan:
+    """Blocking half of a reload: compare fingerprints and parse and validate a changed seed.
+
+    Raises ``ValueError`` (including JSON decode errors) when the new seed is invalid
+    or cannot be read (missing, mid-rename, not UTF-8).
+    """
+    global _seed_print, _content_prints
+    with _lock:
+        seed_print = _fingerprint(data_loader.DATA_PATH)
+        content_prints = _content_fingerprints()
+        snapshot = None
+
+        if force or seed_print != _seed_print:
+            current = data_loader.get_snapshot()
+            try:
+                snapshot = data_loader.build_snapshot(version=current.version + 1)
+            except (KeyError, TypeError, UnicodeDecodeError) as exc:
+                raise ValueError(f"Invalid seed data: {exc!r}") from exc
+            except OSError as exc:
+                raise ValueError(f"Cannot read seed data: {exc}") from exc
+            finally:
+                # Don't retry the same broken file on every poll; the next edit triggers a new attempt
+                _seed_print = seed_print
+
+        changed = sorted(
+            slug
+            for slug in set(content_prints) | set(_content_prints)
+            if force or content_prints.get(slug) != _content_prints.get(slug)
+        )
+        _content_prints = content_prints
+
+        files_changed = []
+        for name, (path, hook) in list(_file_hooks.items()):
+            file_print = _fingerprint(path)
+            if force or file_print != _file_prints.get(name):
+                _file_prints[name] = file_print
+                files_changed.append((name, path, hook))
+        return _Plan(snapshot, changed, files_changed)
+
+
+def _apply(plan: _Plan) -> Dict[str, Any]:
+    """Publish a prepared reload: swap the snapshot and run the hooks.
+
+    The hooks clear caches the request path reads without locks, so when the app is
+    serving this must run on the event-loop thread (``reload_async`` does that).
+    """
+    failed_hooks: List[str] = []
+    if plan.snapshot is not None:
+        data_loader.swap_snapshot(plan.snapshot)
+        failed_hooks += _run_hooks(_seed_hooks, plan.snapshot)
+    if plan.content_changed:
+        failed_hooks += _run_hooks(_content_hooks, plan.content_changed)
+    for name, path, hook in plan.files_changed:
+        failed_hooks += _run_hooks({name: hook}, path)
+
+    snapshot = data_loader.get_snapshot()
+    return {
+        "version": snapshot.version,
+        "digest": snapshot.digest,
+        "loaded_at": snapshot.loaded_at,
+        "seed_reloaded": plan.snapshot is not None,
+        "content_changed": plan.content_changed,
+        "files_changed": [name for name, _, _ in plan.files_changed],
+        "failed_hooks": failed_hooks,
+    }
+
+
+def reload_now(force: bool = False) -> Dict[str, Any]:
+    """Reload whatever changed on disk (everything when ``force``) on the calling thread.
+
+    For scripts and tests; a running app uses ``reload_async``. Raises ``ValueError``
+    when the new seed is invalid; the previous snapshot keeps serving in that case.
+    """
+    return _apply(_prepare(force))
+
+
+async def reload_async(force: bool = False) -> Dict[str, Any]:
+    """Parse off the loop, then swap and run the hooks on the loop thread."""
+    async with _reload_lock:
+        plan = await asyncio.to_thread(_prepare, force)
+        return _apply(plan)
+
+
+async def run_watcher(interval_seconds: float) -> None:
+    """Background task polling file fingerprints every ``interval_seconds``."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            result = await reload_async()
+        except Exception as exc:  # one bad poll must not end hot reload for good
+            get_log_pipeline().emit({"event": "seed_reload_failed", "error": str(exc)})
+            continue
+        if result["seed_reloaded"] or result["content_changed"] or result["files_changed"]:
+            get_log_pipeline().emit({"event": "seed_reloaded", **result})
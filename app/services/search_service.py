@@ -0,0 +1,182 @@
+"""Retrieval for the portfolio chat: tokenisation, a BM25 inverted index and a dense TF-IDF matrix.
+
+Both indexes are built once per corpus version. Because BM25's per-term,
+per-document contribution does not depend on the query, each posting stores its
+final weight; answering a query is then a walk over the query terms' postings
+and a heap top-k. The dense index scores with one matrix-vector product (or one
+matrix multiply for a batch of questions) and ``argpartition`` for top-k.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+STOPWORDS = frozenset(
+    """
+    a about above after again all also am an and any are as at be because been before being below between both
+    but by can could did do does doing down during each few for from further had has have having he her here hers
+    him his how i if in into is it its itself just me more most my no nor not now of off on once only or other our
+    ours out over own same she should so some such than that the their theirs them then there these they this those
+    through to too under until up very was we were what when where which while who whom why will with would you
+    your yours tell show give please
+    """.split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords and single letters removed (digits are kept)."""
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def count_terms(documents: Sequence[Tuple[str, str]]) -> List[Counter]:
+    """Per-document term counts; callers may cache these to re-index only changed documents."""
+    return [Counter(tokenize(text)) for _, text in documents]
+
+
+class BM25Index:
+    """Immutable BM25 index over ``(source id, text)`` documents.
+
+    ``term_counts`` (from ``count_terms``) skips tokenisation for documents that did not change.
+    """
+
+    def __init__(
+        self,
+        documents: Sequence[Tuple[str, str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        term_counts: Optional[Sequence[Counter]] = None,
+    ) -> None:
+        self.documents = tuple(documents)
+        if term_counts is None:
+            term_counts = count_terms(self.documents)
+        lengths = [sum(counts.values()) for counts in term_counts]
+        total = len(self.documents)
+        average = (sum(lengths) / total) if total else 0.0
+
+        frequencies: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, counts in enumerate(term_counts):
+            for term, tf in counts.items():
+                frequencies.setdefault(term, []).append((doc_id, tf))
+
+        self.postings: Dict[str, Tuple[Tuple[int, float], ...]] = {}
+        for term, entries in frequencies.items():
+            idf = math.log(1.0 + (total - len(entries) + 0.5) / (len(entries) + 0.5))
+            self.postings[term] = tuple(
+                (doc_id, idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * lengths[doc_id] / average)))
+                for doc_id, tf in entries
+            )
+
+    def search(self, query: str, k: int = 3) -> List[Tuple[float, int]]:
+        """Top ``k`` ``(score, document index)`` pairs, best first; ties keep corpus order."""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        return _heap_top_k(scores, k)
+
+    def search_many(self, queries: Sequence[str], k: int = 3) -> List[List[Tuple[float, int]]]:
+        """Score a batch in one pass: each distinct term's postings are walked once for all queries using it."""
+        positions_by_term: Dict[str, List[int]] = {}
+        for position, query in enumerate(queries):
+            for term in set(tokenize(query)):
+                positions_by_term.setdefault(term, []).append(position)
+        scores: List[Dict[int, float]] = [{} for _ in queries]
+        for term, positions in positions_by_term.items():
+            for doc_id, weight in self.postings.get(term, ()):
+                for position in positions:
+                    accumulator = scores[position]
+                    accumulator[doc_id] = accumulator.get(doc_id, 0.0) + weight
+        return [_heap_top_k(accumulator, k) for accumulator in scores]
+
+
+def _heap_top_k(scores: Dict[int, float], k: int) -> List[Tuple[float, int]]:
+    best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+    return [(score, doc_id) for doc_id, score in best]
+
+
+def _top_k(scores: np.ndarray, k: int) -> List[Tuple[float, int]]:
+    """Best ``k`` positive scores, best first; ties keep corpus order."""
+    k = min(k, scores.size)
+    if k <= 0:
+        return []
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    ordered = candidates[np.lexsort((candidates, -scores[candidates]))]
+    return [(float(scores[doc_id]), int(doc_id)) for doc_id in ordered if scores[doc_id] > 0]
+
+
+class TfidfIndex:
+    """Dense, L2-normalised TF-IDF matrix (documents x vocabulary) with cosine scoring.
+
+    Query vectors are kept sparse (vocabulary columns plus weights) in a bounded LRU,
+    so repeated questions skip tokenisation entirely.
+    """
+
+    def __init__(
+        self,
+        documents: Sequence[Tuple[str, str]],
+        query_cache_size: int = 1024,
+        term_counts: Optional[Sequence[Counter]] = None,
+    ) -> None:
+        self.documents = tuple(documents)
+        if term_counts is None:
+            term_counts = count_terms(self.documents)
+        self.vocabulary: Dict[str, int] = {
+            term: column for column, term in enumerate(sorted({term for counts in term_counts for term in counts}))
+        }
+        matrix = np.zeros((len(self.documents), len(self.vocabulary)), dtype=np.float32)
+        for doc_id, counts in enumerate(term_counts):
+            for term, tf in counts.items():
+                matrix[doc_id, self.vocabulary[term]] = 1.0 + math.log(tf)
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        self.idf = (np.log((1.0 + len(self.documents)) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+        matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = matrix / norms
+        self.query_cache_size = query_cache_size
+        self._queries: "OrderedDict[str, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+
+    def vectorize(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """``(columns, weights)`` of the normalised query vector; unknown terms are dropped."""
+        cached = self._queries.get(query)
+        if cached is not None:
+            self._queries.move_to_end(query)
+            return cached
+        counts = Counter(term for term in tokenize(query) if term in self.vocabulary)
+        columns = np.fromiter((self.vocabulary[term] for term in counts), dtype=np.intp, count=len(counts))
+        weights = np.fromiter((1.0 + math.log(tf) for tf in counts.values()), dtype=np.float32, count=len(counts))
+        weights *= self.idf[columns]
+        norm = np.linalg.norm(weights)
+        if norm:
+            weights /= norm
+        vector = self._queries[query] = (columns, weights)
+        if len(self._queries) > self.query_cache_size:
+            self._queries.popitem(last=False)
+        return vector
+
+    def search(self, query: str, k: int = 3) -> List[Tuple[float, int]]:
+        columns, weights = self.vectorize(query)
+        if not columns.size:
+            return []
+        return _top_k(self.matrix[:, columns] @ weights, k)
+
+    def search_many(self, queries: Sequence[str], k: int = 3) -> List[List[Tuple[float, int]]]:
+        """Score every query with a single (documents x vocabulary) @ (vocabulary x queries) multiply."""
+        batch = np.zeros((len(self.vocabulary), len(queries)), dtype=np.float32)
+        for position, query in enumerate(queries):
+            columns, weights = self.vectorize(query)
+            batch[columns, position] = weights
+        scores = self.matrix @ batch
+        return [_top_k(scores[:, position], k) for position in range(len(queries))]
@@ -9,12 +9,22 @@ from fastapi.testclient import TestClient
 from app.main import app
 
 
+# Hand-maintained top-level keys FastAPI doesn't generate; carried over from the current file
+PRESERVED_KEYS = ("servers",)
+
+
 def main() -> None:
     client = TestClient(app)
     response = client.get("/openapi.json")
     response.raise_for_status()
     schema = response.json()
     target = Path("openapi.yaml")
+    if target.exists():
+        current = yaml.safe_load(target.read_text(encoding="utf-8")) or {}
+        preserved = {key: current[key] for key in PRESERVED_KEYS if key in current}
+        if preserved:
+            head = {key: schema.pop(key) for key in ("openapi", "info") if key in schema}
+            schema = {**head, **preserved, **schema}
     target.write_text(yaml.safe_dump(schema, sort_keys=False), encoding="utf-8")
     print(f"OpenAPI schema written to {target}")
 
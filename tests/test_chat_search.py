@@ -0,0 +1,222 @@
+import json
+import os
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services import chat_service
+from app.services.content_service import ContentStore, chunk_passages
+from app.services.search_service import BM25Index, TfidfIndex, tokenize
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    assert tokenize("What is the Carbon-Watch stack, in 2024?") == ["carbon", "watch", "stack", "2024"]
+
+
+def test_bm25_prefers_rare_terms_and_shorter_documents():
+    index = BM25Index(
+        [
+            ("a", "python python python services"),
+            ("b", "geospatial python"),
+            ("c", "geospatial pipeline with python and many other words padding the length out"),
+            ("d", "unrelated text"),
+        ]
+    )
+    ranked = [index.documents[doc_id][0] for _, doc_id in index.search("geospatial python", k=3)]
+    assert ranked[0] == "b"
+    assert "d" not in ranked
+    assert index.search("nothing matches", k=3) == []
+
+
+def test_bm25_ties_keep_corpus_order():
+    index = BM25Index([("a", "same words"), ("b", "same words"), ("c", "same words")])
+    assert [doc_id for _, doc_id in index.search("words", k=2)] == [0, 1]
+
+
+def test_chat_ask_ranks_relevant_source_first():
+    resp = client.post("/v1/chat/ask", headers=headers, json={"question": "How does the carbon assessment work?"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["sources"][0] == "carbon-watch"
+    assert len(body["sources"]) <= 3
+
+
+def test_tfidf_single_and_batch_scoring_agree():
+    documents = [
+        ("geo", "geospatial raster pipeline with postgis"),
+        ("web", "next.js portfolio with ai assistant"),
+        ("ops", "n8n automation and observability"),
+    ]
+    index = TfidfIndex(documents, query_cache_size=2)
+    single = [index.search(query, k=2) for query in ("postgis raster", "portfolio assistant", "unknown words")]
+    assert single[0][0][1] == 0 and single[1][0][1] == 1 and single[2] == []
+    batch = index.search_many(["postgis raster", "portfolio assistant", "unknown words"], k=2)
+    assert [[doc for _, doc in hits] for hits in batch] == [[doc for _, doc in hits] for hits in single]
+    # The query-vector cache stays bounded
+    assert len(index._queries) == 2
+
+
+def test_chat_ask_dense_mode():
+    resp = client.post(
+        "/v1/chat/ask", headers=headers, json={"question": "carbon assessment engine", "mode": "dense"}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["sources"][0] == "carbon-watch"
+    assert client.post("/v1/chat/ask", headers=headers, json={"question": "x", "mode": "neural"}).status_code == 422
+
+
+def test_chunk_passages_overlap_and_stay_within_sections(tmp_path):
+    body = " ".join(f"word{i}" for i in range(400))
+    (tmp_path / "demo.md").write_text(f"# Demo\nintro line\n## Results\n{body}\n## Next\nshort\n", encoding="utf-8")
+    entry = ContentStore(tmp_path).get("demo")
+    passages = chunk_passages(entry, max_chars=600, overlap=150)
+    sources = [source for source, _ in passages]
+    assert sources[0] == "demo#demo:0" and sources[-1] == "demo#next:0"
+    results = [text for source, text in passages if source.startswith("demo#results:")]
+    assert len(results) > 1 and all(text.startswith("Demo › Results\n") for text in results)
+    assert all(len(text) <= 600 + len("Demo › Results\n") for text in results)
+    # Consecutive windows share words
+    first, second = (set(text.split()) for text in results[:2])
+    assert first & second - {"Demo", "›", "Results"}
+    assert not any("short" in text for text in results)
+
+
+def test_content_change_reindexes_only_that_file():
+    untouched = chat_service._passages["pasa-education"][1]
+    summaries = chat_service._summaries
+    before = chat_service._passages["carbon-watch"][1]
+    chat_service._reindex_content(["carbon-watch"])
+    assert chat_service._passages["pasa-education"][1] is untouched
+    assert chat_service._summaries is summaries
+    assert chat_service._passages["carbon-watch"][1] is not before
+
+
+def test_chat_ask_returns_passage_sources():
+    resp = client.post("/v1/chat/ask", headers=headers, json={"question": "canopy density classification"})
+    sources = resp.json()["sources"]
+    assert sources[0].startswith("carbon-watch#")
+    slug, section = sources[0].split(":")[0].split("#")
+    resp = client.get(f"/v1/work/{slug}/content", headers=headers, params={"section": section})
+    assert resp.status_code == 200
+
+
+def _parse_sse(text):
+    messages = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n"))
+        messages.append((fields["event"], json.loads(fields["data"])))
+    return messages
+
+
+def test_chat_ask_stream_orders_events_and_matches_buffered_answer():
+    question = {"question": "geospatial platform", "audience": "engineer"}
+    buffered = client.post("/v1/chat/ask", headers=headers, json=question).json()
+    resp = client.post("/v1/chat/ask/stream", headers=headers, json=question)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    messages = _parse_sse(resp.text)
+    names = [name for name, _ in messages]
+    assert names[0] == "sources" and names[-3:] == ["events", "suggestions", "done"]
+    assert set(names[1:-3]) == {"answer"}
+    assert messages[0][1]["sources"] == buffered["sources"]
+    assert "".join(data["delta"] for name, data in messages if name == "answer") == buffered["answer"]
+    assert messages[-3][1]["events"] == buffered["events"]
+
+
+def test_chat_ask_stream_accepts_browser_posts():
+    resp = client.post(
+        "/v1/chat/ask/stream",
+        headers={**headers, "origin": "https://watcharapon.dev"},
+        json={"question": "tech stack"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+
+def test_answer_cache_normalises_and_counts():
+    cache = chat_service.get_answer_cache()
+    cache.clear()
+    hits, misses = cache.hits, cache.misses
+    first = chat_service.answer_question("What is your tech stack?", "general")
+    second = chat_service.answer_question("  tech STACK ", "general")
+    assert first == second
+    assert (cache.hits - hits, cache.misses - misses) == (1, 1)
+    # Audience and mode are part of the key
+    chat_service.answer_question("tech stack", "recruiter")
+    chat_service.answer_question("tech stack", "general", "dense")
+    assert cache.misses - misses == 3
+
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "ask_portfolio_bot", "arguments": {"question": "tech stack?"}},
+    }
+    client.post("/v1/mcp/execute", headers=headers, json=payload)
+    assert cache.hits - hits == 2
+
+
+def test_answer_cache_ttl_bound_and_version():
+    cache = chat_service.AnswerCache(max_entries=2, ttl_seconds=60)
+    cache.put(("a",), 1, [("s", "t")])
+    assert cache.get(("a",), 1) == [("s", "t")]
+    assert cache.get(("a",), 2) is None
+    cache.put(("b",), 1, [])
+    cache.put(("c",), 1, [])
+    assert cache.stats()["entries"] == 2 and cache.get(("a",), 1) is None
+    expired = chat_service.AnswerCache(ttl_seconds=0)
+    expired.put(("a",), 1, [])
+    assert expired.get(("a",), 1) is None
+
+
+def test_corpus_publish_invalidates_answer_cache():
+    chat_service.answer_question("tech stack", "general")
+    version = chat_service.CORPUS_VERSION
+    chat_service._publish()
+    assert chat_service.CORPUS_VERSION == version + 1
+    assert chat_service.get_answer_cache().stats()["entries"] == 0
+
+
+def test_bm25_batch_matches_single_queries():
+    queries = ["geospatial python", "python", "nothing here"]
+    index = BM25Index([("a", "python services"), ("b", "geospatial python"), ("c", "other")])
+    assert index.search_many(queries, k=2) == [index.search(query, k=2) for query in queries]
+
+
+def test_chat_ask_batch_dedupes_and_matches_single_answers():
+    questions = ["carbon assessment", "Carbon assessment?", "tech stack"]
+    chat_service.get_answer_cache().clear()
+    resp = client.post("/v1/chat/ask/batch", headers=headers, json={"questions": questions})
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert len(results) == 3 and results[0] == results[1]
+    # Two distinct questions were scored (and cached) for three inputs
+    assert chat_service.get_answer_cache().stats()["entries"] == 2
+    single = client.post("/v1/chat/ask", headers=headers, json={"question": "tech stack"}).json()
+    assert results[2] == single
+
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "ask_portfolio_bot_batch", "arguments": {"questions": questions, "mode": "dense"}},
+    }
+    result = json.loads(client.post("/v1/mcp/execute", headers=headers, json=payload).json()["result"]["content"][0]["text"])
+    assert len(result["results"]) == 3
+    assert client.post("/v1/chat/ask/batch", headers=headers, json={"questions": []}).status_code == 422
+    assert client.post("/v1/chat/ask/batch", headers=headers, json={"questions": [""]}).status_code == 422
+
+
+def test_chat_ask_batch_accepts_browser_posts():
+    resp = client.post(
+        "/v1/chat/ask/batch",
+        headers={**headers, "origin": "https://watcharapon.dev"},
+        json={"questions": ["tech stack"]},
+    )
+    assert resp.status_code == 200 and len(resp.json()["results"]) == 1
@@ -0,0 +1,107 @@
+import gzip
+import os
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.core.response_cache import get_response_cache
+from app.main import create_app
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("br, gzip;q=0.8, deflate;q=0.9") == "deflate"
+    assert negotiate_encoding("gzip;q=0, *") == "deflate"
+    assert negotiate_encoding("*;q=0") is None
+    assert negotiate_encoding("GZIP") == "gzip"
+
+
+def test_static_list_served_from_compressed_variant():
+    plain = client.get("/v1/work", headers={**headers, "accept-encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["vary"]
+
+    before = get_response_cache().compressions
+    for _ in range(3):
+        resp = client.get("/v1/work", headers={**headers, "accept-encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.content == plain.content
+        assert resp.headers["etag"] != plain.headers["etag"]
+    # Compressed once, then served from the cached variant
+    assert get_response_cache().compressions - before <= 1
+
+    resp = client.get("/v1/work", headers={**headers, "accept-encoding": "gzip", "if-none-match": resp.headers["etag"]})
+    assert resp.status_code == 304
+
+
+def test_small_static_payload_not_compressed():
+    resp = client.get("/v1/contact", headers={**headers, "accept-encoding": "gzip"})
+    assert len(resp.content) < 1024
+    assert "content-encoding" not in resp.headers
+
+
+def _mini_app():
+    mini = FastAPI()
+    mini.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @mini.get("/small")
+    async def small():
+        return PlainTextResponse("tiny")
+
+    @mini.get("/large")
+    async def large():
+        return PlainTextResponse("x" * 5000)
+
+    @mini.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return TestClient(mini)
+
+
+def test_middleware_compresses_dynamic_and_streamed_bodies():
+    mini = _mini_app()
+    resp = mini.get("/small", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in resp.headers
+
+    resp = mini.get("/large", headers={"accept-encoding": "deflate"})
+    assert resp.headers["content-encoding"] == "deflate"
+    assert int(resp.headers["content-length"]) < 5000
+    assert resp.text == "x" * 5000
+
+    resp = mini.get("/stream", headers={"accept-encoding": "gzip"})
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "content-length" not in resp.headers
+    assert resp.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+
+def test_every_compressible_response_varies_on_encoding():
+    mini = _mini_app()
+    for path, encoding in (("/small", "gzip"), ("/small", "identity"), ("/large", "identity"), ("/large", "gzip")):
+        resp = mini.get(path, headers={"accept-encoding": encoding})
+        assert [token.strip() for token in resp.headers["vary"].split(",")].count("Accept-Encoding") == 1
+    cached = client.get("/v1/work", headers={**headers, "accept-encoding": "gzip"})
+    assert [token.strip() for token in cached.headers["vary"].split(",")].count("Accept-Encoding") == 1
+
+
+def test_compressed_bodies_decode_with_stdlib():
+    raw = client.get("/v1/skills", headers={**headers, "accept-encoding": "gzip"})
+    with client.stream("GET", "/v1/skills", headers={**headers, "accept-encoding": "gzip"}) as resp:
+        body = b"".join(resp.iter_raw())
+    assert gzip.decompress(body) == raw.content
+    with client.stream("GET", "/v1/skills", headers={**headers, "accept-encoding": "deflate"}) as resp:
+        body = b"".join(resp.iter_raw())
+    assert zlib.decompress(body) == raw.content
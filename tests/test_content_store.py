@@ -0,0 +1,141 @@
+import asyncio
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services.content_service import ContentStore, build_section_index
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_store_reads_once_and_revalidates_by_mtime(tmp_path):
+    path = tmp_path / "demo.md"
+    path.write_text("# v1", encoding="utf-8")
+    store = ContentStore(tmp_path, max_entries=4, revalidate_seconds=60)
+
+    first = asyncio.run(store.aget("demo"))
+    assert first.content == "# v1"
+    assert asyncio.run(store.aget("demo")) is first
+    assert store.reads == 1 and store.hits == 1
+
+    path.write_text("# version two", encoding="utf-8")
+    # Within the revalidation window the cached copy is served without touching disk
+    assert store.get("demo").content == "# v1"
+    store.invalidate(["demo"])
+    second = store.get("demo")
+    assert second.content == "# version two"
+    assert second.etag != first.etag
+    assert store.reads == 2
+
+
+def test_store_unchanged_file_is_not_reread(tmp_path):
+    (tmp_path / "demo.md").write_text("# same", encoding="utf-8")
+    store = ContentStore(tmp_path, revalidate_seconds=0)
+    store.get("demo")
+    store.get("demo")
+    assert store.reads == 1 and store.misses == 2
+
+
+def test_store_is_bounded_and_rejects_traversal(tmp_path):
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.md").write_text(name, encoding="utf-8")
+    store = ContentStore(tmp_path, max_entries=2)
+    store.warm()
+    assert store.stats()["entries"] == 2
+    with pytest.raises(FileNotFoundError):
+        store.get("../seed")
+    with pytest.raises(FileNotFoundError):
+        store.get("missing")
+
+
+def test_content_endpoint_validators():
+    resp = client.get("/v1/work/carbon-watch/content", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["format"] == "markdown"
+    etag, last_modified = resp.headers["etag"], resp.headers["last-modified"]
+
+    resp = client.get("/v1/work/carbon-watch/content", headers={**headers, "if-none-match": etag})
+    assert resp.status_code == 304
+    resp = client.get("/v1/work/carbon-watch/content", headers={**headers, "if-modified-since": last_modified})
+    assert resp.status_code == 304
+    resp = client.get(
+        "/v1/work/carbon-watch/content", headers={**headers, "if-modified-since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+    )
+    assert resp.status_code == 200
+
+    assert client.get("/v1/work/nope/content", headers=headers).status_code == 404
+
+
+def test_html_rendered_once_per_content_version(tmp_path):
+    path = tmp_path / "demo.md"
+    path.write_text("# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |\n", encoding="utf-8")
+    store = ContentStore(tmp_path, revalidate_seconds=0)
+
+    _, html = asyncio.run(store.ahtml("demo"))
+    assert "<h1>Title</h1>" in html and "<table>" in html
+    asyncio.run(store.ahtml("demo"))
+    assert store.renders == 1
+
+    path.write_text("# Changed\n", encoding="utf-8")
+    _, html = asyncio.run(store.ahtml("demo"))
+    assert "<h1>Changed</h1>" in html
+    assert store.renders == 2
+
+
+def test_content_endpoint_and_mcp_tool_render_html():
+    resp = client.get("/v1/work/carbon-watch/content", headers=headers, params={"format": "html"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["format"] == "html"
+    assert body["content"].startswith("<h1>")
+    markdown_etag = client.get("/v1/work/carbon-watch/content", headers=headers).headers["etag"]
+    assert resp.headers["etag"] != markdown_etag
+
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "get_work_content", "arguments": {"slug": "carbon-watch", "format": "html"}},
+    }
+    result = client.post("/v1/mcp/execute", headers=headers, json=payload).json()["result"]
+    assert '"format": "html"' in result["content"][0]["text"]
+    payload["params"]["arguments"]["format"] = "pdf"
+    assert client.post("/v1/mcp/execute", headers=headers, json=payload).json()["error"]["code"] == -32602
+
+
+def test_section_index_skips_code_fences_and_nests_subsections():
+    text = "# Doc\nintro\n## Results\nup 20%\n### Detail\nmore\n```\n# not a heading\n```\n## Results\nagain\n"
+    sections = build_section_index(text)
+    assert [(s.id, s.level) for s in sections] == [("doc", 1), ("results", 2), ("detail", 3), ("results-2", 2)]
+    results = sections[1]
+    assert text[results.start:results.end] == "## Results\nup 20%\n### Detail\nmore\n```\n# not a heading\n```\n"
+
+
+def test_section_endpoints():
+    toc = client.get("/v1/work/pasa-education/content/sections", headers=headers)
+    assert toc.status_code == 200
+    ids = [section["id"] for section in toc.json()["sections"]]
+    assert "overview" in ids and "course-management" in ids
+
+    resp = client.get("/v1/work/pasa-education/content", headers=headers, params={"section": "overview"})
+    content = resp.json()["content"]
+    assert content.startswith("## 🎯 Overview") and "## ⚙️ Architecture" not in content
+
+    resp = client.get(
+        "/v1/work/pasa-education/content", headers=headers, params={"section": "overview", "format": "html"}
+    )
+    assert resp.json()["content"].startswith("<h2>")
+    resp = client.get("/v1/work/pasa-education/content", headers=headers, params={"section": "nope"})
+    assert resp.status_code == 404
+
+
+def test_streamed_content_matches_buffered_json():
+    full = client.get("/v1/work/carbon-watch/content", headers=headers).json()
+    resp = client.get("/v1/work/carbon-watch/content", headers=headers, params={"stream": "true"})
+    assert resp.status_code == 200
+    assert resp.json() == full
@@ -0,0 +1,38 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from app.services.data_loader import DATA_PATH, FrozenDict, freeze, load_seed_data, normalize_seed
+from app.services.data_service import get_availability, get_certifications, get_experience
+
+
+def test_snapshot_is_read_only():
+    about = load_seed_data()["about"]
+    with pytest.raises(TypeError):
+        about["name"] = "someone else"
+    with pytest.raises(AttributeError):
+        get_experience()[0]["highlights"].append("x")
+
+
+def test_timestamps_are_parsed_once():
+    period = get_experience()[0]["period"]
+    assert isinstance(period["start"], datetime)
+    assert isinstance(get_certifications()["items"][0]["issued_at"], datetime)
+    slot = get_availability()["free"][0]
+    assert slot["start"].tzinfo is not None
+    # Getters hand out the same snapshot objects on every call
+    assert get_experience() is get_experience()
+
+
+def test_freeze_keeps_json_compatible_types():
+    frozen = freeze({"a": [1, {"b": 2}]})
+    assert isinstance(frozen, dict) and isinstance(frozen, FrozenDict)
+    assert frozen == {"a": (1, {"b": 2})}
+
+
+def test_normalize_rejects_invalid_seed():
+    raw = json.loads(DATA_PATH.read_text(encoding="utf-8"))
+    broken = {**raw, "skills": [{"id": "x", "title": "X", "description": "d", "items": [{"name": "n", "level": 9, "notes": None}]}]}
+    with pytest.raises(ValueError):
+        normalize_seed(broken)
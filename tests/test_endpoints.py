@@ -50,3 +50,24 @@ def test_availability_range_filter():
     assert response.status_code == 200
     data = response.json()
     assert len(data["free"]) >= 1
+
+
+@pytest.mark.parametrize(
+    "path, key",
+    [
+        ("/v1/pillars/ai_engineering", "id"),
+        ("/v1/skills/skills_ai_ml", "id"),
+        ("/v1/experience/exp_mango", "id"),
+        ("/v1/certifications/cert_ai_practitioner", "id"),
+    ],
+)
+def test_single_item_endpoints(path, key):
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200
+    assert response.json()[key] == path.rsplit("/", 1)[1]
+
+
+def test_single_item_not_found():
+    response = client.get("/v1/skills/does-not-exist", headers=headers)
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "ERR_NOT_FOUND"
@@ -0,0 +1,46 @@
+import asyncio
+import io
+import json
+
+from app.core.log_pipeline import LogPipeline, truncate_payload
+
+
+def test_queue_is_bounded_and_counts_drops():
+    pipeline = LogPipeline(max_queue=2, stream=io.StringIO())
+    assert pipeline.emit({"event": "a"})
+    assert pipeline.emit({"event": "b"})
+    assert not pipeline.emit({"event": "c"})
+    assert pipeline.stats()["dropped"] == 1
+
+
+def test_successful_requests_are_sampled_errors_are_not():
+    pipeline = LogPipeline(success_sample_rate=0.0, stream=io.StringIO())
+    pipeline.log_request("GET", "/v1/about", 200, 1.0, "cid")
+    pipeline.log_request("GET", "/v1/about", 500, 1.0, "cid")
+    stats = pipeline.stats()
+    assert stats["sampled_out"] == 1
+    assert stats["queued"] == 1
+
+
+def test_truncate_payload():
+    assert truncate_payload({"a": 1}, 100) == '{"a": 1}'
+    text = truncate_payload("x" * 50, 10)
+    assert text.startswith("x" * 10) and text.endswith("[truncated 40 chars]")
+
+
+def test_background_writer_flushes_json_lines():
+    stream = io.StringIO()
+    pipeline = LogPipeline(batch_size=2, flush_interval_seconds=0.01, stream=stream)
+
+    async def scenario():
+        writer = asyncio.create_task(pipeline.run())
+        for i in range(5):
+            pipeline.log_request("GET", f"/p{i}", 200, 0.5, f"cid-{i}")
+        await asyncio.sleep(0.1)
+        writer.cancel()
+
+    asyncio.run(scenario())
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["path"] for line in lines] == [f"/p{i}" for i in range(5)]
+    assert pipeline.stats()["written"] == 5
+    assert pipeline.stats()["batches"] == 3
@@ -1,3 +1,4 @@
+import json
 import os
 from fastapi.testclient import TestClient
 
@@ -48,3 +49,62 @@ def test_mcp_jsonrpc_tools_list_local():
     # At least one tool should exist per manifest
     assert any(isinstance(t.get("name"), str) for t in tools)
 
+
+
+def test_mcp_jsonrpc_get_skill_group_by_id():
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 2,
+        "method": "tools/call",
+        "params": {"name": "get_skill_group", "arguments": {"id": "skills_ai_ml"}},
+    }
+    resp = client.post("/v1/mcp/execute", json=payload, headers=headers)
+    body = resp.json()
+    item = json.loads(body["result"]["content"][0]["text"])["item"]
+    assert item["id"] == "skills_ai_ml"
+
+    payload["params"]["arguments"] = {"id": "missing"}
+    body = client.post("/v1/mcp/execute", json=payload, headers=headers).json()
+    assert body["error"]["code"] == -32601
+
+
+def test_mcp_jsonrpc_batch_keeps_ids_and_skips_notifications():
+    payload = [
+        {"jsonrpc": "2.0", "id": "a", "method": "tools/call", "params": {"name": "list_work", "arguments": {"limit": 1}}},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": {"name": "get_skill_group", "arguments": {"id": "skills_ai_ml"}}},
+        {"jsonrpc": "2.0", "id": 8, "method": "no/such/method"},
+        42,
+    ]
+    resp = client.post("/v1/mcp/execute", json=payload, headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item.get("id") for item in body] == ["a", 7, 8, None]
+    assert "result" in body[0] and "result" in body[1]
+    assert body[2]["error"]["code"] == -32601
+    assert body[3]["error"]["code"] == -32600
+
+
+def test_mcp_jsonrpc_initialize_is_rejected_inside_a_batch():
+    payload = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"protocolVersion": "2025-03-26"}},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+    ]
+    resp = client.post("/v1/mcp/execute", json=payload, headers=headers)
+    assert "mcp-session-id" not in resp.headers
+    first, second = resp.json()
+    assert first["id"] == 1 and first["error"]["code"] == -32600
+    assert "result" in second
+
+
+def test_mcp_jsonrpc_notifications_get_no_body():
+    resp = client.post("/v1/mcp/execute", json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=headers)
+    assert resp.status_code == 202 and resp.content == b""
+    resp = client.post("/v1/mcp/execute", json=[{"jsonrpc": "2.0", "method": "notifications/initialized"}], headers=headers)
+    assert resp.status_code == 202 and resp.content == b""
+
+
+def test_mcp_jsonrpc_empty_batch_is_invalid():
+    resp = client.post("/v1/mcp/execute", json=[], headers=headers)
+    assert resp.status_code == 200
+    assert resp.json() == {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}}
@@ -0,0 +1,105 @@
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.tool_registry import ToolRegistry, ToolRegistryError, compile_schema
+from app.main import create_app
+from app.services import reload_service
+from app.services.manifest_service import ManifestCache, ManifestError
+from app.services.mcp_service import get_tool_manifest, get_tool_registry
+
+client = TestClient(create_app())
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def _call(name, arguments):
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": name, "arguments": arguments}}
+    return client.post("/v1/mcp/execute", headers=headers, json=payload).json()
+
+
+def test_every_manifest_tool_has_a_handler():
+    assert sorted(get_tool_registry().names) == sorted(tool["name"] for tool in get_tool_manifest().current.entries)
+
+
+def test_arguments_are_validated_against_the_manifest():
+    error = _call("list_work", {"limit": "abc"})["error"]
+    assert error["code"] == -32602 and "'limit' must be of type integer" in error["message"]
+    assert _call("list_work", {"limit": 21})["error"]["code"] == -32602
+    assert "Unexpected argument 'sort'" in _call("list_skills", {"sort": "name"})["error"]["message"]
+    assert "Missing 'slug'" in _call("get_work", {})["error"]["message"]
+    assert _call("ask_portfolio_bot", {"question": "hi", "audience": "ceo"})["error"]["code"] == -32602
+    assert _call("ask_portfolio_bot_batch", {"questions": ["ok", ""]})["error"]["code"] == -32602
+    assert _call("get_pillar", "not-an-object")["error"]["code"] == -32602
+    assert _call("no_such_tool", {})["error"]["code"] == -32601
+
+
+def test_mcp_execute_tool_forwards_like_the_simple_endpoint():
+    result = json.loads(_call("mcp_execute", {"tool": "echo", "params": {"a": 1}})["result"]["content"][0]["text"])
+    assert result == {"forwarded": False, "result": {"echo": {"tool": "echo", "params": {"a": 1}, "context": {}}}}
+
+
+def test_bind_rejects_a_mismatched_manifest():
+    registry = ToolRegistry()
+
+    @registry.tool("known")
+    async def known(arguments):
+        return {}
+
+    with pytest.raises(ToolRegistryError, match="no handler for: missing"):
+        registry.bind([{"name": "known"}, {"name": "missing"}])
+    with pytest.raises(ToolRegistryError, match="not in manifest: known"):
+        registry.bind([])
+    with pytest.raises(ToolRegistryError):
+        registry.register("known", known)
+
+
+def test_compile_schema_rejects_unsupported_keywords():
+    with pytest.raises(ToolRegistryError, match="pattern"):
+        compile_schema({"type": "object", "properties": {"id": {"type": "string", "pattern": "^x"}}})
+    validate = compile_schema({"oneOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]})
+    assert validate("a", "fields") == [] and validate(["a"], "fields") == []
+    assert validate([1], "fields") == ["'fields' must match exactly one allowed form"]
+
+
+def test_tools_list_is_served_from_the_cached_manifest():
+    listing = {"jsonrpc": "2.0", "id": 3, "method": "tools/list"}
+    single = client.post("/v1/mcp/execute", headers=headers, json=listing).json()
+    batched = client.post("/v1/mcp/execute", headers=headers, json=[listing]).json()[0]
+    version = get_tool_manifest().current.version
+    assert single["result"]["_meta"] == {"toolsVersion": version}
+    assert single["result"]["tools"] == batched["result"]["tools"]
+    assert single["id"] == 3 and single["result"]["meta"]["webhook_configured"] is False
+    initialize = {"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}}
+    result = client.post("/v1/mcp/execute", headers=headers, json=initialize).json()["result"]
+    assert result["_meta"]["toolsVersion"] == version
+
+
+def test_manifest_cache_versions_and_reloads_on_change(tmp_path, monkeypatch):
+    path = tmp_path / "mcp.tools.json"
+    path.write_text(json.dumps([{"name": "a", "input_schema": {}}]), encoding="utf-8")
+    changed = []
+    cache = ManifestCache(path)
+    cache.on_change("test", lambda manifest: changed.append(manifest.version))
+    first = cache.current.version
+    # Formatting-only edits keep the version
+    path.write_text(json.dumps([{"name": "a", "input_schema": {}}], indent=2), encoding="utf-8")
+    assert cache.refresh() is False and changed == []
+
+    monkeypatch.setattr(reload_service, "_file_hooks", {})
+    monkeypatch.setattr(reload_service, "_file_prints", {})
+    reload_service.on_file_change("test_manifest", path, lambda _: cache.refresh())
+    path.write_text(json.dumps([{"name": "a"}, {"name": "b"}]), encoding="utf-8")
+    assert "test_manifest" in reload_service.reload_now()["files_changed"]
+    assert changed == [cache.current.version] and cache.current.version != first
+    assert [tool["name"] for tool in cache.current.tools] == ["a", "b"]
+
+    # A broken edit is reported and the previous manifest keeps serving
+    path.write_text("[{", encoding="utf-8")
+    with pytest.raises(ManifestError):
+        cache.refresh()
+    assert len(cache.current.tools) == 2
+    with pytest.raises(ManifestError):
+        ManifestCache(tmp_path / "missing.json").refresh()
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import os
+
+from fastapi.testclient import TestClient
+
+from app.controllers import mcp_controller
+from app.core.config import get_settings
+from app.main import create_app
+from app.services.manifest_service import ManifestCache
+from app.services.mcp_session_service import TOOLS_LIST_CHANGED, SessionManager, get_session_manager, session_events
+
+client = TestClient(create_app())
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+sse_headers = {**headers, "Accept": "application/json, text/event-stream"}
+
+
+def _initialize(version="2025-03-26"):
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {"protocolVersion": version, "capabilities": {"roots": {}}, "clientInfo": {"name": "agent", "version": "1"}},
+    }
+    return client.post("/v1/mcp/execute", headers=headers, json=payload)
+
+
+def _sse_messages(text):
+    return [json.loads(line[len("data: "):]) for line in text.splitlines() if line.startswith("data: ")]
+
+
+def test_initialize_opens_a_session_that_later_requests_reuse():
+    resp = _initialize()
+    session_id = resp.headers["mcp-session-id"]
+    result = resp.json()["result"]
+    assert result["protocolVersion"] == "2025-03-26"
+    assert result["capabilities"]["tools"]["listChanged"] is True
+    assert _initialize("1999-01-01").json()["result"]["protocolVersion"] == "2025-03-26"
+    assert _initialize("2024-11-05").json()["result"]["protocolVersion"] == "2024-11-05"
+
+    in_session = {**headers, "Mcp-Session-Id": session_id}
+    listing = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+    assert client.post("/v1/mcp/execute", headers=in_session, json=listing).status_code == 200
+    assert client.delete("/v1/mcp/execute", headers=in_session).status_code == 204
+    resp = client.post("/v1/mcp/execute", headers=in_session, json=listing)
+    assert resp.status_code == 404
+    assert client.delete("/v1/mcp/execute", headers=in_session).status_code == 404
+
+
+def test_browser_clients_can_read_and_close_their_session():
+    origin = {"Origin": "https://agent.example"}
+    resp = client.post(
+        "/v1/mcp/execute",
+        headers={**headers, **origin},
+        json={"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {"protocolVersion": "2025-03-26"}},
+    )
+    assert "mcp-session-id" in resp.headers["access-control-expose-headers"].lower()
+    preflight = client.options(
+        "/v1/mcp/execute",
+        headers={**origin, "Access-Control-Request-Method": "DELETE", "Access-Control-Request-Headers": "mcp-session-id"},
+    )
+    assert preflight.status_code == 200
+    assert "DELETE" in preflight.headers["access-control-allow-methods"]
+    in_session = {**headers, **origin, "Mcp-Session-Id": resp.headers["mcp-session-id"]}
+    assert client.delete("/v1/mcp/execute", headers=in_session).status_code == 204
+
+
+def test_get_stream_requires_sse_and_a_session():
+    assert client.get("/v1/mcp/execute", headers=headers).status_code == 405
+    assert client.get("/v1/mcp/execute", headers=sse_headers).status_code == 400
+    assert client.get("/v1/mcp/execute", headers={**sse_headers, "Mcp-Session-Id": "nope"}).status_code == 404
+
+
+def test_tools_call_streams_progress_then_the_result():
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 9,
+        "method": "tools/call",
+        "params": {"name": "get_about", "arguments": {}, "_meta": {"progressToken": "p1"}},
+    }
+    resp = client.post("/v1/mcp/execute", headers=sse_headers, json=payload)
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    progress, done, response = _sse_messages(resp.text)
+    assert progress["method"] == done["method"] == "notifications/progress"
+    assert (progress["params"]["progressToken"], progress["params"]["progress"]) == ("p1", 0)
+    assert done["params"]["progress"] == done["params"]["total"] == 1
+    assert response["id"] == 9 and "about" in json.loads(response["result"]["content"][0]["text"])
+    # Without an SSE-capable Accept header the same call is plain JSON
+    assert client.post("/v1/mcp/execute", headers=headers, json=payload).json()["id"] == 9
+
+
+def test_progress_calls_count_as_session_activity(monkeypatch):
+    session_id = _initialize().headers["mcp-session-id"]
+    session = get_session_manager().get(session_id)
+    track, tracked = mcp_controller._track, []
+
+    def probe(tracked_session, message, response):
+        tracked.append((tracked_session, message["id"]))
+        track(tracked_session, message, response)
+
+    monkeypatch.setattr(mcp_controller, "_track", probe)
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 10,
+        "method": "tools/call",
+        "params": {"name": "get_about", "arguments": {}, "_meta": {"progressToken": "p2"}},
+    }
+    resp = client.post("/v1/mcp/execute", headers={**sse_headers, "Mcp-Session-Id": session_id}, json=payload)
+    assert _sse_messages(resp.text)[-1]["id"] == 10
+    assert tracked == [(session, 10)]
+
+
+def test_large_tool_results_are_streamed(monkeypatch):
+    payload = {"jsonrpc": "2.0", "id": 4, "method": "tools/call", "params": {"name": "list_work", "arguments": {}}}
+    expected = client.post("/v1/mcp/execute", headers=headers, json=payload).json()
+    monkeypatch.setattr(get_settings(), "mcp_stream_min_bytes", 1)
+    resp = client.post("/v1/mcp/execute", headers=sse_headers, json=payload)
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    (streamed,) = _sse_messages(resp.text)
+    assert streamed["id"] == 4 and streamed["result"]["content"] == expected["result"]["content"]
+
+
+def test_sessions_expire_and_respect_the_memory_ceiling():
+    manager = SessionManager(ttl_seconds=60, max_entries=2)
+    first, second, third = (manager.create("2025-03-26", {"name": "a"}, {}) for _ in range(3))
+    assert manager.get(first.id) is None and manager.get(third.id) is third
+    assert manager.stats()["evictions"] == 1
+
+    small = SessionManager(max_bytes=3 * 1200)
+    ids = [small.create("2025-03-26", {"name": "x" * 10_000}, {}).id for _ in range(5)]
+    assert small.stats()["bytes"] <= 3 * 1200 and small.get(ids[-1]) is not None
+
+    idle = SessionManager(ttl_seconds=0)
+    session = idle.create("2025-03-26", {}, {})
+    assert idle.get(session.id) is None and idle.stats()["expired"] == 1
+
+
+def test_session_stream_announces_tool_list_changes(tmp_path):
+    path = tmp_path / "mcp.tools.json"
+    path.write_text(json.dumps([{"name": "a"}]), encoding="utf-8")
+    manifest = ManifestCache(path)
+    manager = SessionManager()
+    session = manager.create("2025-03-26", {}, {})
+    session.tools_version = manifest.current.version
+
+    async def scenario():
+        events = session_events(manager, session, manifest, keepalive_seconds=0.01)
+        assert await events.__anext__() is None  # keepalive while nothing changed
+        path.write_text(json.dumps([{"name": "a"}, {"name": "b"}]), encoding="utf-8")
+        manifest.refresh()
+        assert await asyncio.wait_for(events.__anext__(), 1) == TOOLS_LIST_CHANGED
+        assert session.tools_version == manifest.current.version
+        # Closing the session ends its stream
+        manager.close(session.id)
+        assert [message async for message in events] in ([], [None])
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+import os
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import Histogram
+from app.main import create_app
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5.0, "/a")
+    lines = list(histogram.render())
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_metrics_endpoint_uses_route_templates():
+    client.get("/v1/work/carbon-watch", headers=headers)
+    client.post(
+        "/v1/mcp/execute",
+        json={"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "get_about", "arguments": {}}},
+        headers=headers,
+    )
+    resp = client.get("/metrics", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+    assert 'http_requests_total{route="/v1/work/{slug}",method="GET",status="200"}' in body
+    assert 'mcp_tool_calls_total{tool="get_about",outcome="ok"}' in body
+    assert "rate_limit_size" in body
+
+
+def test_unknown_tool_names_share_one_metric_label():
+    for name in ("no_such_tool", "garbage-\u2603"):
+        client.post(
+            "/v1/mcp/execute",
+            json={"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": name, "arguments": {}}},
+            headers=headers,
+        )
+    body = client.get("/metrics", headers=headers).text
+    assert 'mcp_tool_calls_total{tool="unknown",outcome="ERR_NOT_FOUND"}' in body
+    assert "no_such_tool" not in body
+
+
+def test_metrics_requires_api_key():
+    assert client.get("/metrics").status_code == 401
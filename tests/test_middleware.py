@@ -0,0 +1,57 @@
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.middleware import RequestPipelineMiddleware
+from app.core.rate_limit import SlidingWindowRateLimiter
+from app.main import create_app
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_correlation_id_is_echoed():
+    resp = client.get("/v1/about", headers={**headers, "x-correlation-id": "abc-123"})
+    assert resp.status_code == 200
+    assert resp.headers["x-correlation-id"] == "abc-123"
+
+
+def test_correlation_id_is_generated():
+    resp = client.get("/healthz")
+    assert resp.status_code == 200
+    assert resp.headers.get("x-correlation-id")
+
+
+def test_cross_origin_post_rejected():
+    resp = client.post(
+        "/v1/availability/hold",
+        json={},
+        headers={**headers, "origin": "https://evil.example", "x-correlation-id": "cid-1"},
+    )
+    assert resp.status_code == 405
+    assert resp.json()["error"] == {
+        "code": "ERR_BAD_REQUEST",
+        "message": "Cross-origin POST not permitted for this endpoint.",
+        "correlation_id": "cid-1",
+    }
+
+
+def test_rate_limit_envelope():
+    inner = FastAPI()
+
+    @inner.get("/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+
+    limited = RequestPipelineMiddleware(inner, limiter=SlidingWindowRateLimiter(limit=2))
+    limited_client = TestClient(limited)
+    assert limited_client.get("/ping").status_code == 200
+    assert limited_client.get("/ping").status_code == 200
+    resp = limited_client.get("/ping", headers={"x-correlation-id": "cid-2"})
+    assert resp.status_code == 429
+    assert resp.headers["x-correlation-id"] == "cid-2"
+    assert "retry-after" in resp.headers
+    assert resp.json()["error"]["code"] == "ERR_RATE_LIMIT"
@@ -0,0 +1,65 @@
+import json
+import os
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services.data_service import get_skills
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_cursor_walk_covers_every_item_once():
+    seen = []
+    params = {"limit": 1}
+    while True:
+        resp = client.get("/v1/skills", headers=headers, params=params)
+        assert resp.status_code == 200
+        body = resp.json()
+        seen += [item["id"] for item in body["items"]]
+        if body["next_cursor"] is None:
+            break
+        params = {"limit": 1, "cursor": body["next_cursor"]}
+    assert seen == [group["id"] for group in get_skills()]
+
+
+def test_fields_projection_drops_other_keys():
+    resp = client.get("/v1/work", headers=headers, params={"fields": "title,slug"})
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert items and all(set(item) == {"slug", "title"} for item in items)
+
+
+def test_certifications_page_keeps_continuing_education():
+    full = client.get("/v1/certifications", headers=headers).json()
+    page = client.get("/v1/certifications", headers=headers, params={"limit": 1, "fields": "id"}).json()
+    assert page["continuing_education"] == full["continuing_education"]
+    assert page["items"] == [{"id": full["items"][0]["id"]}]
+
+
+def test_invalid_cursor_and_unknown_field_are_400():
+    resp = client.get("/v1/experience", headers=headers, params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+    # A cursor issued for one collection is not valid for another
+    other = client.get("/v1/skills", headers=headers, params={"limit": 1}).json()["next_cursor"]
+    assert client.get("/v1/work", headers=headers, params={"cursor": other}).status_code == 400
+    resp = client.get("/v1/work", headers=headers, params={"fields": "slug,nope"})
+    assert resp.status_code == 400
+
+
+def test_mcp_list_tool_pages_and_projects():
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "list_skills", "arguments": {"limit": 1, "fields": ["id"]}},
+    }
+    resp = client.post("/v1/mcp/execute", headers=headers, json=payload)
+    result = json.loads(resp.json()["result"]["content"][0]["text"])
+    assert result["items"] == [{"id": get_skills()[0]["id"]}]
+    payload["params"]["arguments"] = {"cursor": result["next_cursor"], "fields": "nope"}
+    resp = client.post("/v1/mcp/execute", headers=headers, json=payload)
+    assert resp.json()["error"]["code"] == -32602
@@ -0,0 +1,146 @@
+import asyncio
+import os
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services import chat_service
+from app.services.rag_service import RagClient
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def _stub(delays):
+    """Upstream stand-in; the n-th call sleeps ``delays[n]`` seconds (or fails for a negative delay)."""
+    stub = FastAPI()
+    stub.state.calls = 0
+
+    @stub.post("/search")
+    async def search(request: Request):
+        body = await request.json()
+        call = stub.state.calls
+        stub.state.calls += 1
+        delay = delays[min(call, len(delays) - 1)]
+        if delay < 0:
+            return {"error": "boom"}
+        await asyncio.sleep(delay)
+        return {"passages": [{"source": f"remote:{call}", "text": f"answer to {body['question']}"}]}
+
+    return stub
+
+
+def _client(stub, **kwargs):
+    return RagClient("http://rag.test/search", transport=httpx.ASGITransport(app=stub), **kwargs)
+
+
+def test_rag_returns_remote_passages():
+    async def run():
+        rag = _client(_stub([0]))
+        try:
+            return await rag.retrieve("stack?", "general")
+        finally:
+            await rag.aclose()
+
+    assert asyncio.run(run()) == [("remote:0", "answer to stack?")]
+
+
+def test_rag_deadline_and_bad_payload_fall_back_to_none():
+    async def run():
+        slow = _client(_stub([1.0]), timeout_seconds=0.05)
+        broken = _client(_stub([-1]))
+        results = (await slow.retrieve("q", "general"), await broken.retrieve("q", "general"))
+        await slow.aclose()
+        await broken.aclose()
+        return results, slow.stats(), broken.stats()
+
+    (slow_result, broken_result), slow_stats, broken_stats = asyncio.run(run())
+    assert slow_result is None and slow_stats["timeouts"] == 1
+    assert broken_result is None and broken_stats["failures"] == 1
+
+
+def test_rag_hedged_request_beats_slow_primary():
+    async def run():
+        stub = _stub([1.0, 0.0])
+        rag = _client(stub, timeout_seconds=0.5, hedge_after_seconds=0.02)
+        try:
+            return await rag.retrieve("q", "general"), rag.stats()
+        finally:
+            await rag.aclose()
+
+    passages, stats = asyncio.run(run())
+    assert passages == [("remote:1", "answer to q")]
+    assert stats["hedges"] == 1 and stats["timeouts"] == 0
+
+
+def test_rag_sheds_load_beyond_concurrency_cap():
+    async def run():
+        rag = _client(_stub([0.1]), max_concurrency=1)
+        try:
+            return await asyncio.gather(rag.retrieve("a", "general"), rag.retrieve("b", "general")), rag.stats()
+        finally:
+            await rag.aclose()
+
+    (first, second), stats = asyncio.run(run())
+    assert first is not None and second is None and stats["shed"] == 1
+
+
+def test_rag_rebinds_client_and_cap_when_the_loop_changes():
+    rag = _client(_stub([0]))
+
+    async def run():
+        return await rag.retrieve("q", "general"), rag._client, rag._semaphore
+
+    first, first_client, first_semaphore = asyncio.run(run())
+    second, second_client, second_semaphore = asyncio.run(run())
+    asyncio.run(rag.aclose())
+    assert first is not None and second is not None
+    assert first_client.is_closed and second_client is not first_client
+    assert second_semaphore is not first_semaphore
+
+
+def test_chat_uses_rag_and_falls_back_locally(monkeypatch):
+    chat_service.get_answer_cache().clear()
+    monkeypatch.setattr(chat_service, "get_rag_client", lambda: _client(_stub([0])))
+    body = client.post("/v1/chat/ask", headers=headers, json={"question": "remote only"}).json()
+    assert body["sources"] == ["remote:0"]
+
+    chat_service.get_answer_cache().clear()
+    monkeypatch.setattr(chat_service, "get_rag_client", lambda: _client(_stub([-1])))
+    body = client.post("/v1/chat/ask", headers=headers, json={"question": "carbon assessment"}).json()
+    assert body["sources"][0].startswith("carbon-watch")
+
+
+def test_chat_batch_queues_on_the_rag_cap_and_dedupes_by_cache_key(monkeypatch):
+    chat_service.get_answer_cache().clear()
+    stub = _stub([0.01])
+    rag = _client(stub, max_concurrency=4)
+    monkeypatch.setattr(chat_service, "get_rag_client", lambda: rag)
+    questions = [f"remote question {n}" for n in range(30)] + ["Remote question 0!"]
+    results = asyncio.run(chat_service.answer_questions_async(questions, "general"))
+    assert all(sources[0].startswith("remote:") for _, sources, _, _ in results)
+    assert results[0] == results[-1]
+    assert stub.state.calls == 30 and rag.stats()["shed"] == 0
+
+
+def test_chat_batch_deadline_answers_unfinished_questions_locally(monkeypatch):
+    chat_service.get_answer_cache().clear()
+    rag = _client(_stub([0.0, 1.0]), max_concurrency=1, timeout_seconds=1.5)
+    monkeypatch.setattr(chat_service, "get_rag_client", lambda: rag)
+    monkeypatch.setattr(chat_service.get_settings(), "rag_batch_timeout_seconds", 0.3)
+    questions = ["remote first", "carbon assessment", "canopy density classification"]
+
+    async def run():
+        start = asyncio.get_running_loop().time()
+        results = await chat_service.answer_questions_async(questions, "general")
+        return results, asyncio.get_running_loop().time() - start
+
+    results, elapsed = asyncio.run(run())
+    assert elapsed < 1.0
+    assert results[0][1] == ["remote:0"]
+    assert results[1][1][0].startswith("carbon-watch")
+    assert results[2][1][0].startswith("carbon-watch")
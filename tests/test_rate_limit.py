@@ -0,0 +1,166 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+from app.core.rate_limit import RedisRateLimiter, SharedMemoryRateLimiter, SlidingWindowRateLimiter
+
+
+def test_sliding_window_rejects_over_limit():
+    limiter = SlidingWindowRateLimiter(limit=3, window_seconds=60)
+    now = 1_000_020.0
+    assert [limiter.hit("1.2.3.4", now) for _ in range(3)] == [None, None, None]
+    retry_after = limiter.hit("1.2.3.4", now)
+    assert retry_after is not None and 1 <= retry_after <= 60
+    assert limiter.stats()["rejected"] == 1
+
+
+def test_previous_window_is_weighted():
+    limiter = SlidingWindowRateLimiter(limit=4, window_seconds=60)
+    start = 1_000_020.0 - (1_000_020.0 % 60)
+    for _ in range(4):
+        assert limiter.hit("ip", start + 1) is None
+    # 15s into the next window 75% of the previous count still applies
+    assert limiter.hit("ip", start + 75) is None
+    assert limiter.hit("ip", start + 75) is not None
+    # After two idle windows the client starts fresh
+    assert limiter.hit("ip", start + 185) is None
+
+
+def test_memory_ceiling_evicts_oldest():
+    limiter = SlidingWindowRateLimiter(limit=10, max_keys=3)
+    for i in range(5):
+        limiter.hit(f"10.0.0.{i}", 1_000_000.0)
+    stats = limiter.stats()
+    assert stats["size"] == 3
+    assert stats["evictions"] == 2
+
+
+def test_sweep_drops_idle_clients():
+    limiter = SlidingWindowRateLimiter(limit=10, window_seconds=60)
+    limiter.hit("old", 1_000_000.0)
+    limiter.hit("new", 1_000_200.0)
+    assert limiter.sweep(1_000_200.0) == 1
+    assert limiter.stats()["size"] == 1
+    assert limiter.stats()["expired"] == 1
+
+
+def test_shared_memory_counts_across_instances(tmp_path):
+    path = str(tmp_path / "ratelimit")
+    worker_a = SharedMemoryRateLimiter(path, limit=3, slots=64)
+    worker_b = SharedMemoryRateLimiter(path, limit=3, slots=64)
+    now = 1_000_020.0
+    assert worker_a.hit("1.2.3.4", now) is None
+    assert worker_b.hit("1.2.3.4", now) is None
+    assert worker_a.hit("1.2.3.4", now) is None
+    assert worker_b.hit("1.2.3.4", now) is not None
+    assert worker_a.hit("5.6.7.8", now) is None
+    assert worker_b.stats()["size"] == 2
+
+
+def test_shared_memory_fails_open_instead_of_waiting_on_a_held_lock(tmp_path):
+    path = str(tmp_path / "ratelimit")
+    limiter = SharedMemoryRateLimiter(path, limit=1, slots=8)
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import fcntl, os, sys, time; fd = os.open(sys.argv[1], os.O_RDWR); fcntl.lockf(fd, fcntl.LOCK_EX);"
+            " print('locked', flush=True); time.sleep(30)",
+            path,
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        start = time.perf_counter()
+        assert limiter.hit("1.2.3.4") is None
+        assert limiter.hit("1.2.3.4") is None
+        assert time.perf_counter() - start < 0.5
+        assert limiter.stats()["contended"] == 2
+    finally:
+        holder.kill()
+        holder.wait()
+    assert limiter.hit("1.2.3.4") is None
+    assert limiter.hit("1.2.3.4") is not None
+
+
+def test_shared_memory_table_is_bounded(tmp_path):
+    limiter = SharedMemoryRateLimiter(str(tmp_path / "ratelimit"), limit=5, slots=8)
+    for i in range(20):
+        limiter.hit(f"10.0.0.{i}", 1_000_000.0)
+    stats = limiter.stats()
+    assert stats["size"] == stats["max_keys"] == 8
+    assert stats["evictions"] == 12
+
+
+async def _serve_resp(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, store: dict, delay: float = 0.0) -> None:
+    # Minimal stand-in for the handful of Redis commands the limiter issues
+    while True:
+        header = await reader.readline()
+        if not header:
+            break
+        await asyncio.sleep(delay)
+        args = []
+        for _ in range(int(header[1:])):
+            length = int((await reader.readline())[1:])
+            args.append((await reader.readexactly(length + 2))[:-2].decode())
+        command = args[0].upper()
+        if command in ("INCR", "DECR"):
+            store[args[1]] = store.get(args[1], 0) + (1 if command == "INCR" else -1)
+            writer.write(b":%d\r\n" % store[args[1]])
+        elif command == "EXPIRE":
+            writer.write(b":1\r\n")
+        elif command == "GET":
+            value = store.get(args[1])
+            writer.write(b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(str(value)), str(value).encode()))
+        await writer.drain()
+    writer.close()
+
+
+def test_redis_backend_against_stand_in():
+    async def scenario():
+        store: dict = {}
+        server = await asyncio.start_server(lambda r, w: _serve_resp(r, w, store), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        limiter = RedisRateLimiter(f"redis://127.0.0.1:{port}/0", limit=2)
+        results = [await limiter.acquire("9.9.9.9") for _ in range(3)]
+        await limiter.aclose()
+        server.close()
+        await server.wait_closed()
+        return results, store
+
+    results, store = asyncio.run(scenario())
+    assert results[:2] == [None, None]
+    assert results[2] is not None
+    # The rejected request is rolled back so only admitted hits count
+    assert list(store.values()) == [2]
+
+
+def test_redis_backend_pools_connections_for_concurrent_requests():
+    async def scenario():
+        server = await asyncio.start_server(lambda r, w: _serve_resp(r, w, {}, delay=0.05), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        limiter = RedisRateLimiter(f"redis://127.0.0.1:{port}/0", limit=100, pool_size=4)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(limiter.acquire(f"10.0.0.{i}") for i in range(8)))
+        elapsed = time.perf_counter() - start
+        stats = limiter.stats()
+        await limiter.aclose()
+        server.close()
+        await server.wait_closed()
+        return results, elapsed, stats
+
+    results, elapsed, stats = asyncio.run(scenario())
+    assert results == [None] * 8
+    assert stats["errors"] == 0
+    # Two waves of ~0.15s on four connections; one shared connection would need ~1.2s
+    assert elapsed < 0.6
+    assert stats["connects"] == stats["idle_connections"] == 4
+
+
+def test_redis_backend_fails_open():
+    limiter = RedisRateLimiter("redis://127.0.0.1:1/0", limit=1)
+    assert asyncio.run(limiter.acquire("ip")) is None
+    assert limiter.stats()["errors"] == 1
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import os
+import shutil
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.main import create_app
+from app.services import chat_service, data_loader, reload_service
+from app.services.content_service import get_content_store
+from app.services.data_service import get_about
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+@pytest.fixture
+def seed_copy(tmp_path, monkeypatch):
+    seed_path = tmp_path / "seed.json"
+    shutil.copy(data_loader.DATA_PATH, seed_path)
+    content_dir = tmp_path / "work"
+    shutil.copytree(reload_service.CONTENT_DIR, content_dir)
+    monkeypatch.setattr(data_loader, "DATA_PATH", seed_path)
+    monkeypatch.setattr(reload_service, "CONTENT_DIR", content_dir)
+    monkeypatch.setattr(reload_service, "_seed_print", reload_service._fingerprint(seed_path))
+    monkeypatch.setattr(reload_service, "_content_prints", reload_service._content_fingerprints())
+    original = data_loader.get_snapshot()
+    yield seed_path, content_dir
+    data_loader.swap_snapshot(original)
+    reload_service._run_hooks(reload_service._seed_hooks, original)
+
+
+def _edit_seed(seed_path, headline):
+    data = json.loads(seed_path.read_text(encoding="utf-8"))
+    data["about"]["headline"] = headline
+    seed_path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_reload_swaps_snapshot_and_rebuilds_dependents(seed_copy):
+    seed_path, _ = seed_copy
+    before = data_loader.get_snapshot()
+    etag = client.get("/v1/about", headers=headers).headers["etag"]
+
+    assert reload_service.reload_now()["seed_reloaded"] is False
+    _edit_seed(seed_path, "Hot reloaded headline.")
+    result = reload_service.reload_now()
+
+    assert result["seed_reloaded"] is True
+    assert result["version"] == before.version + 1
+    assert get_about()["headline"] == "Hot reloaded headline."
+    assert any("Hot reloaded headline." in text for _, text in chat_service.CORPUS)
+    resp = client.get("/v1/about", headers={**headers, "if-none-match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["headline"] == "Hot reloaded headline."
+
+
+def test_invalid_seed_keeps_serving_previous_snapshot(seed_copy):
+    seed_path, _ = seed_copy
+    before = data_loader.get_snapshot()
+    seed_path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ValueError):
+        reload_service.reload_now()
+    assert data_loader.get_snapshot() is before
+
+
+def test_missing_seed_is_a_reload_failure_and_the_watcher_survives(seed_copy, monkeypatch):
+    seed_path, _ = seed_copy
+    before = data_loader.get_snapshot()
+    seed_path.unlink()
+    with pytest.raises(ValueError, match="Cannot read seed data"):
+        reload_service.reload_now()
+    assert data_loader.get_snapshot() is before
+
+    calls = []
+
+    async def flaky_reload(force=False):
+        calls.append(force)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(reload_service, "reload_async", flaky_reload)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(reload_service.run_watcher(0))
+    assert len(calls) == 2
+
+
+def test_async_reload_swaps_and_runs_hooks_on_the_loop_thread(seed_copy, monkeypatch):
+    seed_path, _ = seed_copy
+    hook_threads = []
+    monkeypatch.setitem(reload_service._seed_hooks, "thread_probe", lambda _: hook_threads.append(threading.get_ident()))
+    _edit_seed(seed_path, "Reloaded off the loop.")
+
+    async def run():
+        result = await reload_service.reload_async()
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(run())
+    assert result["seed_reloaded"] is True
+    assert hook_threads == [loop_thread]
+
+
+def test_async_content_reload_rebuilds_chat_indexes_off_the_loop(seed_copy, monkeypatch):
+    _, content_dir = seed_copy
+    store = get_content_store()
+    real_dir = store.directory
+    monkeypatch.setattr(store, "directory", content_dir)
+    build_threads = []
+    build_indexes = chat_service._build_indexes
+
+    def probe(*args):
+        build_threads.append(threading.get_ident())
+        return build_indexes(*args)
+
+    monkeypatch.setattr(chat_service, "_build_indexes", probe)
+    (content_dir / "carbon-watch.md").write_text("# Updated\n\nQuokka telemetry overhaul.\n", encoding="utf-8")
+
+    async def run():
+        result = await reload_service.reload_async()
+        await asyncio.gather(*chat_service._reindex_tasks)
+        return result, threading.get_ident()
+
+    try:
+        result, loop_thread = asyncio.run(run())
+        assert result["content_changed"] == ["carbon-watch"]
+        assert any("Quokka telemetry" in text for _, text in chat_service.CORPUS)
+        assert build_threads and loop_thread not in build_threads
+    finally:
+        monkeypatch.setattr(store, "directory", real_dir)
+        chat_service._reindex_content(["carbon-watch"])
+
+
+def test_content_change_reports_slug(seed_copy):
+    _, content_dir = seed_copy
+    (content_dir / "carbon-watch.md").write_text("# Updated\n", encoding="utf-8")
+    result = reload_service.reload_now()
+    assert result["seed_reloaded"] is False
+    assert result["content_changed"] == ["carbon-watch"]
+
+
+def test_admin_reload_endpoint(monkeypatch):
+    assert client.post("/v1/admin/reload", headers=headers).status_code == 404
+    monkeypatch.setattr(get_settings(), "admin_api_key", "admin-secret")
+    assert client.post("/v1/admin/reload", headers=headers).status_code == 403
+    assert client.post("/v1/admin/reload", headers={**headers, "x-admin-key": "wrong"}).status_code == 403
+    resp = client.post("/v1/admin/reload", headers={**headers, "x-admin-key": "admin-secret"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["version"] >= 1
+    meta = client.get("/v1/meta", headers=headers).json()
+    assert meta["data_version"] == body["version"]
@@ -0,0 +1,35 @@
+import os
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+
+app = create_app()
+client = TestClient(app)
+
+headers = {"x-api-key": os.getenv("API_KEY", "test-key")}
+
+
+def test_static_endpoints_return_strong_etags():
+    for path in ("/v1/about", "/v1/pillars", "/v1/work", "/v1/skills", "/v1/certifications", "/v1/contact"):
+        resp = client.get(path, headers=headers)
+        assert resp.status_code == 200, path
+        assert resp.headers["content-type"] == "application/json"
+        etag = resp.headers["etag"]
+        assert etag.startswith('"') and not etag.startswith("W/")
+
+
+def test_if_none_match_returns_304():
+    first = client.get("/v1/skills", headers=headers)
+    etag = first.headers["etag"]
+    resp = client.get("/v1/skills", headers={**headers, "if-none-match": f'"stale", {etag}'})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+def test_work_limit_variants_are_cached_separately():
+    full = client.get("/v1/work", headers=headers).json()
+    limited = client.get("/v1/work", params={"limit": 1}, headers=headers).json()
+    assert len(limited["items"]) == 1
+    assert len(full["items"]) > 1